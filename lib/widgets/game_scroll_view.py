@@ -30,9 +30,11 @@ import tkRAD
 
 from tkRAD.core import tools
 
+from .scrollview import VirtualScrollMixin
 
 
-class GameScrollView (tkRAD.RADXMLFrame):
+
+class GameScrollView (VirtualScrollMixin, tkRAD.RADXMLFrame):
     r"""
         Scrollable viewport widget component;
     """
@@ -48,19 +50,15 @@ class GameScrollView (tkRAD.RADXMLFrame):
 
 
 
-    def _update_scrollregion (self):
-
-        self.viewport.configure(scrollregion=self.viewport.bbox("all"))
-
-    # end def
-
-
-
     def init_widget (self, **kw):
         r"""
             widget main inits;
         """
 
+        # virtualized mode (see set_virtual_items())
+
+        self.virtual_items = None
+
         # XML source code
 
         _xml = """
@@ -73,6 +71,7 @@ class GameScrollView (tkRAD.RADXMLFrame):
                     resizable="yes"
                 />
                 <ttkscrollbar
+                    id="ScrollbarVertical"
                     connect="CanvasViewport"
                     orient="vertical"
                     layout="grid"
@@ -116,6 +115,16 @@ class GameScrollView (tkRAD.RADXMLFrame):
             window=self.viewport.container,
         )
 
+        # vertical scrollbar must render virtualized items too
+
+        _scrollbar = _frame.get_object_by_id("ScrollbarVertical")
+
+        if _scrollbar:
+
+            _scrollbar.configure(command=self._slot_yview)
+
+        # end if
+
         # connect events
 
         self.events.connect_dict(
@@ -161,6 +170,10 @@ class GameScrollView (tkRAD.RADXMLFrame):
 
         self.viewport.yview_scroll(_step, "units")
 
+        # virtualized mode
+
+        self.render_virtual_items()
+
     # end def
 
 
@@ -174,6 +187,10 @@ class GameScrollView (tkRAD.RADXMLFrame):
 
         self.viewport.yview_scroll(-_step, "units")
 
+        # virtualized mode
+
+        self.render_virtual_items()
+
     # end def
 
 
@@ -187,6 +204,10 @@ class GameScrollView (tkRAD.RADXMLFrame):
 
         self._update_scrollregion()
 
+        # virtualized mode
+
+        self.render_virtual_items()
+
     # end def
 
 
@@ -28,6 +28,7 @@ import re
 import os
 import os.path as OP
 import urllib.request as WEB
+from collections import OrderedDict
 
 import tkinter as TK
 import tkinter.messagebox as MB
@@ -216,6 +217,10 @@ class GameSectionView (GameScrollView):
 
     } # end of DTD
 
+    # max number of built sections kept aboard (LRU cache)
+
+    SECTION_CACHE_SIZE = 8
+
     # Images dir and fallback
 
     IMAGES_DIR = "^/images/section"
@@ -290,12 +295,13 @@ class GameSectionView (GameScrollView):
 
         if self.cast_parent(tk_parent):
 
-            # loop on XML element children
+            # new XML tree: cached sections are obsolete
 
-            return self._loop_on_children(
+            self.clear_section_cache()
 
-                xml_element, tk_parent, accept = self.DTD.get(xml_tag),
-            )
+            # show root section
+
+            return self._show_section(xml_element)
 
         # end if
 
@@ -438,6 +444,18 @@ class GameSectionView (GameScrollView):
 
 
 
+    def _destroy_section (self, frame):
+        r"""
+            destroys a cached section @frame for real and
+            unregisters all its objects;
+        """
+
+        self.destroy_subtree(frame)
+
+    # end def
+
+
+
     def _info (self, text=None):
         r"""
             raises info events for an eventually existing
@@ -535,28 +553,11 @@ class GameSectionView (GameScrollView):
 
             self._cvar.set("")
 
-            # clear children
-
-            for _w in self.viewport.container.winfo_children():
-
-                _w.pack_forget()
-
-                _w.grid_forget()
-
-                _w.place_forget()
-
-            # end for
-
             try:
 
-                self._loop_on_children(
-
-                    xml_element = _xml_element,
-
-                    tk_parent = self.viewport.container,
+                # swap section frames (built on demand)
 
-                    accept = self.DTD.get(_xml_element.tag),
-                )
+                self._show_section(_xml_element)
 
                 self.viewport.container.update_idletasks()
 
@@ -579,14 +580,9 @@ class GameSectionView (GameScrollView):
 
             # init parent section
 
-            _parent = self.get_xml_tree().find(
-
-                ".//*[@id='{value}']/.."
-
-                .format(value = _xml_element.get("id"))
-            )
+            _parent = self.get_element_parent(_xml_element)
 
-            if _parent:
+            if self.is_element(_parent):
 
                 self._parent_section_id = _parent.get("id")
 
@@ -742,6 +738,111 @@ class GameSectionView (GameScrollView):
 
 
 
+    def _show_section (self, xml_element):
+        r"""
+            shows section along @xml_element;
+
+            each section is built once into its own frame and kept
+            in a bounded LRU cache, so that revisiting a section only
+            swaps frames; least recently used sections are destroyed;
+
+            sections that failed to build are never cached: they get
+            destroyed as soon as they are hidden;
+
+            returns True on build success, False otherwise;
+        """
+
+        # inits
+
+        _frame = self._sections.get(xml_element)
+
+        _build_ok = True
+
+        # hide current section
+
+        if self._section is not None and self._section is not _frame:
+
+            self._section.pack_forget()
+
+            # failed section (not cached)?
+
+            if self._section not in self._sections.values():
+
+                self._destroy_section(self._section)
+
+            # end if
+
+        # end if
+
+        # cache hit?
+
+        if _frame is not None:
+
+            self._section_stats["hits"] += 1
+
+            self._sections.move_to_end(xml_element)
+
+        else:
+
+            self._section_stats["misses"] += 1
+
+            # new section frame
+
+            _frame = TK.Frame(self.viewport.container)
+
+            self._section = None
+
+            try:
+
+                _build_ok = self._loop_on_children(
+
+                    xml_element, _frame,
+
+                    accept = self.DTD.get(xml_element.tag),
+                )
+
+            except:
+
+                self._destroy_section(_frame)
+
+                raise
+
+            # end try
+
+            # cache only fully built sections
+
+            if _build_ok:
+
+                self._sections[xml_element] = _frame
+
+            # end if
+
+        # end if
+
+        # show section
+
+        _frame.pack(expand=1, fill=TK.BOTH)
+
+        self._section = _frame
+
+        # evict least recently used sections
+
+        while len(self._sections) > max(1, self.SECTION_CACHE_SIZE):
+
+            _old = self._sections.popitem(last=False)[1]
+
+            self._destroy_section(_old)
+
+            self._section_stats["evictions"] += 1
+
+        # end while
+
+        return _build_ok
+
+    # end def
+
+
+
     def _slot_mouse_wheel (self, tk_event=None, *args, **kw):
         r"""
             generic handler for <MouseWheel> TkEvent;
@@ -909,6 +1010,72 @@ class GameSectionView (GameScrollView):
 
 
 
+    def clear_section_cache (self):
+        r"""
+            destroys all cached sections;
+        """
+
+        while self._sections:
+
+            self._destroy_section(self._sections.popitem()[1])
+
+        # end while
+
+        # failed section (not cached)?
+
+        if self._section is not None and self._section.winfo_exists():
+
+            self._destroy_section(self._section)
+
+        # end if
+
+        self._section = None
+
+    # end def
+
+
+
+    def get_section_cache_stats (self):
+        r"""
+            returns section cache statistics in a dict() object:
+
+            hits, misses, evictions, hit_rate (0.0 to 1.0),
+            sections (cached sections), widgets (living widgets in
+            cached sections) and objects (registered objects);
+        """
+
+        # inits
+
+        _stats = self._section_stats.copy()
+
+        _total = _stats["hits"] + _stats["misses"]
+
+        _stats["hit_rate"] = _stats["hits"] / _total if _total else 0.0
+
+        _stats["sections"] = len(self._sections)
+
+        _stats["widgets"] = 0
+
+        _stack = list(self._sections.values())
+
+        while _stack:
+
+            _children = _stack.pop().winfo_children()
+
+            _stats["widgets"] += len(_children)
+
+            _stack.extend(_children)
+
+        # end while
+
+        _stats["objects"] = len(self.get_objects())
+
+        return _stats
+
+    # end def
+
+
+
     def go_home (self, *args, **kw):
         r"""
             shows root section;
@@ -965,6 +1132,14 @@ class GameSectionView (GameScrollView):
 
         self._cvar = TK.StringVar()
 
+        # sections LRU cache: XML element --> section frame
+
+        self._sections = OrderedDict()
+
+        self._section = None
+
+        self._section_stats = dict(hits=0, misses=0, evictions=0)
+
     # end def
 
 
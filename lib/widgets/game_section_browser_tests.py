@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkGAME - all-in-one Game library for Tkinter
+
+    Copyright (c) 2014+ Raphaël Seban <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.
+
+    If not, see http://www.gnu.org/licenses/
+"""
+
+# game_section_browser.py module testings
+# usage (from tkGAME root dir, needs a display):
+# python3 -m lib.widgets.game_section_browser_tests
+import tkinter as TK
+from .game_section_browser import GameSectionView
+
+
+# -------------------------- MODULE FUNCTION DEFS ----------------------
+
+
+# generated sections XML source
+def get_xml_source (sections=20, items=9):
+    _item = '<item text="Game {n}" image="games.gif" package="misc"/>'
+    _section = (
+        '<section id="section{s}" text="Section {s}" image="games.gif">'
+        '<group>{items}</group>'
+        '</section>'
+    )
+    return "<tksection>{}</tksection>".format(
+        "".join(
+            _section.format(
+                s=_s,
+                items="".join(_item.format(n=_n) for _n in range(items)),
+            )
+            for _s in range(sections)
+        )
+    )
+# end def
+
+
+# living objects counters
+def get_counts (root, view):
+    # count tkinter widgets
+    def _widgets (widget):
+        return 1 + sum(_widgets(_w) for _w in widget.winfo_children())
+    # end def
+    return dict(
+        objects=len(view.get_objects()),
+        cvars=sum(len(_vars) for _vars in view.get_cvars().values()),
+        widgets=_widgets(root),
+        images=len(root.image_names()),
+        tcl_vars=len(root.tk.splitlist(root.tk.call("info", "globals"))),
+    )
+# end def
+
+
+# navigating many times through sections must keep flat memory
+def test_navigation_leaks (sections=20, qty=1000, cache_size=4):
+    print("\n" + "-" * 60)
+    print(
+        "\nNavigating {} times through {} sections "
+        "(section cache size: {})".format(qty, sections, cache_size)
+    )
+    # inits
+    root = TK.Tk()
+    view = GameSectionView(root)
+    view.SECTION_CACHE_SIZE = cache_size
+    view.pack()
+    view.xml_build(get_xml_source(sections))
+    _elements = [
+        view.get_element_by_id("section{}".format(_s))
+        for _s in range(sections)
+    ]
+    # navigate through all sections once (warm cache)
+    for _element in _elements:
+        view._open_section(xml_element=_element)
+    # end for
+    _before = get_counts(root, view)
+    print("\nafter one round:", _before)
+    # navigate many times
+    for _i in range(qty):
+        view._open_section(xml_element=_elements[_i % sections])
+    # end for
+    _after = get_counts(root, view)
+    print("after {} times:".format(qty), _after)
+    print("section cache stats:", view.get_section_cache_stats())
+    root.destroy()
+    # compare counters
+    for _key, _count in _before.items():
+        if _after[_key] > _count:
+            print(
+                "\n[ERROR] {} count has grown from {} to {}!"
+                .format(_key, _count, _after[_key])
+            )
+            exit(1)
+        # end if
+    # end for
+    # succeeded
+    print("\nAll has been verified OK.")
+# end def
+
+
+
+# ----------------------------- NOW TESTING -------------------------
+
+
+# session start
+print("\n--- BEGIN TEST SESSION ---")
+
+test_navigation_leaks(sections=20, qty=1000)
+
+# session end
+print("\n--- END OF TEST SESSION ---")
@@ -26,13 +26,375 @@
 
 import os
 
+import sys
+
+import time
+
 import tkinter as TK
 
 from tkinter import ttk
 
 
 
-class ScrollView (ttk.Frame):
+class VirtualItems:
+    r"""
+        virtualized items rendering into a canvas viewport;
+
+        creates item widgets only for rows in or near the visible
+        part of the viewport and recycles them while scrolling;
+
+        @create_item(parent) must return a new item widget;
+
+        @update_item(widget, index), if any, must fill up a new or
+        recycled item widget with data of item number @index;
+
+        does not hook any viewport notification: scrolling slots
+        must call render() on their own (see VirtualScrollMixin);
+    """
+
+    def __init__ (self, viewport, count, create_item, update_item,
+    item_height, item_width=None, overscan=1):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.viewport = viewport
+
+        self.count = max(0, int(count))
+
+        self.create_item = create_item
+
+        self.update_item = update_item
+
+        self.item_height = max(1, int(item_height))
+
+        self.item_width = item_width
+
+        self.overscan = max(0, int(overscan))
+
+        self.created = 0
+
+        self._columns = None
+
+        self._visible = dict()
+
+        self._free = list()
+
+    # end def
+
+
+
+    def _get_columns (self):
+        r"""
+            protected method def;
+
+            returns number of items per row;
+        """
+
+        if self.item_width:
+
+            return max(1, self.viewport.winfo_width() // self.item_width)
+
+        # end if
+
+        return 1
+
+    # end def
+
+
+
+    def destroy (self):
+        r"""
+            destroys all item widgets;
+        """
+
+        for _widget, _window in \
+                        list(self._visible.values()) + self._free:
+
+            self.viewport.delete(_window)
+
+            _widget.destroy()
+
+        # end for
+
+        self._visible.clear()
+
+        self._free.clear()
+
+    # end def
+
+
+
+    def get_stats (self):
+        r"""
+            returns rendering statistics in a dict() object;
+        """
+
+        return dict(
+
+            count=self.count,
+
+            created=self.created,
+
+            visible=len(self._visible),
+
+            free=len(self._free),
+        )
+
+    # end def
+
+
+
+    def render (self, *args, **kw):
+        r"""
+            shows item widgets in or near viewport's visible area,
+            recycling those which went out of it;
+        """
+
+        # inits
+
+        _columns = self._get_columns()
+
+        # items layout has changed: all positions are obsolete
+
+        if _columns != self._columns:
+
+            self._columns = _columns
+
+            for _index in list(self._visible):
+
+                _item = self._visible.pop(_index)
+
+                self.viewport.itemconfigure(_item[1], state=TK.HIDDEN)
+
+                self._free.append(_item)
+
+            # end for
+
+        # end if
+
+        _top = self.viewport.canvasy(0)
+
+        _first = max(0, int(_top // self.item_height) - self.overscan)
+
+        _last = int(
+
+            (_top + self.viewport.winfo_height()) // self.item_height
+
+        ) + self.overscan
+
+        _wanted = range(
+
+            _first * _columns, min(self.count, (_last + 1) * _columns)
+        )
+
+        # recycle items out of view
+
+        for _index in [_i for _i in self._visible if _i not in _wanted]:
+
+            _item = self._visible.pop(_index)
+
+            self.viewport.itemconfigure(_item[1], state=TK.HIDDEN)
+
+            self._free.append(_item)
+
+        # end for
+
+        # show items in view
+
+        for _index in _wanted:
+
+            if _index not in self._visible:
+
+                if self._free:
+
+                    _item = self._free.pop()
+
+                else:
+
+                    _widget = self.create_item(self.viewport)
+
+                    _item = (
+
+                        _widget,
+
+                        self.viewport.create_window(
+
+                            0, 0, anchor=TK.NW, window=_widget,
+                        ),
+                    )
+
+                    self.created += 1
+
+                # end if
+
+                if self.update_item:
+
+                    self.update_item(_item[0], _index)
+
+                # end if
+
+                self.viewport.coords(
+
+                    _item[1],
+
+                    (_index % _columns) * (self.item_width or 0),
+
+                    (_index // _columns) * self.item_height,
+                )
+
+                self.viewport.itemconfigure(_item[1], state=TK.NORMAL)
+
+                self._visible[_index] = _item
+
+            # end if
+
+        # end for
+
+    # end def
+
+
+
+    def update_scrollregion (self):
+        r"""
+            sets canvas' scrollregion along virtual contents size;
+        """
+
+        _columns = self._get_columns()
+
+        self.viewport.configure(
+
+            scrollregion=(
+
+                0, 0,
+
+                _columns * (self.item_width or 0)
+
+                or self.viewport.winfo_width(),
+
+                -(-self.count // _columns) * self.item_height,
+            )
+        )
+
+    # end def
+
+# end class VirtualItems
+
+
+
+class VirtualScrollMixin:
+    r"""
+        virtualized items support for scrollable viewports;
+
+        expects a self.viewport canvas object and a
+        self.virtual_items member (None by default);
+
+        scrolling slots (mouse wheel, viewport changes, scrollbar
+        command) must call render_virtual_items() once scrolled;
+    """
+
+    def _slot_yview (self, *args):
+        r"""
+            vertical scrollbar command;
+        """
+
+        self.viewport.yview(*args)
+
+        self.render_virtual_items()
+
+    # end def
+
+
+
+    def _update_scrollregion (self):
+        r"""
+            updates canvas' scrollregion along contents;
+        """
+
+        # virtualized mode
+
+        if self.virtual_items:
+
+            self.virtual_items.update_scrollregion()
+
+        else:
+
+            self.viewport.configure(
+
+                scrollregion=self.viewport.bbox(TK.ALL)
+            )
+
+        # end if
+
+    # end def
+
+
+
+    def render_virtual_items (self):
+        r"""
+            renders virtual items in viewport's visible area,
+            if any;
+        """
+
+        if self.virtual_items:
+
+            self.virtual_items.render()
+
+        # end if
+
+    # end def
+
+
+
+    def set_virtual_items (self, count=0, create_item=None,
+    update_item=None, **kw):
+        r"""
+            switches viewport to virtualized mode: only items in or
+            near visible area get a widget (see VirtualItems);
+
+            @count=0 or no @create_item switches virtualized mode off;
+
+            returns VirtualItems object or None;
+        """
+
+        # reset previous virtual items
+
+        if self.virtual_items:
+
+            self.virtual_items.destroy()
+
+            self.virtual_items = None
+
+        # end if
+
+        # new virtual items
+
+        if count and create_item:
+
+            self.virtual_items = VirtualItems(
+
+                self.viewport, count, create_item, update_item, **kw
+            )
+
+            self.viewport.yview_moveto(0)
+
+        # end if
+
+        self._update_scrollregion()
+
+        self.render_virtual_items()
+
+        return self.virtual_items
+
+    # end def
+
+# end class VirtualScrollMixin
+
+
+
+class ScrollView (VirtualScrollMixin, ttk.Frame):
     r"""
         Generic Scrollable Viewport;
     """
@@ -138,6 +500,10 @@ class ScrollView (ttk.Frame):
 
         self.viewport.yview_scroll(_step, "units")
 
+        # virtualized mode
+
+        self.render_virtual_items()
+
     # end def
 
 
@@ -149,16 +515,9 @@ class ScrollView (ttk.Frame):
 
         self._update_scrollregion()
 
-    # end def
-
+        # virtualized mode
 
-
-    def _update_scrollregion (self):
-        r"""
-            updates canvas' scrollregion along contents;
-        """
-
-        self.viewport.configure(scrollregion=self.viewport.bbox(TK.ALL))
+        self.render_virtual_items()
 
     # end def
 
@@ -169,6 +528,10 @@ class ScrollView (ttk.Frame):
             widget main inits;
         """
 
+        # virtualized mode (see set_virtual_items())
+
+        self.virtual_items = None
+
         # canvas inits
 
         self.viewport = TK.Canvas(self)
@@ -199,7 +562,7 @@ class ScrollView (ttk.Frame):
 
         self.scrollbar_x.configure(command=self.viewport.xview)
 
-        self.scrollbar_y.configure(command=self.viewport.yview)
+        self.scrollbar_y.configure(command=self._slot_yview)
 
         # window sizegrip inits
 
@@ -270,10 +633,130 @@ def demo ():
 
 
 
+# benchmark
+
+def benchmark (count=5000):
+
+    r"""
+        opens a synthetic @count items section, once by building all
+        item widgets up front and once in virtualized mode;
+    """
+
+    root = TK.Tk()
+
+    root.geometry("800x600")
+
+    image = TK.PhotoImage(width=64, height=64)
+
+    for virtual in (False, True):
+
+        scrollview = ScrollView(root)
+
+        scrollview.pack(expand=1, fill=TK.BOTH)
+
+        root.update()
+
+        start = time.perf_counter()
+
+        if virtual:
+
+            scrollview.set_virtual_items(
+
+                count,
+
+                create_item=lambda parent: TK.Label(
+
+                    parent, image=image, compound=TK.TOP,
+                ),
+
+                update_item=lambda widget, index: widget.configure(
+
+                    text="Item #{}".format(index),
+                ),
+
+                item_height=100,
+
+                item_width=120,
+            )
+
+        else:
+
+            for index in range(count):
+
+                TK.Label(
+
+                    scrollview.container,
+
+                    image=image,
+
+                    compound=TK.TOP,
+
+                    text="Item #{}".format(index),
+
+                ).grid(row=index // 6, column=index % 6)
+
+            # end for
+
+        # end if
+
+        root.update()
+
+        opened = time.perf_counter() - start
+
+        start = time.perf_counter()
+
+        for step in range(50):
+
+            # same path as vertical scrollbar's command
+
+            scrollview._slot_yview(TK.SCROLL, 5, TK.UNITS)
+
+            root.update()
+
+        # end for
+
+        scrolled = time.perf_counter() - start
+
+        print(
+
+            "{mode:>8}: open {opened:.3f}s, 50 scrolls {scrolled:.3f}s, "
+
+            "widgets {widgets}".format(
+
+                mode="virtual" if virtual else "eager",
+
+                opened=opened,
+
+                scrolled=scrolled,
+
+                widgets=len(scrollview.container.winfo_children())
+
+                + len(scrollview.viewport.winfo_children()) - 1,
+            )
+        )
+
+        scrollview.destroy()
+
+    # end for
+
+    root.destroy()
+
+# end def
+
+
+
 # example
 
 if __name__ == "__main__":
 
-    demo()
+    if "--benchmark" in sys.argv:
+
+        benchmark()
+
+    else:
+
+        demo()
+
+    # end if
 
 # end if
@@ -320,6 +320,9 @@ class TkGameCanvasSprite:
         """
             hook method to be reimplemented in subclass;
             notifies application of some general and specific actions;
+            finer grained notifications are also available through
+            signal patterns e.g. 'Game:*:Moved' for any sprite of
+            group, 'Game:Player:**' for any action of a sprite, etc;
         """
         # general notification
         self.events.raise_event(
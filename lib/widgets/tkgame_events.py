@@ -22,6 +22,27 @@
     If not, see http://www.gnu.org/licenses/
 """
 
+# lib imports
+import sys
+import weakref
+from itertools import count
+import tkinter as TK
+
+
+class _TkGameEventConsumed:
+    """
+        type of CONSUMED unique slot return value;
+    """
+    def __repr__ (self):
+        return "CONSUMED"
+    # end def
+# end class _TkGameEventConsumed
+
+
+# slot return value stopping signal dispatch
+CONSUMED = _TkGameEventConsumed()
+
+
 # module private member
 __event_manager = None
 
@@ -42,30 +63,356 @@ def get_event_manager ():
 class TkGameEventManager:
     """
         simplified signal/slot universal event manager;
+        slots connected to each signal are kept in self.connections
+        and cached as an immutable tuple, rebuilt once on next raise
+        after connect/disconnect, so that raise_event() is a plain
+        loop; signals matching no slot are not cached; slots get
+        called by decreasing priority (see connect()), then in
+        connection order; a slot returning CONSUMED (also
+        self.events.CONSUMED) stops dispatch, e.g. an input handled
+        by a top layer sprite;
+        bound method slots may be held by weak reference (opt-in,
+        see connect() and WEAK_SLOTS): destroyed sprites, dialogs,
+        views, etc then get garbage collected without calling
+        disconnect() and their slots vanish on the fly; other
+        callables are always held by strong reference;
+        /!\ connect(signal, Foo().method, weak=True) would vanish at
+        once: keep strong references for such slots;
+        high-frequency signals (e.g. Canvas:Sprite:Moved, scrolls,
+        resizes) may be posted with post_event() rather than
+        raised: they get queued, merged per signal and raised only
+        once per Tk idle cycle (see flush_events());
+        signal names are hierarchical, levels being separated by ':'
+        e.g. 'Game:Player:Moved'; signal patterns may be connected:
+        '*' stands for exactly one level e.g. 'Game:*:Moved' and '**'
+        for any number of levels e.g. 'Game:**'; all signal names
+        and patterns are kept in a trie of levels, so that patterns
+        get matched level by level on first raise of a signal only
+        and disconnect_group() only walks through the group;
     """
 
+    # slot return value stopping signal dispatch
+    CONSUMED = CONSUMED
+
+    # signal names hierarchy
+    SEPARATOR = ":"
+    WILDCARD = "*"
+    WILDCARD_ANY = "**"
+
+    # bound method slots default reference mode
+    # set to True (e.g. in subclass) to hold them weakly by default
+    WEAK_SLOTS = False
+
+    # max number of cached tuples of slots
+    # raised signal names may be unique e.g. sprite names
+    MAX_CACHED = 4096
+
     def __init__ (self):
         """
             class constructor
         """
-        # member inits
+        # member inits - connected slots
+        # {signal: {slot_key: (priority, seq, slot)}}
         self.connections = dict()
+        # cached tuples of slots - {signal: tuple of slots}
+        self.__slots = dict()
+        self.__seq = count()
+        # signals trie - node: [{level: child node}, set of signals]
+        self.__trie = [dict(), set()]
+        self.__patterns = 0
+        # posted events - {signal or unique key: (signal, args, kw)}
+        self.__posted = dict()
+        # Tk root window flush_events() is scheduled on, if any
+        self.__flush_root = None
+    # end def
+
+
+    def _add_signal (self, signal):
+        """
+            registers @signal name or pattern, if not already done;
+            returns signal's {slot_key: entry} table;
+        """
+        _table = self.connections.get(signal)
+        if _table is None:
+            _table = self.connections[signal] = dict()
+            # add to trie
+            _node = self.__trie
+            for _level in str(signal).split(self.SEPARATOR):
+                _node = _node[0].setdefault(_level, [dict(), set()])
+            # end for
+            _node[1].add(signal)
+            if self._is_pattern(signal):
+                self.__patterns += 1
+            # end if
+        # end if
+        return _table
+    # end def
+
+
+    def _drop_slot (self, signal, key, ref):
+        """
+            removes weak slot of @key for @signal once its owner
+            (referenced by @ref) has been garbage collected;
+        """
+        _table = self.connections.get(signal)
+        # still connected? (may have been reconnected since)
+        _entry = _table and _table.get(key)
+        if _entry and getattr(_entry[2], "ref", None) is ref:
+            del _table[key]
+            # e.g. signal named after a destroyed sprite
+            if not _table:
+                self._remove_signal(signal)
+            else:
+                self._reset_slots(signal)
+            # end if
+        # end if
+    # end def
+
+
+    def _get_slot (self, signal, key, slot, weak):
+        """
+            returns @slot itself or a TkGameWeakSlot() of @slot if
+            @weak is True and @slot is a bound method of an object
+            supporting weak references;
+        """
+        if weak and hasattr(slot, "__func__") and hasattr(slot, "__self__"):
+            try:
+                return TkGameWeakSlot(
+                    slot, lambda ref: self._drop_slot(signal, key, ref)
+                )
+            except TypeError:
+                pass
+            # end try
+        # end if
+        return slot
+    # end def
+
+
+    def _get_slot_key (self, slot):
+        """
+            returns a hashable key identifying @slot, so that a bound
+            method and its weak counterpart share the same key;
+        """
+        # bound method (without keeping its owner alive)
+        if hasattr(slot, "__func__") and hasattr(slot, "__self__"):
+            return (id(slot.__self__), slot.__func__)
+        # end if
+        # other callables
+        try:
+            hash(slot)
+            return slot
+        except TypeError:
+            return id(slot)
+        # end try
+    # end def
+
+
+    def _get_group (self, groupname):
+        """
+            returns list of registered signals which name starts with
+            @groupname, walking through trie levels of group only;
+        """
+        _levels = str(groupname).split(self.SEPARATOR)
+        _node = self.__trie
+        # walk down to group's parent level
+        for _level in _levels[:-1]:
+            _node = _node[0].get(_level)
+            if _node is None:
+                return list()
+            # end if
+        # end for
+        # last level may be partial e.g. 'Game' in 'Gameset'
+        _stack = [
+            _child for (_level, _child) in _node[0].items()
+            if _level.startswith(_levels[-1])
+        ]
+        _signals = list()
+        while _stack:
+            _node = _stack.pop()
+            _signals.extend(_node[1])
+            _stack.extend(_node[0].values())
+        # end while
+        return _signals
     # end def
 
 
-    def connect (self, signal, *slots):
+    def _get_matches (self, signal):
         """
-            connects signal name to multiple callback slots;
+            returns set of registered signal names and patterns
+            matching @signal name, walking through trie levels;
+        """
+        _levels = str(signal).split(self.SEPARATOR)
+        _last = len(_levels)
+        _matches = set()
+        _stack = [(self.__trie, 0)]
+        while _stack:
+            (_node, _i) = _stack.pop()
+            _children = _node[0]
+            # '**' matches any number of levels (even none)
+            _any = _children.get(self.WILDCARD_ANY)
+            if _any is not None:
+                _stack.extend((_any, _j) for _j in range(_i, _last + 1))
+            # end if
+            if _i == _last:
+                _matches.update(_node[1])
+            else:
+                for _level in (_levels[_i], self.WILDCARD):
+                    _child = _children.get(_level)
+                    if _child is not None:
+                        _stack.append((_child, _i + 1))
+                    # end if
+                # end for
+            # end if
+        # end while
+        return _matches
+    # end def
+
+
+    def _is_pattern (self, signal):
+        """
+            returns True if @signal is a signal pattern e.g.
+            'Game:*:Moved', False otherwise;
+        """
+        return isinstance(signal, str) and any(
+            _level in (self.WILDCARD, self.WILDCARD_ANY)
+            for _level in signal.split(self.SEPARATOR)
+        )
+    # end def
+
+
+    def _remove_signal (self, signal):
+        """
+            unregisters @signal name or pattern with all its slots;
+        """
+        if self.connections.pop(signal, None) is None:
+            return
+        # end if
+        # remove from trie, pruning dead branches
+        _path = [(None, self.__trie)]
+        for _level in str(signal).split(self.SEPARATOR):
+            _path.append((_level, _path[-1][1][0][_level]))
+        # end for
+        _path[-1][1][1].discard(signal)
+        while len(_path) > 1 and not any(_path[-1][1]):
+            _level = _path.pop()[0]
+            del _path[-1][1][0][_level]
+        # end while
+        if self._is_pattern(signal):
+            self.__patterns -= 1
+        # end if
+        self._reset_slots(signal)
+    # end def
+
+
+    def _reset_slots (self, signal):
+        """
+            drops cached tuple(s) of slots @signal is part of, so that
+            they get rebuilt on next raise;
+        """
+        if self._is_pattern(signal):
+            self.__slots.clear()
+        else:
+            self.__slots.pop(signal, None)
+        # end if
+    # end def
+
+
+    def _schedule_flush (self):
+        """
+            schedules flush_events() call for next idle cycle of
+            current Tk root window; flushes events at once if no Tk
+            root window is available or if scheduling fails;
+        """
+        _root = self.__flush_root = getattr(TK, "_default_root", None)
+        if _root is None:
+            self.flush_events()
+        else:
+            try:
+                _root.after_idle(self.flush_events)
+            except TK.TclError:
+                # root window is being destroyed
+                self.flush_events()
+            # end try
+        # end if
+    # end def
+
+
+    def _update_slots (self, signal):
+        """
+            rebuilds and returns immutable tuple of slots for @signal
+            name, including slots of matching signal patterns, sorted
+            by decreasing priority, then by connection order;
+        """
+        # matching signal names and patterns
+        if self.__patterns:
+            _names = self._get_matches(signal)
+        else:
+            _names = (signal,)
+        # end if
+        _entries = list()
+        for _name in _names:
+            _entries.extend(self.connections.get(_name, dict()).items())
+        # end for
+        _entries.sort(key=lambda _item: (-_item[1][0], _item[1][1]))
+        # a slot gets called only once (with its highest priority)
+        _keys = set()
+        _slots = list()
+        for (_key, _entry) in _entries:
+            if _key not in _keys:
+                _keys.add(_key)
+                _slots.append(_entry[2])
+            # end if
+        # end for
+        _slots = tuple(_slots)
+        # keep cache bounded, without empty tuples
+        if _slots:
+            if len(self.__slots) >= self.MAX_CACHED:
+                self.__slots.clear()
+            # end if
+            self.__slots[signal] = _slots
+        # end if
+        return _slots
+    # end def
+
+
+    def connect (self, signal, *slots, weak=None, priority=0):
+        """
+            connects signal name or pattern (see class doc) to multiple
+            callback slots;
+            bound method slots are held by weak reference if @weak
+            is True (default: self.WEAK_SLOTS);
+            slots of higher @priority get called first; connecting an
+            already connected slot only updates its priority;
             returns True on success, False otherwise;
         """
-        # get signal current set of slots
-        _slots = self.connections.setdefault(signal, set())
-        # signal do have a set of slots
-        if isinstance(_slots, set):
-            # slots must be unique for each signal
-            _slots.update(set(slots))
-            # update signal set of slots
-            self.connections[signal] = set(filter(callable, _slots))
+        # get signal current slots
+        _table = self._add_signal(signal)
+        # signal do have slots
+        if isinstance(_table, dict):
+            # param inits
+            if weak is None:
+                weak = self.WEAK_SLOTS
+            # end if
+            # slots must be unique and callable for each signal
+            for _slot in slots:
+                if callable(_slot):
+                    _key = self._get_slot_key(_slot)
+                    _entry = _table.get(_key)
+                    # new slot
+                    if _entry is None:
+                        _table[_key] = (
+                            priority,
+                            next(self.__seq),
+                            self._get_slot(signal, _key, _slot, weak),
+                        )
+                    # new priority (keeps slot reference mode)
+                    elif _entry[0] != priority:
+                        _table[_key] = (priority,) + _entry[1:]
+                    # end if
+                # end if
+            # end for
+            # rebuild signal tuple of slots on next raise
+            self._reset_slots(signal)
             # operation succeeded
             return True
         # end if
@@ -74,10 +421,11 @@ class TkGameEventManager:
     # end def
 
 
-    def connect_dict (self, events_dict):
+    def connect_dict (self, events_dict, weak=None, priority=0):
         """
             connects (signal, slots) pairs in dict() object;
             slots can be a single callback or one of tuple, list, set;
+            @weak and @priority params: see connect();
             returns True on success, False otherwise;
         """
         # param controls
@@ -85,9 +433,13 @@ class TkGameEventManager:
             # loop on items
             for (_signal, _slots) in events_dict.items():
                 if isinstance(_slots, (tuple, list, set)):
-                    self.connect(_signal, *_slots)
+                    self.connect(
+                        _signal, *_slots, weak=weak, priority=priority
+                    )
                 else:
-                    self.connect(_signal, _slots)
+                    self.connect(
+                        _signal, _slots, weak=weak, priority=priority
+                    )
                 # end if
             # end for
             # operation succeeded
@@ -106,14 +458,16 @@ class TkGameEventManager:
             disconnects list of callback slots from signal name;
             returns True if signal exists, False otherwise;
         """
-        # get signal current set of slots
-        _slots = self.connections.get(signal)
-        # signal does exist and has a set of slots
-        if _slots and isinstance(_slots, set):
+        # get signal current slots
+        _table = self.connections.get(signal)
+        # signal does exist and has slots
+        if _table:
             # remove eventual existing slots
-            _slots.difference_update(set(slots))
-            # update signal set of slots
-            self.connections[signal] = set(filter(callable, _slots))
+            for _slot in slots:
+                _table.pop(self._get_slot_key(_slot), None)
+            # end for
+            # rebuild signal tuple of slots on next raise
+            self._reset_slots(signal)
             # operation succeeded
             return True
         # end if
@@ -130,13 +484,16 @@ class TkGameEventManager:
         """
         # asked for all clear?
         if not signals:
+            self.__slots.clear()
             self.connections.clear()
+            self.__trie = [dict(), set()]
+            self.__patterns = 0
         # listed clean-up
         else:
             # browse signals list
             for _signal in set(signals):
                 # signal is no longer useful
-                self.connections.pop(_signal, None)
+                self._remove_signal(_signal)
             # end for
         # end if
     # end def
@@ -173,37 +530,95 @@ class TkGameEventManager:
         """
             disconnects only signals which name starts with @groupname;
             for each signal, all slots are removed at once;
+            only signals of group get browsed (see _get_group());
         """
-        # browse signals list
-        for _signal in set(self.connections):
-            # signal in group?
-            if str(_signal).startswith(groupname):
-                # disconnect signal
-                self.connections.pop(_signal, None)
-            # end if
+        # browse group signals
+        for _signal in self._get_group(groupname):
+            # disconnect signal
+            self._remove_signal(_signal)
+        # end for
+    # end def
+
+
+    def flush_events (self):
+        """
+            raises all events queued by post_event() in posting order,
+            then empties queue; events posted meanwhile get flushed on
+            next idle cycle;
+            returns number of raised events;
+        """
+        self.__flush_root = None
+        _queue, self.__posted = self.__posted, dict()
+        for (_signal, _args, _kw) in _queue.values():
+            self.raise_event(_signal, *_args, **_kw)
         # end for
+        return len(_queue)
+    # end def
+
+
+    def post_event (self, signal, *args, coalesce=True, merge=None, **kw):
+        """
+            queues an event for the given signal name with eventual
+            arguments and keywords; queued events get raised once per
+            Tk idle cycle (see flush_events());
+            if @coalesce is True, an event already queued for the same
+            signal gets replaced by this one (last one wins) or merged
+            with it if @merge callable is set: merge(old, new) gets
+            (args, kw) pairs and must return merged (args, kw) pair;
+            if @coalesce is False, each posted event gets raised;
+        """
+        # inits
+        _queue = self.__posted
+        # one queued event per signal
+        if coalesce:
+            _key = signal
+            _old = _queue.get(_key)
+            if _old is not None and callable(merge):
+                (args, kw) = merge(_old[1:], (args, kw))
+            # end if
+        # keep all events
+        else:
+            _key = object()
+        # end if
+        # queue event (a replaced one keeps its place in queue)
+        _queue[_key] = (signal, tuple(args), dict(kw))
+        # flush on next idle cycle - a flush scheduled on a destroyed
+        # or replaced root window would never come
+        if self.__flush_root is None \
+                or self.__flush_root is not TK._default_root:
+            self._schedule_flush()
+        # end if
     # end def
 
 
     def raise_event (self, signal, *args, **kw):
         """
             calls all attached slots to the given signal name  with
-            eventual arguments and keywords;
+            eventual arguments and keywords, including slots of
+            matching signal patterns; slots get called by
+            decreasing priority and dispatch stops as soon as a slot
+            returns CONSUMED;
             returns True if signal exists, False otherwise;
         """
-        # get signal current set of slots
-        _slots = self.connections.get(signal)
-        # signal do exist and has a set of slots
-        if _slots and isinstance(_slots, set):
-            # keep only callable slots
-            _slots = set(filter(callable, _slots))
-            # update signal slots collection
-            self.connections[signal] = _slots
-            # browse the set
-            for _slot in _slots.copy():
+        # get signal current tuple of slots
+        # slots are already unique and callable (see connect())
+        _slots = self.__slots.get(signal)
+        # tuple of slots to rebuild?
+        if _slots is None and (self.__patterns or signal in self.connections):
+            _slots = self._update_slots(signal)
+        # end if
+        # signal do exist and has slots
+        if _slots:
+            _consumed = CONSUMED
+            # browse the tuple - immutable, so slots may safely
+            # connect/disconnect while being called
+            for _slot in _slots:
                 # call each slot one by one
                 # with arguments and keywords
-                _slot(*args, **kw)
+                if _slot(*args, **kw) is _consumed:
+                    # stop dispatch
+                    break
+                # end if
             # end for
             # operation succeeded
             return True
@@ -213,3 +628,68 @@ class TkGameEventManager:
     # end def
 
 # end class TkGameEventManager
+
+
+class TkGameWeakSlot:
+    """
+        callable weak reference to a bound method slot; calls method
+        if its owner object is still alive, does nothing otherwise;
+        @callback gets called with weak reference in argument once
+        owner object has been garbage collected;
+    """
+
+    __slots__ = ("func", "ref")
+
+    def __init__ (self, method, callback=None):
+        """
+            class constructor
+        """
+        self.func = method.__func__
+        self.ref = weakref.ref(method.__self__, callback)
+    # end def
+
+
+    def __call__ (self, *args, **kw):
+        """
+            calls method, if owner is alive;
+            returns method's return value, None otherwise;
+        """
+        _owner = self.ref()
+        if _owner is not None:
+            return self.func(_owner, *args, **kw)
+        # end if
+    # end def
+
+# end class TkGameWeakSlot
+
+
+def benchmark (number=100000):
+    """
+        raises a signal @number times with 1, 10 and 100 connected
+        slots and prints raises per second;
+        usage (from tkGAME root dir):
+        python3 -m lib.widgets.tkgame_events [number]
+    """
+    from timeit import timeit
+    print("\nraises: {}".format(number))
+    for _count in (1, 10, 100):
+        _events = TkGameEventManager()
+        _events.connect(
+            "Benchmark", *[(lambda *args, **kw: None) for i in range(_count)]
+        )
+        _time = timeit(
+            lambda: _events.raise_event("Benchmark", 1, key=2),
+            number=number
+        )
+        print(
+            "{:>3} slot(s): {:>12,.0f} raises/s"
+            .format(_count, number / _time)
+        )
+    # end for
+    print()
+# end def
+
+
+if __name__ == "__main__":
+    benchmark(*map(int, sys.argv[1:]))
+# end if
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkGAME - all-in-one Game library for Tkinter
+
+    Copyright (c) 2014+ Raphaël Seban <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with this program.
+
+    If not, see http://www.gnu.org/licenses/
+"""
+
+# tkgame_events.py module testings
+# usage (from tkGAME root dir, needs a display):
+# python3 -m lib.widgets.tkgame_events_tests
+import gc
+import weakref
+import tkinter as TK
+from timeit import timeit
+from .tkgame_events import get_event_manager, TkGameEventManager
+from .tkgame_canvas_sprite import TkGameCanvasSprite
+
+
+# -------------------------- MODULE FUNCTION DEFS ----------------------
+
+
+# sprite connecting its own weak slots and never disconnecting them
+class TickSprite (TkGameCanvasSprite):
+
+    def init_sprite (self, **kw):
+        self.ticks = 0
+        self.canvas_id = self.canvas.create_image(0, 0)
+        self.bind_events()
+    # end def
+
+    def bind_events (self, *args, **kw):
+        self.events.connect("Game:Tick", self.on_tick, weak=True)
+        self.events.connect(
+            self.get_event_name("Tick"), self.on_tick, weak=True
+        )
+    # end def
+
+    def on_tick (self, *args, **kw):
+        self.ticks += 1
+    # end def
+
+# end class TickSprite
+
+
+# creating and destroying many sprites must keep event bus flat
+def test_sprites_leaks (qty=10000, rounds=3):
+    print("\n" + "-" * 60)
+    print(
+        "\nCreating and destroying {} sprites {} times "
+        "without disconnecting their slots".format(qty, rounds)
+    )
+    # inits
+    root = TK.Tk()
+    canvas = TK.Canvas(root)
+    events = get_event_manager()
+    alive = weakref.WeakSet()
+    for _round in range(rounds):
+        sprites = [TickSprite(root, canvas) for _i in range(qty)]
+        alive.update(sprites)
+        # all slots must get called
+        events.raise_event("Game:Tick")
+        _ticks = sum(_sprite.ticks for _sprite in sprites)
+        print("\nround {}: {} ticks".format(_round + 1, _ticks))
+        if _ticks != qty:
+            print("\n[ERROR] expected {} ticks!".format(qty))
+            exit(1)
+        # end if
+        # destroy sprites (no unbind_events() reimplemented)
+        for _sprite in sprites:
+            _sprite.destroy()
+        # end for
+        del sprites, _sprite
+        gc.collect()
+        _counts = dict(
+            alive=len(alive),
+            # live slots of all signals, sprite named ones included
+            slots=sum(map(len, events.connections.values())),
+            signals=len(events.connections),
+            called=events.raise_event("Game:Tick"),
+        )
+        print("after destroy:", _counts)
+        if _counts != dict(alive=0, slots=0, signals=0, called=False):
+            print("\n[ERROR] sprites or slots are still alive!")
+            exit(1)
+        # end if
+    # end for
+    root.destroy()
+    # succeeded
+    print("\nAll has been verified OK.")
+# end def
+
+
+# posting many events per frame must raise them once per idle cycle
+def test_posted_events (qty=10000):
+    print("\n" + "-" * 60)
+    print("\nPosting {} events within a single frame".format(qty))
+    # inits
+    root = TK.Tk()
+    events = get_event_manager()
+    calls = list()
+    events.connect("Canvas:Sprite:Moved", lambda **kw: calls.append(kw))
+    events.connect(
+        "View:Scrolled", lambda step: calls.append(dict(step=step))
+    )
+    # scroll steps get summed up
+    _merge = lambda old, new: ((old[0][0] + new[0][0],), dict())
+    for _i in range(qty):
+        events.post_event("Canvas:Sprite:Moved", xy=(_i, _i))
+        events.post_event("View:Scrolled", 1, merge=_merge)
+    # end for
+    print("\nbefore idle cycle:", calls)
+    root.update_idletasks()
+    print("after idle cycle:", calls)
+    root.destroy()
+    if calls != [dict(xy=(qty - 1, qty - 1)), dict(step=qty)]:
+        print("\n[ERROR] events have not been coalesced!")
+        exit(1)
+    # end if
+    # succeeded
+    print("\nAll has been verified OK.")
+# end def
+
+
+# signal patterns and group disconnection
+def test_signal_patterns (signals=100000, group=10):
+    print("\n" + "-" * 60)
+    print(
+        "\nMatching signal patterns and disconnecting a group of {} "
+        "among {} signals".format(group, signals)
+    )
+    # inits
+    events = TkGameEventManager()
+    calls = list()
+    _slot = lambda name: (lambda **kw: calls.append(name))
+    events.connect("Game:Player:Moved", _slot("exact"))
+    events.connect("Game:*:Moved", _slot("one level"), priority=1)
+    events.connect("Game:**", _slot("any levels"))
+    for _signal in ("Game:Player:Moved", "Game:Enemy:State:Changed"):
+        del calls[:]
+        events.raise_event(_signal)
+        print("\n{}: {}".format(_signal, calls))
+    # end for
+    if calls != ["any levels"]:
+        print("\n[ERROR] unexpected pattern matching!")
+        exit(1)
+    # end if
+    # group disconnection must not depend on signals count
+    for _i in range(signals):
+        events.connect("Signal{}:Changed".format(_i), print)
+    # end for
+    _time = timeit(
+        lambda: (
+            events.connect_dict(
+                {"Group:{}".format(_i): print for _i in range(group)}
+            ),
+            events.disconnect_group("Group:"),
+        ),
+        number=100
+    )
+    print("\nconnect + disconnect group: {:.3f} ms".format(_time * 10))
+    if events.raise_event("Group:0") or not events.raise_event("Game:A:B"):
+        print("\n[ERROR] group has not been disconnected!")
+        exit(1)
+    # end if
+    # succeeded
+    print("\nAll has been verified OK.")
+# end def
+
+
+
+# ----------------------------- NOW TESTING -------------------------
+
+
+# session start
+print("\n--- BEGIN TEST SESSION ---")
+
+test_sprites_leaks(qty=10000, rounds=3)
+
+test_posted_events(qty=10000)
+
+test_signal_patterns(signals=100000, group=10)
+
+# session end
+print("\n--- END OF TEST SESSION ---")
@@ -23,9 +23,47 @@
 """
 
 # lib imports
-import re
+import sys
 import locale
 import os.path as OP
+import importlib.util
+
+
+# PO parser, compiled catalogs, lazy texts, translations table and _()
+# lookup function are shared with tkRAD (tkRAD/core/i18n_base.py), so
+# that both libraries use one table, one LazyText class and one builtin
+# _(); that module only needs python standard library and gets loaded
+# under its own tkRAD name without importing tkRAD package, as this
+# would set up the whole of it
+def _load_i18n_base ():
+    _name = "tkRAD.core.i18n_base"
+    # already imported along with tkRAD?
+    if _name in sys.modules:
+        return sys.modules[_name]
+    # end if
+    _path = OP.join(
+        OP.dirname(OP.abspath(__file__)),
+        "..", "..", "tkRAD", "core", "i18n_base.py"
+    )
+    _spec = importlib.util.spec_from_file_location(_name, _path)
+    _module = importlib.util.module_from_spec(_spec)
+    # tkRAD will import this very module later on
+    sys.modules[_name] = _module
+    _spec.loader.exec_module(_module)
+    return _module
+# end def
+
+
+_base = _load_i18n_base()
+_ = _base._
+_update_lookup = _base._update_lookup
+LazyText = _base.LazyText
+get_translations_table = _base.get_translations_table
+load_catalog = _base.load_catalog
+parse_po = _base.parse_po
+set_translations_table = _base.set_translations_table
+switch_off = _base.switch_off
+switch_on = _base.switch_on
 
 
 # current translations directory init
@@ -34,24 +72,6 @@ __translations_dir = "locale"
 # current translations language init
 __translations_lang = locale.getdefaultlocale()[0] or "en"
 
-# current translations table init
-__translations_table = dict()
-
-# i18n support switcher
-__switch_off = False
-
-
-def _ (text):
-    """
-        tries to retrieve a locale translation along setup;
-        returns translated text on success, original text otherwise;
-    """
-    if __switch_off:
-        return text
-    # end if
-    return __translations_table.get(text) or text
-# end def
-
 
 # set overall scope function
 __builtins__["_"] = _
@@ -73,14 +93,6 @@ def get_translations_lang ():
 # end def
 
 
-def get_translations_table ():
-    """
-        gets locale translations hash table;
-    """
-    return __translations_table
-# end def
-
-
 def install (lc_dir=None, lc_lang=None):
     """
         sets up translations directory and language;
@@ -102,31 +114,12 @@ def load_translations_table (lc_dir=None, lc_lang=None):
         tries to load translations table along lc_lang and lc_dir;
         no return value (void);
     """
-    # allow updates
-    global __translations_table
     # look for translations file
     lc_dir = lc_dir or __translations_dir
     lc_lang = lc_lang or __translations_lang
     _path = OP.abspath(OP.join(lc_dir, lc_lang + ".po"))
-    with open(_path, encoding="UTF-8") as _file:
-        _data = _file.read()
-    # end with
-    # transform a PO *.po file to a dict() sequence
-    # strip heading comments
-    _data = re.sub(r"(?m)^#.*$", "", _data)
-    # lowercase all 'msgId', 'MSGID' and others
-    _data = re.sub(r"(?i)msgid", "msgid", _data)
-    # split string to list()
-    _data = _data.split("msgid")
-    # anything before first 'msgid'
-    # is useless (and buggy) /!\
-    del _data[0]
-    # rebuild data string
-    _data = ",".join(_data)
-    # change 'msgstr' (case-insensitive) to ':'
-    _data = re.sub(r"(?i)msgstr", ":", _data)
     # try new translations table
-    __translations_table = eval("{" + _data + "}")
+    set_translations_table(load_catalog(_path))
 # end def
 
 
@@ -154,32 +147,3 @@ def set_translations_lang (arg):
         __translations_lang = arg
     # end if
 # end def
-
-
-def set_translations_table (arg):
-    """
-        sets up locale translations hash table;
-    """
-    # allow updates
-    global __translations_table
-    # set new value
-    __translations_table = dict(arg)
-# end def
-
-
-def switch_off ():
-    """
-        switches i18n support OFF;
-    """
-    global __switch_off
-    __switch_off = True
-# end def
-
-
-def switch_on ():
-    """
-        switches i18n support ON;
-    """
-    global __switch_off
-    __switch_off = False
-# end def
@@ -26,14 +26,70 @@
 
 import re
 
+import sys
+
 import glob
 
 import os.path as OP
 
+import importlib.util
+
 import xml.etree.ElementTree as ET
 
 
 
+def _load_dispatch ():
+    r"""
+        loads tkRAD/xml/rad_xml_dispatch.py shared dispatcher;
+
+        that module only needs python standard library and gets
+        loaded on its own, as importing tkRAD package would set up
+        the whole of it;
+
+        returns module object;
+    """
+
+    # already imported along with tkRAD or as a STANDALONE module?
+
+    for _name in ("tkRAD.xml.rad_xml_dispatch", "rad_xml_dispatch"):
+
+        if _name in sys.modules:
+
+            return sys.modules[_name]
+
+        # end if
+
+    # end for
+
+    # load it by file path
+
+    _path = OP.join(
+
+        OP.dirname(OP.abspath(__file__)),
+
+        "..", "..", "tkRAD", "xml", "rad_xml_dispatch.py"
+    )
+
+    _spec = importlib.util.spec_from_file_location("rad_xml_dispatch", _path)
+
+    _module = importlib.util.module_from_spec(_spec)
+
+    _spec.loader.exec_module(_module)
+
+    # keep it for further loads
+
+    sys.modules["rad_xml_dispatch"] = _module
+
+    return _module
+
+# end def
+
+
+
+XR = _load_dispatch()
+
+
+
 # subcomponent class def
 
 class XMLGameset:
@@ -59,6 +115,10 @@ class XMLGameset:
 
         self.xml_tree = None
 
+        # table-driven builders and parsers dispatcher
+
+        self.dispatcher = XR.RADXMLDispatcher(self)
+
     # end def
 
 
@@ -72,14 +132,7 @@ class XMLGameset:
 
             _xml_tag = kw.get("xml_tag", xml_element.tag)
 
-            _builder = getattr(
-
-                self,
-
-                str(self.ELEMENT_BUILDER).format(xml_tag=_xml_tag),
-
-                None
-            )
+            _builder = self.dispatcher.get_element_builder(_xml_tag)
 
             if callable(_builder):
 
@@ -115,15 +168,7 @@ class XMLGameset:
 
             for _xml_attr, _value in _xml_attrs.items():
 
-                _parser = getattr(
-
-                    self,
-
-                    str(self.ATTRIBUTE_PARSER)
-                        .format(xml_attr=_xml_attr),
-
-                    None
-                )
+                _parser = self.dispatcher.get_attribute_parser(_xml_attr)
 
                 # XML attribute parsing is optional
 
@@ -535,3 +580,116 @@ class GamesetsManager:
 
 
 # end class GamesetsManager
+
+
+
+def benchmark (items = 5000, number = 5):
+    r"""
+        XMLGameset building benchmark;
+
+        builds a generated gameset of @items items (3 XML attributes
+        each, 2 of them parsed) @number times and prints best time;
+
+        usage (from tkGAME root dir, no display needed):
+
+            python3 -m lib.xml.gamesets_manager [items] [number]
+    """
+
+    # lib imports
+
+    import os
+
+    import tempfile
+
+    from time import perf_counter
+
+    class _Gameset (XMLGameset):
+
+        def _build_element_gameset (self, xml_element, parent, **kw):
+
+            for _child in xml_element:
+
+                self._build_element(_child, parent, **kw)
+
+            # end for
+
+        # end def
+
+        def _build_element_item (self, xml_element, parent, **kw):
+
+            self._parse_xml_attributes(xml_element, parent, **kw)
+
+        # end def
+
+        def _parse_attribute_id (self, value, **kw):
+
+            self.objects[value] = kw["xml_element"]
+
+        # end def
+
+        def _parse_attribute_value (self, value, **kw):
+
+            kw["xml_attrs"]["value"] = int(value)
+
+        # end def
+
+    # end class
+
+    # generated gameset
+
+    _fd, _path = tempfile.mkstemp(suffix = ".xml")
+
+    with os.fdopen(_fd, "w") as _file:
+
+        _file.write(
+
+            "<gameset>{}</gameset>".format(
+
+                "".join(
+
+                    '<item id="item{n}" value="{n}" name="Item {n}"/>'
+
+                    .format(n = _n) for _n in range(items)
+                )
+            )
+        )
+
+    # end with
+
+    _timings = list()
+
+    try:
+
+        for _i in range(number):
+
+            _gameset = _Gameset(_path)
+
+            _start = perf_counter()
+
+            _gameset.xml_build()
+
+            _timings.append(perf_counter() - _start)
+
+        # end for
+
+    finally:
+
+        os.remove(_path)
+
+    # end try
+
+    print("\ngameset items:  {}".format(items))
+
+    print("best build:     {:.1f} ms\n".format(min(_timings) * 1e3))
+
+# end def
+
+
+
+# benchmark launching (not imported)?
+
+if __name__ == "__main__":
+
+    benchmark(*map(int, sys.argv[1:]))
+
+# end if
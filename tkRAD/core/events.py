@@ -28,6 +28,37 @@
 
 
 
+# lib imports
+
+import sys
+
+import weakref
+
+import tkinter as TK
+
+
+
+class _EventConsumed:
+    r"""
+        type of CONSUMED unique slot return value;
+    """
+
+    def __repr__ (self):
+
+        return "CONSUMED"
+
+    # end def
+
+# end class _EventConsumed
+
+
+
+# slot return value stopping signal dispatch
+
+CONSUMED = _EventConsumed()
+
+
+
 # unique instance pointer
 
 # module private var init
@@ -146,25 +177,275 @@ class EventManager:
 
         # end class MyClass
 
+        slots connected to each signal are kept in self.connections
+        and also cached as an immutable tuple, rebuilt only once on
+        next raise_event() after connect() or disconnect() calls, so
+        that raise_event() is a plain loop over slots;
+
+        slots get called by decreasing priority (see connect()),
+        then in connection order for a same priority;
+
+        a slot returning CONSUMED (also self.events.CONSUMED) stops
+        signal dispatch: remaining slots do not get called;
+
+        bound method slots may be held by weak reference (opt-in,
+        see connect() and WEAK_SLOTS), so that connected objects may
+        be garbage collected without calling disconnect(): their
+        slots then get removed on the fly; plain functions, lambdas
+        and other callables are always held by strong reference;
+
+        /!\ connect(signal, SomeClass().method, weak = True) would
+        vanish at once: keep strong references for such slots;
+
+        high-frequency signals (e.g. moves, scrolls, resizes) may be
+        posted with post_event() rather than raised: they get
+        queued, merged per signal and raised only once per tkinter
+        idle cycle (see flush_events());
+
     """
 
 
 
+    # slot return value stopping signal dispatch
+
+    CONSUMED = CONSUMED
+
+
+
+    # bound method slots default reference mode
+    # set to True (e.g. in subclass) to hold them weakly by default
+
+    WEAK_SLOTS = False
+
+
+
     def __init__ (self):
         r"""
             class constructor - initializes connection hashtable;
+
+            i.e. {signal: {slot_key: (priority, slot)}} with
+            connected slots by slot key for each signal;
         """
 
         self.connections = dict()
 
+        # cached immutable tuples of slots, rebuilt on demand
+        # i.e. {signal: tuple of slots}
+
+        self.__slots = dict()
+
+        # posted events queue and flush scheduling flag
+        # i.e. {signal or unique key: (signal, args, kw)}
+
+        self.__posted = dict()
+
+        # tkinter root window flush_events() is scheduled on
+
+        self.__flush_root = None
+
+    # end def
+
+
+
+    def _drop_slot (self, signal, key, ref):
+        r"""
+            protected method def;
+
+            removes weak slot of @key for @signal once its owner
+            (referenced by @ref) has been garbage collected;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _table = self.connections.get(signal)
+
+        # still connected? (may have been reconnected since)
+
+        _entry = _table and _table.get(key)
+
+        if _entry and getattr(_entry[1], "ref", None) is ref:
+
+            del _table[key]
+
+            self._reset_slots(signal)
+
+        # end if
+
     # end def
 
 
 
-    def connect (self, signal, *slots):
+    def _get_slot (self, signal, key, slot, weak):
+        r"""
+            protected method def;
+
+            returns @slot itself or a WeakSlot() of @slot if @weak
+            is True and @slot is a bound method of an object
+            supporting weak references;
+        """
+
+        # weak reference wanted and possible?
+
+        if weak and hasattr(slot, "__func__") \
+                                    and hasattr(slot, "__self__"):
+
+            try:
+
+                return WeakSlot(
+
+                    slot,
+
+                    lambda ref: self._drop_slot(signal, key, ref)
+                )
+
+            except TypeError:
+
+                pass
+
+            # end try
+
+        # end if
+
+        return slot
+
+    # end def
+
+
+
+    def _get_slot_key (self, slot):
+        r"""
+            protected method def;
+
+            returns a hashable key identifying @slot, so that a
+            bound method and its weak counterpart share the same key;
+        """
+
+        # bound method (without keeping its owner alive)
+
+        if hasattr(slot, "__func__") and hasattr(slot, "__self__"):
+
+            return (id(slot.__self__), slot.__func__)
+
+        # end if
+
+        # other callables
+
+        try:
+
+            hash(slot)
+
+            return slot
+
+        except TypeError:
+
+            return id(slot)
+
+        # end try
+
+    # end def
+
+
+
+    def _reset_slots (self, signal):
+        r"""
+            protected method def;
+
+            drops immutable tuple of slots for @signal, so that it
+            gets rebuilt on next raise_event();
+
+            no return value (void);
+        """
+
+        self.__slots.pop(signal, None)
+
+    # end def
+
+
+
+    def _schedule_flush (self):
+        r"""
+            protected method def;
+
+            schedules flush_events() call for next tkinter idle
+            cycle; flushes events at once if no tkinter main loop is
+            available;
+
+            this could be overridden in subclass;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _root = self.__flush_root = getattr(TK, "_default_root", None)
+
+        # no tkinter main loop?
+
+        if _root is None:
+
+            self.flush_events()
+
+        else:
+
+            try:
+
+                _root.after_idle(self.flush_events)
+
+            except TK.TclError:
+
+                # main loop is over
+
+                self.flush_events()
+
+            # end try
+
+        # end if
+
+    # end def
+
+
+
+    def _update_slots (self, signal):
+        r"""
+            protected method def;
+
+            rebuilds immutable tuple of slots for @signal, sorted by
+            decreasing priority (stable sort keeps connection order);
+
+            returns new tuple of slots;
+        """
+
+        _slots = tuple(
+
+            _entry[1] for _entry in sorted(
+
+                self.connections.get(signal, dict()).values(),
+
+                key = lambda _entry: -_entry[0]
+            )
+        )
+
+        self.__slots[signal] = _slots
+
+        return _slots
+
+    # end def
+
+
+
+    def connect (self, signal, *slots, weak = None, priority = 0):
         r"""
             connects signal name to multiple callback slots;
 
+            bound method slots are held by weak reference if @weak
+            is True (default: self.WEAK_SLOTS);
+
+            slots of higher @priority (int or float) get called
+            first; connecting an already connected slot only updates
+            its priority;
+
             examples:
 
                 self.events.connect("signal_1", slot1)
@@ -175,24 +456,65 @@ class EventManager:
 
                 self.events.connect("signal_3", *args)
 
+                self.events.connect("signal_4", obj.method, weak = True)
+
+                self.events.connect("signal_5", slot8, priority = 10)
+
             returns True on success, False otherwise;
         """
 
-        # get signal current set of slots
+        # get signal current slots
+
+        _table = self.connections.setdefault(signal, dict())
 
-        _slots = self.connections.setdefault(signal, set())
+        # signal do have slots
 
-        # signal do have a set of slots
+        if isinstance(_table, dict):
 
-        if isinstance(_slots, set):
+            # inits
 
-            # slots must be unique for each signal
+            if weak is None:
 
-            _slots.update(set(slots))
+                weak = self.WEAK_SLOTS
 
-            # update signal set of slots
+            # end if
 
-            self.connections[signal] = set(filter(callable, _slots))
+            # slots must be unique and callable for each signal
+
+            for _slot in slots:
+
+                if callable(_slot):
+
+                    _key = self._get_slot_key(_slot)
+
+                    _entry = _table.get(_key)
+
+                    # new slot
+
+                    if _entry is None:
+
+                        _table[_key] = (
+
+                            priority,
+
+                            self._get_slot(signal, _key, _slot, weak),
+                        )
+
+                    # new priority (keeps slot reference mode)
+
+                    elif _entry[0] != priority:
+
+                        _table[_key] = (priority, _entry[1])
+
+                    # end if
+
+                # end if
+
+            # end for
+
+            # rebuild signal tuple of slots
+
+            self._reset_slots(signal)
 
             # operation succeeded
 
@@ -208,12 +530,14 @@ class EventManager:
 
 
 
-    def connect_dict (self, events_dict):
+    def connect_dict (self, events_dict, weak = None, priority = 0):
         r"""
             connects (signal, slots) pairs in dict() object;
 
             slots can be a single callback or one of tuple, list, set;
 
+            @weak and @priority params: see connect();
+
             example:
 
                 self.events.connect_dict(
@@ -242,11 +566,17 @@ class EventManager:
 
                 if isinstance(_slots, (tuple, list, set)):
 
-                    self.connect(_signal, *_slots)
+                    self.connect(
+
+                        _signal, *_slots, weak = weak, priority = priority
+                    )
 
                 else:
 
-                    self.connect(_signal, _slots)
+                    self.connect(
+
+                        _signal, _slots, weak = weak, priority = priority
+                    )
 
                 # end if
 
@@ -289,21 +619,25 @@ class EventManager:
             returns True if signal exists, False otherwise;
         """
 
-        # get signal current set of slots
+        # get signal current slots
 
-        _slots = self.connections.get(signal)
+        _table = self.connections.get(signal)
 
-        # signal do exist and has a set of slots
+        # signal do exist and has slots
 
-        if _slots and isinstance(_slots, set):
+        if _table:
 
             # remove eventual existing slots
 
-            _slots.difference_update(set(slots))
+            for _slot in slots:
+
+                _table.pop(self._get_slot_key(_slot), None)
+
+            # end for
 
-            # update signal set of slots
+            # rebuild signal tuple of slots
 
-            self.connections[signal] = set(filter(callable, _slots))
+            self._reset_slots(signal)
 
             # operation succeeded
 
@@ -344,6 +678,8 @@ class EventManager:
 
             # signal is no longer useful
 
+            self.__slots.pop(_signal, None)
+
             self.connections.pop(_signal, None)
 
         # end for
@@ -352,12 +688,123 @@ class EventManager:
 
 
 
+    def flush_events (self):
+        r"""
+            raises all events queued by post_event() in posting
+            order, then empties queue;
+
+            events posted meanwhile get flushed on next idle cycle;
+
+            returns number of raised events;
+        """
+
+        # inits
+
+        self.__flush_root = None
+
+        _queue, self.__posted = self.__posted, dict()
+
+        # browse queued events
+
+        for (_signal, _args, _kw) in _queue.values():
+
+            self.raise_event(_signal, *_args, **_kw)
+
+        # end for
+
+        return len(_queue)
+
+    # end def
+
+
+
+    def post_event (self, signal, *args, coalesce = True, merge = None,
+    **kw):
+        r"""
+            queues an event for the given signal name with eventual
+            arguments and keywords; queued events get raised once
+            per tkinter idle cycle (see flush_events());
+
+            if @coalesce is True, an event already queued for the
+            same signal gets replaced by this one (last one wins) or
+            merged with it if @merge callable is set: it is called
+            as merge(old, new) where old and new are (args, kw)
+            pairs and must return merged (args, kw) pair;
+
+            if @coalesce is False, each posted event gets raised;
+
+            examples:
+
+                self.events.post_event("SpriteMoved", sprite = self)
+
+                self.events.post_event(
+
+                    "ViewScrolled",
+
+                    step = 1,
+
+                    merge = lambda old, new: (
+
+                        (), dict(step = old[1]["step"] + new[1]["step"])
+                    ),
+                )
+
+            no return value (void);
+        """
+
+        # inits
+
+        _queue = self.__posted
+
+        # one queued event per signal
+
+        if coalesce:
+
+            _key = signal
+
+            _old = _queue.get(_key)
+
+            if _old is not None and callable(merge):
+
+                (args, kw) = merge(_old[1:], (args, kw))
+
+            # end if
+
+        # keep all events
+
+        else:
+
+            _key = object()
+
+        # end if
+
+        # queue event (a replaced one keeps its place in queue)
+
+        _queue[_key] = (signal, tuple(args), dict(kw))
+
+        # flush on next idle cycle (a flush scheduled on a destroyed
+        # or replaced root window would never come)
+
+        if self.__flush_root is None \
+                or self.__flush_root is not TK._default_root:
+
+            self._schedule_flush()
+
+        # end if
+
+    # end def
+
+
+
     def raise_event (self, signal, *args, **kw):
         r"""
             calls all slots attached to the given signal name
 
             with eventual arguments and keywords;
 
+            slots get called by decreasing priority and dispatch
+            stops as soon as a slot returns CONSUMED;
+
             examples:
 
             self.events.raise_event("ButtonOKClicked")
@@ -371,26 +818,42 @@ class EventManager:
             returns True if signal exists, False otherwise;
         """
 
-        # get signal current set of slots
+        # get signal current tuple of slots
+        # slots are already unique and callable (see connect())
+
+        _slots = self.__slots.get(signal)
+
+        # tuple of slots to rebuild?
+
+        if _slots is None and signal in self.connections:
 
-        _slots = self.connections.get(signal)
+            _slots = self._update_slots(signal)
 
-        # signal do exist and has a set of slots
+        # end if
+
+        # signal do exist and has slots
 
-        if _slots and isinstance(_slots, set):
+        if _slots:
 
-            # keep only callable slots
+            # inits
 
-            _slots = set(filter(callable, _slots))
+            _consumed = CONSUMED
 
-            # browse the set
+            # browse the tuple (immutable: slots may safely connect
+            # or disconnect while being called)
 
             for _slot in _slots:
 
                 # call each slot one by one
                 # with arguments and keywords
 
-                _slot(*args, **kw)
+                if _slot(*args, **kw) is _consumed:
+
+                    # stop dispatch
+
+                    break
+
+                # end if
 
             # end for
 
@@ -408,3 +871,112 @@ class EventManager:
 
 
 # end class EventManager
+
+
+
+class WeakSlot:
+    r"""
+        callable weak reference to a bound method slot;
+
+        calls method if its owner object is still alive, does
+        nothing otherwise;
+
+        @callback gets called with weak reference in argument once
+        owner object has been garbage collected;
+    """
+
+    __slots__ = ("func", "ref")
+
+
+
+    def __init__ (self, method, callback = None):
+        r"""
+            class constructor;
+        """
+
+        self.func = method.__func__
+
+        self.ref = weakref.ref(method.__self__, callback)
+
+    # end def
+
+
+
+    def __call__ (self, *args, **kw):
+        r"""
+            calls method with @args and @kw, if owner is alive;
+
+            returns method's return value, None if owner is dead;
+        """
+
+        _owner = self.ref()
+
+        if _owner is not None:
+
+            return self.func(_owner, *args, **kw)
+
+        # end if
+
+    # end def
+
+
+# end class WeakSlot
+
+
+
+def benchmark (number = 100000):
+    r"""
+        event dispatch benchmark;
+
+        raises a signal @number times with 1, 10 and 100 connected
+        slots and prints raises per second;
+
+        usage (from tkGAME root dir):
+
+            python3 tkRAD/core/events.py [number]
+    """
+
+    # lib imports
+
+    from timeit import timeit
+
+    print("\nraises:     {}".format(number))
+
+    for _count in (1, 10, 100):
+
+        _events = EventManager()
+
+        _events.connect(
+
+            "Benchmark", *[(lambda *args, **kw: None) for _i in range(_count)]
+        )
+
+        _time = timeit(
+
+            lambda: _events.raise_event("Benchmark", 1, key = 2),
+
+            number = number
+        )
+
+        print(
+
+            "{:>3} slot(s): {:>12,.0f} raises/s"
+
+            .format(_count, number / _time)
+        )
+
+    # end for
+
+    print()
+
+# end def
+
+
+
+# benchmark launching (not imported)?
+
+if __name__ == "__main__":
+
+    benchmark(*map(int, sys.argv[1:]))
+
+# end if
@@ -28,6 +28,8 @@
 
 import re
 
+import sys
+
 import locale
 
 import os.path as OP
@@ -36,48 +38,29 @@ from . import path
 
 from . import tools
 
+# PO parser, compiled catalogs, lazy texts, translations table and
+# _() lookup function are shared with tkGAME's tkgame_i18n, so that
+# both libraries use one table and one builtin _() (see i18n_base)
 
+from .i18n_base import (
 
-# current translations directory init
-
-__translations_dir = "^/locale"
-
-
-
-# current translations language init
-
-__translations_lang = tools.choose_str(locale.getdefaultlocale()[0])
-
+    _, _update_lookup, LazyText, get_translations_table, load_catalog,
 
+    parse_po, set_translations_table, switch_off, switch_on,
+)
 
-# current translations table init
 
-__translations_table = dict()
 
+# current translations directory init
 
+__translations_dir = "^/locale"
 
-# i18n support switcher
-
-__switch_off = False
-
-
-
-def _ (text):
-    r"""
-        tries to retrieve a locale translation along setup;
-
-        returns translated text on success, original text otherwise;
-    """
-
-    if __switch_off:
 
-        return text
 
-    # end if
+# current translations language init
 
-    return tools.choose_str(__translations_table.get(text), text)
+__translations_lang = tools.choose_str(locale.getdefaultlocale()[0])
 
-# end def
 
 
 # set overall scope function
@@ -108,17 +91,6 @@ def get_translations_lang ():
 
 
 
-def get_translations_table ():
-    r"""
-        gets locale translations hash table;
-    """
-
-    return __translations_table
-
-# end def
-
-
-
 def install (lc_dir = None, lc_lang = None):
     r"""
         sets up translations directory and language;
@@ -153,10 +125,6 @@ def load_translations_table (lc_dir = None, lc_lang = None):
         no return value (void);
     """
 
-    # allow updates
-
-    global __translations_table
-
     # look for translations file
 
     lc_dir = tools.choose_str(lc_dir, __translations_dir)
@@ -165,43 +133,9 @@ def load_translations_table (lc_dir = None, lc_lang = None):
 
     _path = path.normalize(OP.join(lc_dir, lc_lang + ".po"))
 
-    with open(_path, "r", encoding="UTF-8") as _file:
-
-        _data = _file.read()
-
-    # end with
-
-    # transform a PO *.po file to a dict() sequence
-
-    # strip heading comments
-
-    _data = re.sub(r"(?m)^#.*$", r"", _data)
-
-    # lowercase all 'msgId', 'MSGID' and others
-
-    _data = re.sub(r"(?i)msgid", r"msgid", _data)
-
-    # split string to list()
-
-    _data = _data.split("msgid")
-
-    # anything before first 'msgid'
-
-    # is useless (and buggy) /!\
-
-    del _data[0]
-
-    # rebuild data string
-
-    _data = ",".join(_data)
-
-    # change 'msgstr' (case-insensitive) to ':'
-
-    _data = re.sub(r"(?i)msgstr", r":", _data)
-
     # try new translations table
 
-    __translations_table = eval("{" + _data + "}")
+    set_translations_table(load_catalog(_path))
 
 # end def
 
@@ -241,43 +175,83 @@ def set_translations_lang (arg):
 
 
 
-def set_translations_table (arg):
+def benchmark (lc_dir = "^/locale", number = 100):
     r"""
-        sets up locale translations hash table;
+        translations loading benchmark;
+
+        loads each PO *.po file of @lc_dir @number times with former
+        regexp + eval() transform, with parse_po() and with
+        load_catalog() compiled catalogs;
+
+        usage (from tkGAME root dir):
+
+            python3 -m tkRAD.core.i18n [number]
     """
 
-    # allow updates
+    # lib imports
 
-    global __translations_table
+    import glob
 
-    # set new value
+    from timeit import timeit
 
-    __translations_table = dict(arg)
+    # former transform (kept for comparison only)
 
-# end def
+    def _regex_eval (po_path):
 
+        with open(po_path, "r", encoding="UTF-8") as _file:
 
+            _data = _file.read()
 
-def switch_off ():
-    r"""
-        switches i18n support OFF;
-    """
+        # end with
 
-    global __switch_off
+        _data = re.sub(r"(?m)^#.*$", r"", _data)
 
-    __switch_off = True
+        _data = re.sub(r"(?i)msgid", r"msgid", _data)
 
-# end def
+        _data = _data.split("msgid")
 
+        del _data[0]
 
+        _data = re.sub(r"(?i)msgstr", r":", ",".join(_data))
 
-def switch_on ():
-    r"""
-        switches i18n support ON;
-    """
+        return eval("{" + _data + "}")
+
+    # end def
+
+    for _path in sorted(glob.glob(OP.join(path.normalize(lc_dir), "*.po"))):
+
+        # ensure compiled catalog is up to date
+
+        _table = load_catalog(_path)
+
+        print("\n{} ({} entries)".format(_path, len(_table)))
+
+        for _name, _func in (
+
+                ("regexp + eval", _regex_eval),
+
+                ("parse_po", parse_po),
 
-    global __switch_off
+                ("load_catalog", load_catalog)):
 
-    __switch_off = False
+            _time = timeit(lambda: _func(_path), number = number) / number
+
+            print("{:<15} {:>10.1f} µs".format(_name, _time * 1e6))
+
+        # end for
+
+    # end for
+
+    print()
 
 # end def
+
+
+
+# benchmark launching (not imported)?
+
+if __name__ == "__main__":
+
+    benchmark(number = int(sys.argv[1]) if sys.argv[1:] else 100)
+
+# end if
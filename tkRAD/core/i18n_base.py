@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# dependency-free i18n base shared by tkRAD.core.i18n and tkGAME's
+# lib/widgets/tkgame_i18n.py: PO parser, compiled catalogs, lazy
+# translated texts, translations table and _() lookup function;
+
+# /!\ python standard library imports only /!\
+# this module may be loaded on its own, without tkRAD package
+
+# lib imports
+
+import os
+
+import re
+
+import sys
+
+import marshal
+
+import builtins
+
+import tempfile
+
+import os.path as OP
+
+
+
+# compiled catalogs file extension (next to *.po source files)
+# and format version (see load_catalog())
+
+CATALOG_EXT = ".poc"
+
+CATALOG_FORMAT = 1
+
+
+
+# PO strings escape sequences
+
+__po_escapes = {
+
+    "n": "\n", "t": "\t", "r": "\r", "a": "\a", "b": "\b",
+
+    "f": "\f", "v": "\v", '"': '"', "'": "'", "\\": "\\",
+}
+
+
+
+# current translations table init
+
+__translations_table = dict()
+
+# i18n support switcher
+
+__switch_off = False
+
+# current lookup function i.e. translations table's dict.get()
+# see _update_lookup()
+
+__lookup = __translations_table.get
+
+
+
+def _ (text):
+    r"""
+        tries to retrieve a locale translation along setup;
+
+        this is a single dict.get() lookup: translations table only
+        holds non-empty translations and i18n switch is handled by
+        _update_lookup();
+
+        returns translated text on success, original text otherwise;
+    """
+
+    return __lookup(text, text)
+
+# end def
+
+
+
+def _translate (text):
+    r"""
+        translates @text along current builtin _() function, as
+        installed by tkRAD.core.i18n or tkgame_i18n, if any;
+
+        returns translated text or @text as is;
+    """
+
+    return getattr(builtins, "_", str)(text)
+
+# end def
+
+
+
+def _unquote (text):
+    r"""
+        returns PO quoted @text string without its quotes and with
+        its escape sequences decoded;
+    """
+
+    if len(text) > 1 and text[0] == text[-1] == '"':
+
+        text = text[1:-1]
+
+    # end if
+
+    if "\\" in text:
+
+        text = re.sub(
+
+            r"\\(.)",
+
+            lambda m: __po_escapes.get(m.group(1), "\\" + m.group(1)),
+
+            text
+        )
+
+    # end if
+
+    return text
+
+# end def
+
+
+
+def _update_lookup ():
+    r"""
+        resets _() lookup function along translations table and
+        i18n switch;
+
+        no return value (void);
+    """
+
+    global __lookup
+
+    if __switch_off:
+
+        __lookup = dict().get
+
+    else:
+
+        __lookup = __translations_table.get
+
+    # end if
+
+# end def
+
+
+
+class LazyText:
+    r"""
+        lazy translated text: translation is deferred until text
+        gets rendered i.e. str(), format(), concatenation, string
+        methods or tkinter options;
+
+        translation follows current language at rendering time, so
+        that texts built at module import time cost nothing until
+        displayed and keep up with language switches e.g.
+
+            TITLE = LazyText("About")
+
+            ...
+
+            label.configure(text = TITLE)
+    """
+
+    __slots__ = ("text", )
+
+
+
+    def __init__ (self, text):
+        r"""
+            class constructor;
+        """
+
+        self.text = text
+
+    # end def
+
+
+
+    def __str__ (self):
+
+        return _translate(self.text)
+
+    # end def
+
+
+
+    def __repr__ (self):
+
+        return "LazyText({!r})".format(self.text)
+
+    # end def
+
+
+
+    def __format__ (self, format_spec):
+
+        return format(_translate(self.text), format_spec)
+
+    # end def
+
+
+
+    def __getattr__ (self, name):
+
+        # e.g. LazyText("...").format(...), .upper(), etc
+
+        return getattr(_translate(self.text), name)
+
+    # end def
+
+
+
+    def __add__ (self, other):
+
+        return _translate(self.text) + other
+
+    # end def
+
+
+
+    def __radd__ (self, other):
+
+        return other + _translate(self.text)
+
+    # end def
+
+
+
+    def __mod__ (self, args):
+
+        return _translate(self.text) % args
+
+    # end def
+
+
+
+    def __contains__ (self, item):
+
+        return item in _translate(self.text)
+
+    # end def
+
+
+
+    def __len__ (self):
+
+        return len(_translate(self.text))
+
+    # end def
+
+
+
+    def __eq__ (self, other):
+
+        # same msgid, same translation whatever current language
+
+        if isinstance(other, LazyText):
+
+            return self.text == other.text
+
+        # end if
+
+        return _translate(self.text) == other
+
+    # end def
+
+
+
+    def __hash__ (self):
+
+        # msgid never changes, unlike its translation on language
+        # switches: LazyText keys stay valid in dicts and sets, but
+        # do not match plain str keys
+
+        return hash(self.text)
+
+    # end def
+
+
+# end class LazyText
+
+
+
+def get_translations_table ():
+    r"""
+        gets locale translations hash table;
+    """
+
+    return __translations_table
+
+# end def
+
+
+
+def load_catalog (path):
+    r"""
+        loads translations table from a PO *.po @path file;
+
+        a compiled catalog (marshal'd dict) is written next to PO
+        source file at first load, e.g. "locale/fr_FR.poc", so
+        that further loads only unmarshal it; catalog gets
+        silently recompiled as soon as PO file changes;
+
+        any I/O trouble on compiled catalog is silently ignored,
+        e.g. read-only locale directory;
+
+        raises OSError if PO file does not exist;
+
+        returns translations dict() object;
+    """
+
+    # inits
+
+    _stat = os.stat(path)
+
+    _key = (
+
+        CATALOG_FORMAT,
+
+        tuple(sys.version_info[:2]),
+
+        _stat.st_mtime_ns,
+
+        _stat.st_size,
+    )
+
+    _cpath = OP.splitext(path)[0] + CATALOG_EXT
+
+    # try compiled catalog
+
+    try:
+
+        with open(_cpath, "rb") as _file:
+
+            (_ckey, _table) = marshal.loads(_file.read())
+
+        # end with
+
+        if _ckey == _key:
+
+            return _table
+
+        # end if
+
+    except (OSError, EOFError, ValueError, TypeError):
+
+        pass
+
+    # end try
+
+    # parse PO source file
+
+    _table = parse_po(path)
+
+    # compile catalog (atomic write)
+
+    _tmp = None
+
+    try:
+
+        (_fd, _tmp) = tempfile.mkstemp(dir = OP.dirname(_cpath))
+
+        with os.fdopen(_fd, "wb") as _file:
+
+            _file.write(marshal.dumps((_key, _table)))
+
+        # end with
+
+        os.replace(_tmp, _cpath)
+
+    except OSError:
+
+        if _tmp and OP.exists(_tmp):
+
+            os.remove(_tmp)
+
+        # end if
+
+    # end try
+
+    return _table
+
+# end def
+
+
+
+def parse_po (path):
+    r"""
+        parses a PO *.po @path file line by line;
+
+        supports comments, msgctxt, msgid, msgid_plural, msgstr,
+        msgstr[n] and multiline strings; keywords are
+        case-insensitive;
+
+        PO header, fuzzy and untranslated entries are dropped;
+        context entries are keyed "msgctxt\x04msgid" as in GNU
+        gettext and plural entries keep their first form only;
+
+        returns translations dict() object;
+    """
+
+    # inits
+
+    _table = dict()
+
+    _entry = dict()
+
+    _keyword = None
+
+    _fuzzy = False
+
+    def _flush ():
+
+        # entry inits
+
+        _msgid = _entry.get("msgid")
+
+        _msgstr = _entry.get("msgstr", _entry.get("msgstr[0]"))
+
+        if _msgid and _msgstr and not _fuzzy:
+
+            if "msgctxt" in _entry:
+
+                _msgid = _entry["msgctxt"] + "\x04" + _msgid
+
+            # end if
+
+            _table[_msgid] = _msgstr
+
+        # end if
+
+        _entry.clear()
+
+    # end def
+
+    with open(path, "r", encoding = "UTF-8") as _file:
+
+        for _line in _file:
+
+            _line = _line.strip()
+
+            # continued string
+
+            if _line.startswith('"'):
+
+                if _keyword:
+
+                    _entry[_keyword] += _unquote(_line)
+
+                # end if
+
+                continue
+
+            # end if
+
+            # empty line
+
+            if not _line:
+
+                continue
+
+            # end if
+
+            # comment or new keyword ends a translated entry
+
+            _done = any(_k.startswith("msgstr") for _k in _entry)
+
+            if _line.startswith("#"):
+
+                if _done:
+
+                    _flush()
+
+                    _keyword, _fuzzy = None, False
+
+                # end if
+
+                if _line.startswith("#,") and "fuzzy" in _line:
+
+                    _fuzzy = True
+
+                # end if
+
+                continue
+
+            # end if
+
+            (_keyword, _sep, _value) = _line.partition(" ")
+
+            _keyword = _keyword.lower()
+
+            if _done and _keyword in ("msgctxt", "msgid"):
+
+                _flush()
+
+                _fuzzy = False
+
+            # end if
+
+            _entry[_keyword] = _unquote(_value.strip())
+
+        # end for
+
+    # end with
+
+    # last entry
+
+    _flush()
+
+    return _table
+
+# end def
+
+
+
+def set_translations_table (arg):
+    r"""
+        sets up locale translations hash table;
+    """
+
+    # allow updates
+
+    global __translations_table
+
+    # set new value (empty translations are useless)
+
+    __translations_table = dict(
+
+        (_key, _value) for _key, _value in dict(arg).items()
+
+        if _value and isinstance(_value, str)
+    )
+
+    _update_lookup()
+
+# end def
+
+
+
+def switch_off ():
+    r"""
+        switches i18n support OFF;
+    """
+
+    global __switch_off
+
+    __switch_off = True
+
+    _update_lookup()
+
+# end def
+
+
+
+def switch_on ():
+    r"""
+        switches i18n support ON;
+    """
+
+    global __switch_off
+
+    __switch_off = False
+
+    _update_lookup()
+
+# end def
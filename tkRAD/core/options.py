@@ -26,10 +26,22 @@
 
 # lib imports
 
+import io
+
 import re
 
 import os
 
+import stat
+
+import atexit
+
+import weakref
+
+import tempfile
+
+import threading
+
 import os.path as OP
 
 import configparser as CP
@@ -46,6 +58,35 @@ __option_manager = None
 
 
 
+# living instances to flush at exit (weak refs: instances may die)
+# i.e. {id(instance): instance} as mappings are not hashable
+
+_option_managers = weakref.WeakValueDictionary()
+
+
+
+def _flush_all ():
+    r"""
+        flushes pending save_later() changes of all living option
+        managers; registered once at exit;
+
+        no return value (void);
+    """
+
+    for _manager in list(_option_managers.values()):
+
+        _manager.flush()
+
+    # end for
+
+# end def
+
+
+
+atexit.register(_flush_all)
+
+
+
 # service getter
 
 def get_option_manager (**kw):
@@ -72,6 +113,14 @@ def get_option_manager (**kw):
 class OptionManager(CP.ConfigParser):
     r"""
         generic rc configuration file internal options manager;
+
+        save() writes rc file at once, while save_later() only marks
+        options as pending and coalesces all changes made within
+        CONFIG["save_delay"] seconds into a single background write;
+        pending changes get flushed at exit;
+
+        rc files are written atomically (temp file, then rename)
+        and only if options have changed since last load or save;
     """
 
 
@@ -82,6 +131,8 @@ class OptionManager(CP.ConfigParser):
 
         "file": "options.rc",
 
+        "save_delay": 1.0,
+
     } # end of CONFIG
 
 
@@ -103,6 +154,21 @@ class OptionManager(CP.ConfigParser):
 
         CP.ConfigParser.__init__(self)
 
+        # rc file contents as last loaded or saved, pending flag
+        # for save_later() and its timer
+
+        self.__saved_data = None
+
+        self.__pending = False
+
+        self.__timer = None
+
+        self.__lock = threading.Lock()
+
+        # never lose pending changes (see _flush_all())
+
+        _option_managers[id(self)] = self
+
         # member inits
 
         self.set_config_dir(kw.get("rc_dir"))
@@ -119,6 +185,78 @@ class OptionManager(CP.ConfigParser):
 
 
 
+    def _flush_pending (self):
+        r"""
+            protected method def;
+
+            serializes and writes options marked as pending by
+            save_later(), if they have changed since last load or
+            save;
+
+            no return value (void);
+        """
+
+        with self.__lock:
+
+            self.__timer = None
+
+            # nothing pending?
+
+            if not self.__pending:
+
+                return
+
+            # end if
+
+            self.__pending = False
+
+            try:
+
+                _data = self._get_data()
+
+            except RuntimeError:
+
+                # options changed while serializing: retry later
+
+                self.__pending = True
+
+                self._start_timer()
+
+                return
+
+            # end try
+
+            # dirty?
+
+            if _data != self.__saved_data:
+
+                self._write_data(_data)
+
+            # end if
+
+        # end with
+
+    # end def
+
+
+
+    def _get_data (self):
+        r"""
+            protected method def;
+
+            returns rc file contents as a string of chars;
+        """
+
+        _stream = io.StringIO()
+
+        self.write(_stream)
+
+        return _stream.getvalue()
+
+    # end def
+
+
+
     def _get_path (self):
         r"""
             builds path along rc config dir and filename;
@@ -145,6 +283,151 @@ class OptionManager(CP.ConfigParser):
 
 
 
+    def _start_timer (self, delay = None):
+        r"""
+            protected method def;
+
+            starts save_later() background timer, if not already
+            running; caller must hold internal lock;
+
+            no return value (void);
+        """
+
+        if self.__timer is None:
+
+            self.__timer = threading.Timer(
+
+                tools.choose_num(
+
+                    lambda n: n >= 0,
+
+                    delay,
+
+                    self.CONFIG.get("save_delay"),
+                ),
+
+                self._flush_pending
+            )
+
+            self.__timer.daemon = True
+
+            self.__timer.start()
+
+        # end if
+
+    # end def
+
+
+
+    def _write_data (self, data):
+        r"""
+            protected method def;
+
+            atomically writes rc file contents @data (temp file,
+            then rename); caller must hold internal lock;
+
+            no return value (void);
+        """
+
+        _tmp = None
+
+        try:
+
+            # ensure directories do exist
+
+            os.makedirs(self.get_config_dir(), exist_ok = True)
+
+            # write into a temp file first
+
+            (_fd, _tmp) = tempfile.mkstemp(
+
+                dir = self.get_config_dir(), suffix = ".tmp"
+            )
+
+            with os.fdopen(_fd, "w") as _file:
+
+                _file.write(data)
+
+            # end with
+
+            # mkstemp() creates 0600 files: keep RC file's own mode
+            # or apply umask for a new one
+
+            _path = self._get_path()
+
+            if OP.exists(_path):
+
+                _mode = stat.S_IMODE(os.stat(_path).st_mode)
+
+            else:
+
+                _mask = os.umask(0)
+
+                os.umask(_mask)
+
+                _mode = 0o666 & ~_mask
+
+            # end if
+
+            os.chmod(_tmp, _mode)
+
+            # then replace RC file at once
+
+            os.replace(_tmp, _path)
+
+            self.__saved_data = data
+
+        except Exception as e:
+
+            # clean up
+
+            if _tmp and OP.exists(_tmp):
+
+                os.remove(_tmp)
+
+            # end if
+
+            # console warning
+
+            print(
+
+                "[WARNING] could *NOT* save "
+
+                "options configuration file."
+
+                "\nGot the following error:\n" + str(e)
+            )
+
+        # end try
+
+    # end def
+
+
+
+    def flush (self):
+        r"""
+            writes pending changes left by save_later() right now,
+            if any;
+
+            no return value (void);
+        """
+
+        # cancel delayed write
+
+        _timer = self.__timer
+
+        if _timer is not None:
+
+            _timer.cancel()
+
+        # end if
+
+        self._flush_pending()
+
+    # end def
+
+
+
     def get_config_dir (self):
         r"""
             configuration directory getter;
@@ -205,6 +488,14 @@ class OptionManager(CP.ConfigParser):
 
             self.__loaded = tools.is_plist(_success)
 
+            # nothing to save until options change
+
+            if self.__loaded:
+
+                self.__saved_data = self._get_data()
+
+            # end if
+
         # end if
 
         return _success
@@ -232,47 +523,83 @@ class OptionManager(CP.ConfigParser):
 
 
 
+    def is_dirty (self):
+        r"""
+            returns True if options have changed since last load or
+            save, False otherwise;
+        """
+
+        return self._get_data() != self.__saved_data
+
+    # end def
+
+
+
     def save (self):
         r"""
-            saves internal options to a predefined rc file;
+            saves internal options to a predefined rc file right now,
+            if they have changed since last load or save;
+
+            cancels any pending save_later() write;
 
             no return value (void);
         """
 
-        try:
+        # inits
 
-            # get RC file path
+        _data = self._get_data()
 
-            _path = self._get_path()
+        with self.__lock:
 
-            # ensure directories do exist
+            # cancel delayed write
 
-            os.makedirs(self.get_config_dir(), exist_ok = True)
+            if self.__timer is not None:
 
-            # now try to open RC file
+                self.__timer.cancel()
 
-            with open(_path, "w") as _file:
+                self.__timer = None
 
-                # write data
+            # end if
 
-                self.write(_file)
+            self.__pending = False
 
-            # end with
+            # dirty?
 
-        except Exception as e:
+            if _data != self.__saved_data:
 
-            # console warning
+                self._write_data(_data)
 
-            print(
+            # end if
 
-                "[WARNING] could *NOT* save "
+        # end with
 
-                "options configuration file."
+    # end def
 
-                "\nGot the following error:\n" + str(e)
-            )
 
-        # end try
+
+    def save_later (self, delay = None):
+        r"""
+            debounced save: options only get marked as pending, then
+            serialized and written on a background thread after
+            @delay seconds (default: CONFIG["save_delay"]) along with
+            all changes made in the meantime, so that frequent calls
+            cost neither serialization nor disk access;
+
+            nothing gets written if options have not changed since
+            last load or save;
+
+            no return value (void);
+        """
+
+        with self.__lock:
+
+            self.__pending = True
+
+            # start coalescing window
+
+            self._start_timer(delay)
+
+        # end with
 
     # end def
 
@@ -26,6 +26,8 @@
 
 # ====================   /!\ STANDALONE MODULE /!\   ===================
 
+# uses tkRAD/xml/rad_xml_dispatch.py shared dispatcher, if available
+
 
 
 # lib imports
@@ -34,12 +36,40 @@ import re
 
 import traceback
 
+from timeit import default_timer
+
 import xml.etree.ElementTree as ET
 
 import tkinter as TK
 
 from tkinter import messagebox as MB
 
+# shared table-driven XML dispatcher (optional)
+
+try:
+
+    # imported along with tkRAD package
+
+    from ..xml import rad_xml_dispatch as XR
+
+except (ImportError, ValueError, SystemError):
+
+    try:
+
+        # STANDALONE: rad_xml_dispatch.py may lie next to this module
+
+        import rad_xml_dispatch as XR
+
+    except ImportError:
+
+        # STANDALONE: see _Dispatcher below
+
+        XR = None
+
+    # end try
+
+# end try
+
 
 
 # simple widget building function
@@ -143,6 +173,75 @@ def normalize_id (arg):
 
 
 
+class _Dispatcher:
+    r"""
+        minimal local fallback for tkRAD's RADXMLDispatcher, so
+        that this module does not need any other file;
+
+        resolves element builders and attribute parsers of an
+        @owner builder object along its naming rules, only once per
+        XML tag or XML attribute name;
+    """
+
+    def __init__ (self, owner):
+
+        self.owner = owner
+
+        self.members = dict()
+
+    # end def
+
+
+    def get_member (self, pattern, name):
+
+        # already resolved?
+
+        if (pattern, name) not in self.members:
+
+            # XML names come from XML sources: keep table bounded
+
+            if len(self.members) >= 4096:
+
+                self.members.clear()
+
+            # end if
+
+            self.members[(pattern, name)] = getattr(
+
+                self.owner,
+
+                re.sub(
+
+                    r"\W+", r"", pattern.format(xml_tag=name, attr=name)
+                ),
+
+                None
+            )
+
+        # end if
+
+        return self.members[(pattern, name)]
+
+    # end def
+
+
+    def get_attribute_parser (self, xml_attribute):
+
+        return self.get_member(self.owner.ATTRIBUTE_PARSER, xml_attribute)
+
+    # end def
+
+
+    def get_element_builder (self, xml_tag):
+
+        return self.get_member(self.owner.ELEMENT_BUILDER, xml_tag)
+
+    # end def
+
+# end class _Dispatcher
+
+
+
 class Builder (TK.Frame):
     r"""
         /!\ tkRAD.easy.builder is a STANDALONE module /!\
@@ -216,6 +315,12 @@ class Builder (TK.Frame):
 
 
 
+    # specific element builder method pattern def
+
+    ELEMENT_BUILDER = "_build_element_{xml_tag}"
+
+
+
     # object instance (oi) counter def
 
     OI_COUNT = 1
@@ -305,6 +410,18 @@ class Builder (TK.Frame):
 
         self.objects = dict()
 
+        # element builders and attribute parsers dispatcher
+
+        if XR:
+
+            self.dispatcher = XR.RADXMLDispatcher(self)
+
+        else:
+
+            self.dispatcher = _Dispatcher(self)
+
+        # end if
+
     # end def
 
 
@@ -319,75 +436,118 @@ class Builder (TK.Frame):
 
             and a parent tkinter widget;
 
+            specific builders such as _build_element_root() or
+
+            handlers plugged into self.dispatcher (if any) take precedence
+
+            over generic tkinter widget building;
+
             recurse on XML element's children to build them too;
 
             no return value (void);
         """
 
-        # get xml element's tag name
+        # specific element builder?
 
-        _tag = xml_element.tag
-
-        _tagl = _tag.lower()
+        _builder = self.dispatcher.get_element_builder(
 
-        # XML root node?
+            xml_element.tag.lower()
+        )
 
-        if _tagl in ("root", "tkwidget"):
+        if callable(_builder):
 
-            # widget already exists!
-
-            _widget = tk_parent
+            _widget = _builder(xml_element, tk_parent)
 
         # create tkinter widget
 
         else:
 
-            # parse some minimal XML attributes
+            _widget = self._build_widget(xml_element, tk_parent)
 
-            self._parse_xml_attributes(xml_element, tk_parent)
+        # end if
 
-            # XML attribute 'id' is *NOT* a tk config option /!\
+        # search for widget's children
 
-            _id = xml_element.attrib.pop("id", None)
+        for _child in xml_element:
 
-            # search for correct class name
+            # create new child widget
 
-            _classname = self.TK_CLASSES.get(_tagl, _tag)
+            self._build_element(_child, _widget)
 
-            # create widget
+        # end for
 
-            r"""
-                $ 2014-01-25 RS $
-                caution: people may use ttk or PWM
-                do *NOT* prefix {_class} with 'TK.' /!\
-            """
+    # end def
 
-            _widget = eval(
 
-                "{_class}(tk_parent, **xml_element.attrib)"
 
-                .format(_class = _classname)
-            )
+    def _build_element_root (self, xml_element, tk_parent):
+        r"""
+            XML root node: widget already exists!
 
-            # register newly created object by its XML id
+            returns @tk_parent;
+        """
 
-            self._register_object_by_id(_widget, _id)
+        return tk_parent
 
-            # layout inits
+    # end def
 
-            _widget.pack(**self.PACK_OPTIONS)
 
-        # end if
 
-        # search for widget's children
+    # XML root node alias
 
-        for _child in xml_element:
+    _build_element_tkwidget = _build_element_root
 
-            # create new child widget
 
-            self._build_element(_child, _widget)
 
-        # end for
+    def _build_widget (self, xml_element, tk_parent):
+        r"""
+            creates a tkinter widget along XML element's class name
+
+            and a parent tkinter widget;
+
+            returns newly created widget;
+        """
+
+        # get xml element's tag name
+
+        _tag = xml_element.tag
+
+        # parse some minimal XML attributes
+
+        self._parse_xml_attributes(xml_element, tk_parent)
+
+        # XML attribute 'id' is *NOT* a tk config option /!\
+
+        _id = xml_element.attrib.pop("id", None)
+
+        # search for correct class name
+
+        _classname = self.TK_CLASSES.get(_tag.lower(), _tag)
+
+        # create widget
+
+        r"""
+            $ 2014-01-25 RS $
+            caution: people may use ttk or PWM
+            do *NOT* prefix {_class} with 'TK.' /!\
+        """
+
+        _widget = eval(
+
+            "{_class}(tk_parent, **xml_element.attrib)"
+
+            .format(_class = _classname)
+        )
+
+        # register newly created object by its XML id
+
+        self._register_object_by_id(_widget, _id)
+
+        # layout inits
+
+        _widget.pack(**self.PACK_OPTIONS)
+
+        return _widget
 
     # end def
 
@@ -578,18 +738,11 @@ class Builder (TK.Frame):
 
         for (_attr, _value) in _attrs.items():
 
-            # parser init
-
-            _parser = (
-
-                str(self.ATTRIBUTE_PARSER).format(attr = _attr.lower())
-            )
-
             # attribute parsing is OPTIONAL /!\
 
-            _parser = getattr(self, _parser, None)
+            _parser = self.dispatcher.get_attribute_parser(_attr.lower())
 
-            # callable parser?
+            # got parser?
 
             if callable(_parser):
 
@@ -761,6 +914,58 @@ class Builder (TK.Frame):
 
 
 
+def benchmark (widgets = 500, number = 3):
+    r"""
+        XML widget building benchmark;
+
+        builds generated rows of @widgets labels and buttons
+        @number times and prints best time;
+
+        usage (needs a display):
+
+            from tkRAD.easy import builder
+
+            builder.benchmark()
+    """
+
+    # generated XML source
+
+    _xml = "<root>{}</root>".format(
+
+        "".join(
+
+            '<label text="Label {n}"/><button text="OK" id="ok{n}"/>'
+
+            .format(n = _n) for _n in range(widgets // 2)
+        )
+    )
+
+    _root = TK.Tk()
+
+    _timings = list()
+
+    for _i in range(number):
+
+        _start = default_timer()
+
+        _builder = Builder(_root).build(_xml)
+
+        _timings.append(default_timer() - _start)
+
+        _builder.destroy()
+
+    # end for
+
+    _root.destroy()
+
+    print("\nwidgets:     {}".format(widgets))
+
+    print("best build:  {:.1f} ms\n".format(min(_timings) * 1e3))
+
+# end def
+
+
+
 # testing this STANDALONE module
 
 if __name__ == "__main__":
@@ -523,6 +523,28 @@ class RADApplication:
             ),
         )
 
+        _parser.add_argument(
+
+            "--profile-xml",
+
+            nargs = "?",
+
+            const = "table",
+
+            default = None,
+
+            choices = ["table", "json"],
+
+            help = _(
+
+                "records XML build times of element builders and "
+
+                "attribute parsers and dumps them as a table or as "
+
+                "JSON data at exit (default: table)."
+            ),
+        )
+
         # console help asked?
 
         if kw.get("help"):
@@ -549,6 +571,25 @@ class RADApplication:
             )
         )
 
+        # opt-in XML build profiling
+
+        _profile = tools.choose_str(
+
+            kw.get("profile_xml"),
+
+            self.sys_argv.profile_xml,
+        )
+
+        if _profile:
+
+            # lib imports
+
+            from ..xml import rad_xml_profiler as XP
+
+            XP.get_xml_profiler().switch_on(dump_at_exit = _profile)
+
+        # end if
+
         # free some useless memory right now /!\
 
         del AP
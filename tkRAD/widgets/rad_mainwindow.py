@@ -1101,4 +1101,58 @@ class RADMainWindow (RW.RADWidgetBase, TK.Tk):
     # end def
 
 
+
+    def xml_unwatch (self):
+        r"""
+            this is a shortcut for self.mainframe.xml_unwatch();
+
+            no return value (void);
+        """
+
+        if hasattr(self.mainframe, "xml_unwatch"):
+
+            self.mainframe.xml_unwatch()
+
+        # end if
+
+    # end def
+
+
+
+    def xml_watch (self, filename = None, interval = None,
+    silent_mode = False):
+        r"""
+            this is a shortcut for self.mainframe.xml_watch();
+
+            builds mainframe along XML @filename, then patches it
+            each time XML file gets modified (polling every
+            @interval milliseconds);
+
+            returns True on overall success, False, otherwise;
+        """
+
+        if hasattr(self.mainframe, "xml_watch"):
+
+            return self.mainframe.xml_watch(
+
+                filename, interval, silent_mode
+            )
+
+        else:
+
+            raise AttributeError(
+
+                _(
+                    "current mainframe object '{obj_type}' "
+
+                    "does *NOT* support xml_watch() method."
+
+                ).format(obj_type = repr(self.mainframe))
+            )
+
+        # end if
+
+    # end def
+
+
 # end class RADMainWindow
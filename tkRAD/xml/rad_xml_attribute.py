@@ -124,6 +124,12 @@ class RADXMLAttribute:
 
 
 
+    # compact instances: no per-instance __dict__
+
+    __slots__ = ("xml_element", "value", "__attr_name", "__attr_parsed")
+
+
+
     def __init__ (self, xml_element, attr_name, attr_value, parsed=0):
         r"""
             class constructor;
@@ -134,8 +140,17 @@ class RADXMLAttribute:
         self.xml_element = xml_element
 
         # attribute name - MUST be a plain string of chars
+        # same as self.name = attr_name without property overhead
+
+        if attr_name and isinstance(attr_name, str):
 
-        self.name = attr_name
+            self.__attr_name = attr_name
+
+        else:
+
+            self.name = attr_name
+
+        # end if
 
         # attribute value - can be anything
 
@@ -143,7 +158,15 @@ class RADXMLAttribute:
 
         # nb of times this attribute has been parsed
 
-        self.parsed = parsed
+        if parsed:
+
+            self.parsed = parsed
+
+        else:
+
+            self.__attr_parsed = 0
+
+        # end if
 
     # end def
 
@@ -26,6 +26,12 @@
 
 # lib imports
 
+import sys
+
+import timeit
+
+import xml.etree.ElementTree as ET
+
 from ..core import struct_dict as SD
 
 from . import rad_xml_attribute as XA
@@ -37,30 +43,271 @@ class RADXMLAttributesDict (SD.StructDict):
         StructDict subclass for commodity;
 
         handles support for RADXMLAttribute items;
+
+        raw XML attribute values are only wrapped into
+        RADXMLAttribute items when get_item() is called for them
+        (e.g. by attribute parsers);
+
+        item value get / set have a direct fast path for
+        RADXMLAttribute items;
     """
 
 
 
-    def __init__ (self, *args, **kw):
+    # StructDict defaults as class members
+    # no per-instance property calls
+
+    item_type = XA.RADXMLAttribute
+
+    _StructDict__item_value_getter = "get_value"
+
+    _StructDict__item_value_setter = "set_value"
+
+
+
+    def __getitem__ (self, key):
+        r"""
+            item value getter;
+        """
+
+        _item = dict.__getitem__(self, key)
+
+        if isinstance(_item, XA.RADXMLAttribute):
+
+            return _item.value
+
+        # end if
+
+        return _item
+
+    # end def
+
+
+
+    def __init__ (self, *args, xml_element = None, **kw):
         r"""
             class constructor;
 
-            implements @item_type = RADXMLAttribute;
+            @xml_element param is the official XML parent element of
+            attrs, for later RADXMLAttribute wrapping;
         """
 
-        # super class inits
+        # super class inits - *NOT* StructDict's
 
-        super().__init__(*args, **kw)
+        dict.__init__(self, *args, **kw)
 
         # member inits
 
-        self.item_type = XA.RADXMLAttribute
+        self.xml_element = xml_element
+
+    # end def
+
+
+
+    def __iter__ (self):
+        r"""
+            iterates on keys, as dict() does;
+
+            defining this forces func(**attrs) and str.format(**attrs)
+            to use __getitem__() i.e. to get item values instead of
+            RADXMLAttribute items;
+        """
+
+        return dict.__iter__(self)
+
+    # end def
+
+
+
+    def __setitem__ (self, key, value):
+        r"""
+            item value setter;
+        """
+
+        _item = dict.get(self, key)
+
+        if isinstance(_item, XA.RADXMLAttribute):
+
+            _item.value = value
+
+        else:
+
+            dict.__setitem__(self, key, value)
+
+        # end if
+
+    # end def
+
+
+
+    def flatten (self):
+        r"""
+            returns a new dict() of item.value instead of item itself;
+
+            keeps current items() UNTOUCHED;
+        """
+
+        return {
+
+            _key: (
+
+                _item.value if isinstance(_item, XA.RADXMLAttribute)
+
+                else _item
+            )
+
+            for (_key, _item) in dict.items(self)
+        }
+
+    # end def
+
+
+
+    def get (self, key, default = None):
+        r"""
+            item value getter;
+        """
+
+        _item = dict.get(self, key, default)
+
+        if isinstance(_item, XA.RADXMLAttribute):
 
-        self.item_value_getter = "get_value"
+            return _item.value
 
-        self.item_value_setter = "set_value"
+        # end if
+
+        return _item
 
     # end def
 
 
+
+    def get_item (self, key, default = None):
+        r"""
+            returns RADXMLAttribute item along @key, wrapping raw
+            value on first access;
+
+            returns @default if @key does not exist in dict;
+        """
+
+        if key not in self:
+
+            return default
+
+        # end if
+
+        _item = dict.__getitem__(self, key)
+
+        if not isinstance(_item, XA.RADXMLAttribute):
+
+            _item = XA.RADXMLAttribute(self.xml_element, key, _item)
+
+            dict.__setitem__(self, key, _item)
+
+        # end if
+
+        return _item
+
+    # end def
+
 # end class RADXMLAttributesDict
+
+
+
+def benchmark (number = 20000):
+    r"""
+        attribute parsing per element microbenchmark;
+
+        compares eager wrapping into StructDict (as done up to
+        tkRAD v1.4.1) with lazy wrapping into RADXMLAttributesDict;
+
+        a typical element gets 10 attrs, 6 of them touched by a
+        parser, then flattened;
+    """
+
+    _element = ET.Element(
+
+        "button",
+
+        {
+
+            "id": "ok", "text": "OK", "command": "@OKClicked",
+            "layout": "pack", "layout_options": "side='left'",
+            "resizable": "no", "relief": "flat", "bd": "1",
+            "font": "sans 10", "state": "normal",
+        },
+    )
+
+    _parsed = ("id", "text", "command", "layout", "relief", "font")
+
+    def _before ():
+
+        _attrs = SD.StructDict(XA.reset_attributes(_element))
+
+        _attrs.item_type = XA.RADXMLAttribute
+
+        for (_name, _attribute) in _attrs.items():
+
+            if _name in _parsed:
+
+                _attribute.value = _attribute.value
+
+                _attribute.parsed = True
+
+            # end if
+
+        # end for
+
+        return _attrs.flatten()
+
+    # end def
+
+    def _after ():
+
+        _attrs = RADXMLAttributesDict(
+
+            _element.attrib, xml_element = _element
+        )
+
+        for _name in _attrs:
+
+            if _name in _parsed:
+
+                _attribute = _attrs.get_item(_name)
+
+                _attribute.value = _attribute.value
+
+                _attribute.parsed = True
+
+            # end if
+
+        # end for
+
+        return _attrs.flatten()
+
+    # end def
+
+    assert _before() == _after()
+
+    for (_label, _func) in (("before", _before), ("after", _after)):
+
+        _time = min(timeit.repeat(_func, number = number, repeat = 3))
+
+        print(
+
+            "{}: {:.2f} us per element"
+
+            .format(_label, _time / number * 1e6)
+        )
+
+    # end for
+
+# end def
+
+
+
+if __name__ == "__main__":
+
+    benchmark(*map(int, sys.argv[1:]))
+
+# end if
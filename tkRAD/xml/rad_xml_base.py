@@ -26,12 +26,16 @@
 
 # lib imports
 
+import io
+
 import re
 
 import os.path as OP
 
 import traceback
 
+import weakref
+
 import xml.etree.ElementTree as ET
 
 import tkinter as TK
@@ -50,6 +54,12 @@ from . import rad_xml_attribute as XA
 
 from . import rad_xml_attributes_dict as XD
 
+from . import rad_xml_cache as XC
+
+from . import rad_xml_dispatch as XR
+
+from . import rad_xml_profiler as XP
+
 
 
 class RADXMLBase (RW.RADWidgetBase):
@@ -102,6 +112,15 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    # root elements integrating their children directly into
+    # tk_owner, along with their accepted child elements
+    # see xml_stream_build()
+    # should be overridden in subclass
+
+    STREAM_ROOTS = dict()
+
+
+
     # should be overridden in subclass
 
     XML_RC = {
@@ -116,12 +135,48 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    # generic attribute supports wrapped by build profiler
+    # see _profile_members()
+
+    PROFILED_MEMBERS = re.compile(r"_tkRAD_\w+_support\Z")
+
+
+
     # Object instance counter
 
     __OI_COUNT = 1
 
 
 
+    # process-wide tables of parsed attribute values
+    # i.e. {raw_path: path}
+    # see clear_value_cache()
+
+    _bitmap_paths = dict()
+
+    _image_paths = dict()
+
+    # per tkinter interpreter tables of shared images
+    # i.e. {tk_root: {path: image}}
+    # shared images are READ-ONLY (see set_image())
+    # see _get_root_table()
+
+    _images = weakref.WeakKeyDictionary()
+
+    # shared images reference counts and owners
+    # i.e. {tk_root: {image_name: path}},
+    # {tk_root: {image_name: count}} and
+    # {tk_root: {image_name: tk_path}}
+    # see _track_resources()
+
+    _image_names = weakref.WeakKeyDictionary()
+
+    _image_refs = weakref.WeakKeyDictionary()
+
+    _image_owners = weakref.WeakKeyDictionary()
+
+
+
     def __init__ (self, tk_owner = None, **kw):
         r"""
             class constructor;
@@ -137,7 +192,53 @@ class RADXMLBase (RW.RADWidgetBase):
 
         self.__objects = dict()
 
-        self.__images = dict()
+        # per-radix unique id counters i.e. {radix: next_count}
+
+        self.__id_counters = dict()
+
+        # registered tkinter objects along their tk path names
+        # i.e. {tk_path: [ids]} and {tk_path: [member names]}
+        # see _unregister_subtree()
+
+        self.__path_ids = dict()
+
+        self.__path_members = dict()
+
+        # control vars and images used by tkinter objects
+        # i.e. {tk_path: [(kind, name)]}, {cvar_name: count},
+        # {cvar_name: (vartype, varname)} and {cvar_name: tk_path}
+
+        self.__path_resources = dict()
+
+        self.__cvar_refs = dict()
+
+        self.__cvar_names = dict()
+
+        self.__cvar_owners = dict()
+
+        # control vars and images created since last tracking
+        # i.e. {name}
+        # see _track_resources()
+
+        self.__new_resources = set()
+
+        # table-driven builders and parsers dispatcher
+
+        self.__dispatcher = XR.RADXMLDispatcher(self)
+
+        # XML tree index: id --> element and element --> parent
+        # spliced subtrees i.e. [(xml_parent, xml_root)]
+        # see clear_xml_index()
+
+        self.__index_root = None
+
+        self.__index_ids = dict()
+
+        self.__index_parents = dict()
+
+        self.__index_splices = list()
+
+        self.__index_stale = False
 
         self.set_xml_dir(kw.get("xml_dir"))
 
@@ -165,6 +266,14 @@ class RADXMLBase (RW.RADWidgetBase):
 
         }
 
+        # opt-in build profiling
+
+        if XP.get_xml_profiler().is_enabled():
+
+            self._profile_members()
+
+        # end if
+
         # super class inits
 
         RW.RADWidgetBase.__init__(self, tk_owner, **kw)
@@ -232,18 +341,14 @@ class RADXMLBase (RW.RADWidgetBase):
 
         _tag = self.normalize_tag(xml_element)
 
-        _elt_builder = tools.normalize_id(
+        _elt_builder = self._get_dispatch_method(
 
-            str(self.ELEMENT_BUILDER).format(xml_element = _tag)
+            self.ELEMENT_BUILDER, _tag
         )
 
         # supported XML tag?
 
-        if hasattr(self, _elt_builder):
-
-            # real member inits
-
-            _elt_builder = getattr(self, _elt_builder)
+        if _elt_builder is not None:
 
             # try to call builder
 
@@ -287,6 +392,56 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def _build_xml_tree (self, filename = None):
+        r"""
+            protected method def;
+
+            loads XML tree along @filename, if necessary, then
+            builds widgets from its root element (see xml_build());
+
+            exceptions are left to xml_build() error handling;
+
+            this could be overridden in subclass;
+
+            returns True on overall success, False, otherwise;
+        """
+
+        # verify XML tree before processing
+
+        if tools.is_pstr(filename) or not self.is_tree(self.__xml_tree):
+
+            # try to load once
+
+            self.xml_load(filename)
+
+        # end if
+
+        # cast root element
+
+        _root = self.__xml_tree.getroot()
+
+        if self._cast_root_element(_root):
+
+            # start XML widget building
+
+            _build_ok = self._build_element(_root, self.tk_owner)
+
+            # flush all deferred actions in queue
+
+            self._flush_deferred()
+
+            # return building results
+
+            return _build_ok
+
+        # end if
+
+        return False
+
+    # end def
+
+
+
     def _cast_root_element (self, xml_element):
         r"""
             casts root element along self.DOCTYPE type;
@@ -321,6 +476,63 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def _flush_deferred (self):
+        r"""
+            protected method def;
+
+            flushes all deferred actions in queue once XML elements
+            have been built;
+
+            this could be overridden in subclass;
+
+            no return value (void);
+        """
+
+        self._queue.flush_all()
+
+    # end def
+
+
+
+    def _get_dispatch_method (self, pattern, xml_tag,
+    xml_attribute = None):
+        r"""
+            retrieves element builder or attribute parser member
+            along @pattern naming rule (e.g. self.ELEMENT_BUILDER)
+            for @xml_tag and optional @xml_attribute names;
+
+            bound members are resolved only once per instance;
+
+            returns member on success, None if not implemented;
+        """
+
+        return self.__dispatcher.get_member(
+
+            pattern, xml_tag, xml_attribute
+        )
+
+    # end def
+
+
+
+    def _get_dispatch_name (self, pattern, xml_tag,
+    xml_attribute = None):
+        r"""
+            builds element builder or attribute parser method name
+            along @pattern naming rule (e.g. self.ELEMENT_BUILDER)
+            for @xml_tag and optional @xml_attribute names;
+
+            method names are resolved only once per class;
+
+            returns method name as a plain string of chars;
+        """
+
+        return self.__dispatcher.get_name(pattern, xml_tag, xml_attribute)
+
+    # end def
+
+
+
     def _get_object_id (self, built_object, attr_id = None):
         r"""
             protected method def;
@@ -376,11 +588,79 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def _get_root_table (self, table):
+        r"""
+            protected method def;
+
+            retrieves current tkinter interpreter's own dict() from
+            per interpreter @table (see _get_tk_root());
+
+            tkinter objects such as images or named fonts belong to
+            the interpreter that created them and cannot be shared
+            between several tkinter roots;
+
+            returns a new unshared dict() if there is no tkinter root
+            yet;
+        """
+
+        # inits
+
+        _root = self._get_tk_root()
+
+        if _root is None:
+
+            return dict()
+
+        # end if
+
+        return table.setdefault(_root, dict())
+
+    # end def
+
+
+
+    def _get_tk_root (self):
+        r"""
+            protected method def;
+
+            retrieves tkinter root object (TK.Tk) of current tkinter
+            interpreter i.e. self.tk_owner's root or tkinter's
+            default root, if any;
+
+            returns tkinter root object, None otherwise;
+        """
+
+        # inits
+
+        _root = self.tk_owner
+
+        if not isinstance(_root, TK.Misc):
+
+            _root = TK._default_root
+
+        # end if
+
+        if _root is None:
+
+            return None
+
+        # end if
+
+        return _root._root()
+
+    # end def
+
+
+
     def _get_unique_id (self, radix):
         r"""
             tries to find a new and unique indexed 'id' name along
             @radix param name;
 
+            each radix gets its own counter, so that finding a new
+            'id' name does not depend on the number of registered
+            objects;
+
             returns new unique 'id' name on success, None otherwise;
         """
 
@@ -388,23 +668,25 @@ class RADXMLBase (RW.RADWidgetBase):
 
         if tools.is_pstr(radix):
 
-            # this prevents from counting overflow /!\
+            # inits
+
+            _key = radix.lower()
 
-            while self.__OI_COUNT:
+            _count = self.__id_counters.get(_key, self.__OI_COUNT)
 
-                # set new indexed 'id' name
+            # skip explicit 'id' names e.g. id="label1"
 
-                _uid = radix + self._get_oi_count_str()
+            while _key + str(_count) in self.__objects:
 
-                # got unique 'id' name?
+                _count += 1
 
-                if _uid not in self.__objects:
+            # end while
 
-                    return _uid
+            # update radix counter
 
-                # end if
+            self.__id_counters[_key] = _count + 1
 
-            # end while
+            return radix + str(_count)
 
         # end if
 
@@ -414,6 +696,134 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def _get_xml_index (self):
+        r"""
+            protected method def;
+
+            (re)builds XML tree index along internal XML tree, if
+            necessary;
+
+            index is built once per loaded XML tree and maps 'id'
+            attrs to elements and elements to their parents; it is
+            built again after clear_xml_index() calls, spliced
+            subtrees included (see _splice_subtree());
+
+            returns (ids, parents) pair of dict() objects;
+        """
+
+        # XML root element inits
+
+        _root = None
+
+        if self.is_tree(self.__xml_tree):
+
+            _root = self.__xml_tree.getroot()
+
+        # end if
+
+        # XML tree has changed?
+
+        if _root is not self.__index_root:
+
+            self.__index_root = _root
+
+            self.__index_splices = list()
+
+            self.__index_stale = True
+
+        # end if
+
+        # (re)build index
+
+        if self.__index_stale:
+
+            self.__index_stale = False
+
+            self.__index_ids = dict()
+
+            self.__index_parents = dict()
+
+            # XPath './/*' semantics: root element is *NOT* indexed
+
+            if self.is_element(_root):
+
+                for _xml_child in _root:
+
+                    self._index_subtree(_xml_child, _root)
+
+                # end for
+
+            # end if
+
+            # spliced subtrees, as long as they are still attached
+
+            for _xml_parent, _xml_root in self.__index_splices:
+
+                if _xml_parent in self.__index_parents:
+
+                    for _xml_child in _xml_root:
+
+                        self._index_subtree(_xml_child, _xml_parent)
+
+                    # end for
+
+                # end if
+
+            # end for
+
+        # end if
+
+        return (self.__index_ids, self.__index_parents)
+
+    # end def
+
+
+
+    def _index_subtree (self, xml_element, xml_parent):
+        r"""
+            protected method def;
+
+            adds @xml_element and all its subelements to XML tree
+            index with @xml_parent as parent of @xml_element;
+
+            first element in document order wins on duplicate ids,
+            as with XPath;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _ids = self.__index_ids
+
+        _parents = self.__index_parents
+
+        _parents[xml_element] = xml_parent
+
+        # loop on subtree elements (document order)
+
+        for _xml_element in xml_element.iter():
+
+            _id = _xml_element.get("id")
+
+            if _id:
+
+                _ids.setdefault(_id, _xml_element)
+
+            # end if
+
+            for _xml_child in _xml_element:
+
+                _parents[_xml_child] = _xml_element
+
+            # end for
+
+        # end for
+
+    # end def
+
+
+
     def _loop_on_children (self, xml_element, tk_parent, accept = None):
         r"""
             loops on @xml_element param XML subelements with
@@ -532,48 +942,43 @@ class RADXMLBase (RW.RADWidgetBase):
                 work with RADXMLAttributesDict by now;
 
                 notice:
-                XA.reset_attributes() provides dict() shallow copy;
+                RADXMLAttributesDict() provides dict() shallow copy
+                and wraps values into RADXMLAttribute objects only
+                when a parser gets them;
             """
 
             _attrs = XD.RADXMLAttributesDict(
 
-                XA.reset_attributes(_attrs, xml_element)
+                _attrs, xml_element = xml_element
             )
 
-            # loop on RADXMLAttribute attributes list
+            # loop on XML attribute names
 
-            for (_attr_name, _attr_object) in _attrs.items():
+            for _attr_key in tuple(_attrs):
 
                 # normalize attribute
 
-                _attr_name = str(_attr_name).lower()
+                _attr_name = str(_attr_key).lower()
 
                 # attribute specific parser
 
-                _parser = tools.normalize_id(
-
-                    str(self.ATTRIBUTE_PARSER)
-
-                    .format(
+                _parser = self._get_dispatch_method(
 
-                        xml_element = _tag,
-
-                        xml_attribute = _attr_name,
-                    )
+                    self.ATTRIBUTE_PARSER, _tag, _attr_name
                 )
 
                 # optional parser
 
-                if hasattr(self, _parser):
-
-                    # real member inits
-
-                    _parser = getattr(self, _parser)
+                if _parser is not None:
 
                     # try to call specific parser
 
                     if callable(_parser):
 
+                        # wrap attribute on demand
+
+                        _attr_object = _attrs.get_item(_attr_key)
+
                         # update keywords
 
                         kw.update(
@@ -627,10 +1032,16 @@ class RADXMLBase (RW.RADWidgetBase):
 
                             "'{parser}()' is *NOT* implemented."
 
-                        ).format(parser = _parser)
-                    )
+                        ).format(
 
-                # end if
+                            parser = self._get_dispatch_name(
+
+                                self.ATTRIBUTE_PARSER, _tag, _attr_name
+                            )
+                        )
+                    )
+
+                # end if
 
             # end for
 
@@ -662,6 +1073,82 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def _pin_resource (self, kind, resource):
+        r"""
+            protected method def;
+
+            control vars and images looked up through public getters
+            may get used anywhere else: @resource of @kind ("cvar"
+            or "image") will never be released along with a subtree
+            (see _release_resources());
+
+            returns @resource as is;
+        """
+
+        # inits
+
+        if kind == "image":
+
+            _owners = self._get_root_table(self._image_owners)
+
+        else:
+
+            _owners = self.__cvar_owners
+
+        # end if
+
+        if resource is not None:
+
+            _owners.pop(str(resource), None)
+
+        # end if
+
+        return resource
+
+    # end def
+
+
+
+    def _profile_members (self):
+        r"""
+            protected method def;
+
+            wraps generic attribute supports of this instance (i.e.
+            members named along self.PROFILED_MEMBERS) into build
+            profiler timing recorders;
+
+            element builders and attribute parsers are wrapped on
+            their own by _get_dispatch_method();
+
+            no return value (void);
+        """
+
+        # inits
+
+        _profiler = XP.get_xml_profiler()
+
+        for _name in dir(self.__class__):
+
+            if self.PROFILED_MEMBERS.match(_name):
+
+                _member = getattr(self, _name)
+
+                if callable(_member):
+
+                    # instance member shadows class one
+
+                    setattr(self, _name, _profiler.wrap(_member))
+
+                # end if
+
+            # end if
+
+        # end for
+
+    # end def
+
+
+
     def _register_object_by_id (self, built_object, attr_id):
         r"""
             registers newly created or existing object with the  XML
@@ -678,6 +1165,18 @@ class RADXMLBase (RW.RADWidgetBase):
 
             self.__objects[_id] = built_object
 
+            # tkinter objects can be unregistered by subtree
+
+            if isinstance(built_object, TK.Misc):
+
+                self.__path_ids.setdefault(
+
+                    str(built_object), list()
+
+                ).append(_id)
+
+            # end if
+
         else:
 
             raise KeyError(
@@ -694,12 +1193,97 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def _release_resources (self, tk_path):
+        r"""
+            protected method def;
+
+            releases control vars and images tracked for tkinter
+            object of @tk_path path name (see _track_resources());
+
+            only resources created for the tracked tkinter objects
+            themselves are released, once none of them uses them
+            any more; resources created otherwise or looked up
+            through public getters (see _pin_resource()) are kept;
+
+            no return value (void);
+        """
+
+        for _kind, _name in self.__path_resources.pop(tk_path, ()):
+
+            # inits
+
+            if _kind == "image":
+
+                _refs = self._get_root_table(self._image_refs)
+
+                _owners = self._get_root_table(self._image_owners)
+
+            else:
+
+                _refs = self.__cvar_refs
+
+                _owners = self.__cvar_owners
+
+            # end if
+
+            _count = _refs.get(_name, 0) - 1
+
+            # still in use?
+
+            if _count > 0:
+
+                _refs[_name] = _count
+
+                continue
+
+            # end if
+
+            _refs.pop(_name, None)
+
+            # not created by tracked objects or looked up elsewhere?
+
+            if _owners.pop(_name, None) is None:
+
+                continue
+
+            # end if
+
+            # free resource
+
+            if _kind == "image":
+
+                self._get_root_table(self._images).pop(
+
+                    self._get_root_table(self._image_names).pop(_name, None),
+
+                    None
+                )
+
+            else:
+
+                (_vartype, _varname) = self.__cvar_names.pop(
+
+                    _name, (None, None)
+                )
+
+                self.__tk_variables.get(_vartype, {}).pop(_varname, None)
+
+            # end if
+
+        # end for
+
+    # end def
+
+
+
     def _reset_oi_count (self, value = 1):
         r"""
             resets object instance (oi) counter to a given value;
 
             default value (if not given) is one (1);
 
+            all per-radix unique id counters restart from there;
+
             no return value (void);
         """
 
@@ -707,6 +1291,8 @@ class RADXMLBase (RW.RADWidgetBase):
 
         self.__OI_COUNT = max(1, tools.ensure_int(value))
 
+        self.__id_counters.clear()
+
     # end def
 
 
@@ -746,6 +1332,18 @@ class RADXMLBase (RW.RADWidgetBase):
 
                 setattr(self.tk_owner, name, widget)
 
+                # tkinter objects can be unregistered by subtree
+
+                if isinstance(widget, TK.Misc):
+
+                    self.__path_members.setdefault(
+
+                        str(widget), list()
+
+                    ).append(name)
+
+                # end if
+
             # end if
 
         # end if
@@ -754,6 +1352,222 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def _splice_subtree (self, xml_parent, xml_root):
+        r"""
+            protected method def;
+
+            registers @xml_root children (e.g. an included XML tree)
+            as logical children of @xml_parent in XML tree index;
+
+            internal XML tree structure remains untouched;
+
+            no return value (void);
+        """
+
+        # ensure index is built for current XML tree
+
+        self._get_xml_index()
+
+        if self.cast_element(xml_root):
+
+            # keep it for index rebuilds
+
+            self.__index_splices.append((xml_parent, xml_root))
+
+            for _xml_child in xml_root:
+
+                self._index_subtree(_xml_child, xml_parent)
+
+            # end for
+
+        # end if
+
+    # end def
+
+
+
+    def _track_resources (self, widget, config):
+        r"""
+            protected method def;
+
+            keeps track of control vars and images used by tkinter
+            @widget along its @config dict() of options, so that
+            they can be released with @widget's subtree (see
+            destroy_subtree());
+
+            only resources newly created for @widget's own options
+            become owned by @widget; resources created for anything
+            else (e.g. notebook tab options) are never released;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _path = str(widget)
+
+        _new, self.__new_resources = self.__new_resources, set()
+
+        for _value in config.values():
+
+            if isinstance(_value, TK.Variable):
+
+                _kind = "cvar"
+
+                _refs = self.__cvar_refs
+
+                _owners = self.__cvar_owners
+
+            elif isinstance(_value, TK.Image):
+
+                _kind = "image"
+
+                _refs = self._get_root_table(self._image_refs)
+
+                _owners = self._get_root_table(self._image_owners)
+
+            else:
+
+                continue
+
+            # end if
+
+            _name = str(_value)
+
+            _refs[_name] = _refs.get(_name, 0) + 1
+
+            if _name in _new:
+
+                _owners[_name] = _path
+
+                _new.discard(_name)
+
+            # end if
+
+            self.__path_resources.setdefault(_path, list()).append(
+
+                (_kind, _name)
+            )
+
+        # end for
+
+    # end def
+
+
+
+    def _unregister_object_by_id (self, attr_id):
+        r"""
+            unregisters object previously registered with XML
+            attribute 'id' @attr_id;
+
+            this is the counterpart of _register_object_by_id();
+
+            returns unregistered object or None if not found;
+        """
+
+        # inits
+
+        _id = tools.normalize_id(attr_id).lower()
+
+        _object = self.__objects.pop(_id, None)
+
+        # keep tk path index up-to-date
+
+        if isinstance(_object, TK.Misc):
+
+            _ids = self.__path_ids.get(str(_object), ())
+
+            if _id in _ids:
+
+                _ids.remove(_id)
+
+            # end if
+
+            if not _ids:
+
+                self.__path_ids.pop(str(_object), None)
+
+            # end if
+
+        # end if
+
+        return _object
+
+    # end def
+
+
+
+    def _unregister_subtree (self, tk_widget):
+        r"""
+            unregisters @tk_widget and all its tkinter descendants
+            in one pass, along with the class members set up for
+            them (see _set_class_member()) and the control vars and
+            images they were the last ones to use (see
+            _track_resources());
+
+            this must be called *BEFORE* destroying @tk_widget, as
+            tkinter forgets about children on destroy();
+
+            costs are proportional to subtree size, not to the
+            number of registered objects;
+
+            returns number of unregistered objects;
+        """
+
+        # inits
+
+        _count = 0
+
+        _stack = [tk_widget]
+
+        while _stack:
+
+            _widget = _stack.pop()
+
+            _path = str(_widget)
+
+            # registered objects
+
+            for _id in self.__path_ids.pop(_path, ()):
+
+                if self.__objects.get(_id) is _widget:
+
+                    del self.__objects[_id]
+
+                    _count += 1
+
+                # end if
+
+            # end for
+
+            # control vars and images
+
+            self._release_resources(_path)
+
+            # class members
+
+            for _name in self.__path_members.pop(_path, ()):
+
+                if getattr(self.tk_owner, _name, None) is _widget:
+
+                    delattr(self.tk_owner, _name)
+
+                # end if
+
+            # end for
+
+            # tkinter children
+
+            _stack.extend(getattr(_widget, "children", {}).values())
+
+        # end while
+
+        return _count
+
+    # end def
+
+
+
     def cast_element (self, xml_element):
         r"""
             casts @xml_element param to see if it is a real
@@ -832,6 +1646,91 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def clear_xml_index (self):
+        r"""
+            forgets XML tree index (see get_element_by_id() and
+            get_element_parent()), so that it gets built again on
+            next lookup;
+
+            must be called after editing internal XML tree in place
+            e.g. adding, removing or moving elements or changing
+            their 'id' attributes;
+
+            no return value (void);
+        """
+
+        self.__index_stale = True
+
+    # end def
+
+
+
+    def clear_value_cache (self):
+        r"""
+            forgets all application-wide parsed attribute values
+            (resolved paths, shared images) e.g. on theme switching;
+
+            shared images still displayed by some tkinter objects
+            are kept, as tkinter would blank them out otherwise;
+
+            no return value (void);
+        """
+
+        self._bitmap_paths.clear()
+
+        self._image_paths.clear()
+
+        # inits
+
+        _root = self._get_tk_root()
+
+        _images = self._get_root_table(self._images)
+
+        _names = self._get_root_table(self._image_names)
+
+        _refs = self._get_root_table(self._image_refs)
+
+        _owners = self._get_root_table(self._image_owners)
+
+        for _path, _image in tuple(_images.items()):
+
+            _name = str(_image)
+
+            # still displayed?
+
+            try:
+
+                if _root.tk.getboolean(
+
+                        _root.tk.call("image", "inuse", _name)
+                ):
+
+                    continue
+
+                # end if
+
+            except TK.TclError:
+
+                pass
+
+            # end try
+
+            # free unreferenced image
+
+            del _images[_path]
+
+            _names.pop(_name, None)
+
+            _refs.pop(_name, None)
+
+            _owners.pop(_name, None)
+
+        # end for
+
+    # end def
+
+
+
     def delete_dict_items (self, dict_object, *args):
         r"""
             @DEPRECATED: use tools.dict_delete_items() instead;
@@ -840,14 +1739,66 @@ class RADXMLBase (RW.RADWidgetBase):
 
             shallow copy: keeps original dict() object UNTOUCHED /!\
 
-            returns new modified dict() object;
-        """
+            returns new modified dict() object;
+        """
+
+        # $ 2014-02-18 RS $
+        # @DEPRECATED
+        # kept for compatibility with tkRAD < v1.2
+
+        return tools.dict_delete_items(dict_object, *args)
+
+    # end def
+
+
+
+    def destroy_subtree (self, element_or_widget):
+        r"""
+            tears down a built subtree for real: unregisters object
+            ids and class members, releases control vars and images
+            created for it and no longer in use, then destroys
+            tkinter widgets;
+
+            @element_or_widget param can either be a tkinter widget
+            or an XML element whose 'id' attribute refers to a
+            registered tkinter widget;
+
+            the XML tree itself remains untouched;
+
+            returns True on success, False otherwise;
+        """
+
+        # inits
+
+        _widget = element_or_widget
+
+        # XML element?
+
+        if self.is_element(_widget):
+
+            _widget = self.get_object_by_id(_widget.get("id"))
+
+        # end if
+
+        # param controls
+
+        if isinstance(_widget, TK.Misc):
+
+            # unregister before destroying (tkinter forgets children)
+
+            self._unregister_subtree(_widget)
+
+            _widget.destroy()
+
+            # succeeded
+
+            return True
+
+        # end if
 
-        # $ 2014-02-18 RS $
-        # @DEPRECATED
-        # kept for compatibility with tkRAD < v1.2
+        # failed
 
-        return tools.dict_delete_items(dict_object, *args)
+        return False
 
     # end def
 
@@ -868,12 +1819,34 @@ class RADXMLBase (RW.RADWidgetBase):
 
             # inits
 
-            _id = self.get_correct_id(xml_element.get("id"))
+            _old_id = xml_element.get("id")
+
+            _id = self.get_correct_id(_old_id)
 
             # update XML element attr 'id'
 
             xml_element.set("id", _id)
 
+            # keep XML tree index up-to-date
+
+            _ids, _parents = self._get_xml_index()
+
+            if xml_element in _parents:
+
+                # former id may now refer to another element
+
+                if _old_id and _old_id != _id:
+
+                    self.clear_xml_index()
+
+                else:
+
+                    _ids.setdefault(_id, xml_element)
+
+                # end if
+
+            # end if
+
             # succeeded
 
             return _id
@@ -892,9 +1865,23 @@ class RADXMLBase (RW.RADWidgetBase):
         r"""
             tries to retrieve a bitmap path along @path;
 
+            paths are resolved only once per raw @path value;
+
             returns path on success, empty string otherwise;
         """
 
+        # already resolved?
+
+        try:
+
+            return self._bitmap_paths[path]
+
+        except (KeyError, TypeError):
+
+            pass
+
+        # end try
+
         # $ 2014-02-07 RS $
         # CAUTION:
         # do *NOT* use TK.BitmapImage() /!\
@@ -902,15 +1889,25 @@ class RADXMLBase (RW.RADWidgetBase):
 
         # param inits
 
+        _path = path
+
         if tools.is_pstr(path) and path not in ("error", "gray75",
         "gray50", "gray25", "gray12", "hourglass", "info",
         "questhead", "question", "warning"):
 
-            path = "@" + P.normalize(path.lstrip("@"))
+            _path = "@" + P.normalize(path.lstrip("@"))
+
+        # end if
+
+        # keep it for further calls
+
+        if tools.is_pstr(path):
+
+            self._bitmap_paths[path] = _path
 
         # end if
 
-        return path
+        return _path
 
     # end def
 
@@ -966,7 +1963,10 @@ class RADXMLBase (RW.RADWidgetBase):
 
         if vartype in self.__tk_variables:
 
-            return self.__tk_variables[vartype].get(varname, None)
+            return self._pin_resource(
+
+                "cvar", self.__tk_variables[vartype].get(varname, None)
+            )
 
         else:
 
@@ -1002,6 +2002,24 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def get_dispatcher (self):
+        r"""
+            returns RADXMLDispatcher() object of this builder;
+
+            allows to plug specific element builders and attribute
+            parsers without subclassing e.g.
+
+                builder.get_dispatcher().set_element_builder(
+                    "mytag", my_builder
+                )
+        """
+
+        return self.__dispatcher
+
+    # end def
+
+
+
     def get_doublevar (self, varname):
         r"""
             tries to retrieve a tkinter.DoubleVar() named @varname;
@@ -1009,7 +2027,10 @@ class RADXMLBase (RW.RADWidgetBase):
             returns control variable on success, None otherwise;
         """
 
-        return self.__tk_variables["doublevar"].get(varname, None)
+        return self._pin_resource(
+
+            "cvar", self.__tk_variables["doublevar"].get(varname, None)
+        )
 
     # end def
 
@@ -1046,11 +2067,11 @@ class RADXMLBase (RW.RADWidgetBase):
 
         if tools.is_pstr(attr_id):
 
-            # param controls
+            # internal XML tree: indexed lookup
 
-            if not self.is_tree(xml_tree):
+            if not self.is_tree(xml_tree) or xml_tree is self.__xml_tree:
 
-                xml_tree = self.__xml_tree
+                return self._get_xml_index()[0].get(attr_id)
 
             # end if
 
@@ -1069,15 +2090,81 @@ class RADXMLBase (RW.RADWidgetBase):
 
 
 
+    def get_element_parent (self, xml_element):
+        r"""
+            returns parent element of @xml_element param in internal
+            XML tree or None if @xml_element is root element or does
+            not belong to internal XML tree;
+
+            elements of included XML trees have the <include>
+            element as parent;
+        """
+
+        return self._get_xml_index()[1].get(xml_element)
+
+    # end def
+
+
+
     def get_image (self, path):
         r"""
-            tries to retrieve an image from self.__images dict()
-            along @path;
+            tries to retrieve an image from application-wide images
+            table along @path;
+
+            the image is shared, not owned by the caller: use
+            image.copy() before any in-place change (see
+            set_image());
 
             returns image object if found, None otherwise;
         """
 
-        return self.__images.get(P.normalize(path))
+        return self._pin_resource(
+
+            "image",
+
+            self._get_root_table(self._images).get(
+                self.get_image_path(path)
+            )
+        )
+
+    # end def
+
+
+
+    def get_image_path (self, path):
+        r"""
+            normalizes image @path;
+
+            paths are normalized only once per raw @path value;
+
+            returns normalized path, empty string on trouble;
+        """
+
+        # already normalized?
+
+        try:
+
+            return self._image_paths[path]
+
+        except (KeyError, TypeError):
+
+            pass
+
+        # end try
+
+        # inits
+
+        _path = P.normalize(path)
+
+        # keep it for further calls
+
+        if tools.is_pstr(path):
+
+            self._image_paths[path] = _path
+
+        # end if
+
+        return _path
 
     # end def
 
@@ -1090,7 +2177,10 @@ class RADXMLBase (RW.RADWidgetBase):
             returns control variable on success, None otherwise;
         """
 
-        return self.__tk_variables["intvar"].get(varname, None)
+        return self._pin_resource(
+
+            "cvar", self.__tk_variables["intvar"].get(varname, None)
+        )
 
     # end def
 
@@ -1150,7 +2240,10 @@ class RADXMLBase (RW.RADWidgetBase):
             returns control variable on success, None otherwise;
         """
 
-        return self.__tk_variables["stringvar"].get(varname, None)
+        return self._pin_resource(
+
+            "cvar", self.__tk_variables["stringvar"].get(varname, None)
+        )
 
     # end def
 
@@ -1410,7 +2503,15 @@ class RADXMLBase (RW.RADWidgetBase):
 
                 }.get(vartype)
 
-                self.__tk_variables[vartype][varname] = _cvar()
+                _cvar = _cvar()
+
+                self.__tk_variables[vartype][varname] = _cvar
+
+                # keep a reverse ref for _release_resources()
+
+                self.__cvar_names[str(_cvar)] = (vartype, varname)
+
+                self.__new_resources.add(str(_cvar))
 
             # end if
 
@@ -1458,6 +2559,16 @@ class RADXMLBase (RW.RADWidgetBase):
         r"""
             tries to set up an image along @path;
 
+            images are shared application-wide: a same image file is
+            loaded only once per tkinter interpreter, whatever the
+            number of widgets and builders using it;
+
+            shared images are READ-ONLY: in-place changes such as
+            image.put(), image.blank() or image.configure() would
+            show up on every widget displaying that file; work on an
+            image.copy() instead (zoom() and subsample() already
+            return new images);
+
             if original image exists, keeps untouched;
 
             returns image object, None on trouble;
@@ -1465,17 +2576,29 @@ class RADXMLBase (RW.RADWidgetBase):
 
         # param inits
 
-        path = P.normalize(path)
+        path = self.get_image_path(path)
+
+        # inits
+
+        _images = self._get_root_table(self._images)
 
         # new image to register?
 
-        if path and path not in self.__images:
+        if path and path not in _images:
+
+            _image = TK.PhotoImage(file=path, master=self._get_tk_root())
 
-            self.__images[path] = TK.PhotoImage(file=path)
+            _images[path] = _image
+
+            # keep a reverse ref for _release_resources()
+
+            self._get_root_table(self._image_names)[str(_image)] = path
+
+            self.__new_resources.add(str(_image))
 
         # end if
 
-        return self.__images.get(path)
+        return _images.get(path)
 
     # end def
 
@@ -1558,6 +2681,10 @@ class RADXMLBase (RW.RADWidgetBase):
 
         self.__xml_tree = ET.ElementTree(**kw)
 
+        # same root element may have been edited in place
+
+        self.clear_xml_index()
+
     # end def
 
 
@@ -1577,40 +2704,7 @@ class RADXMLBase (RW.RADWidgetBase):
 
         try:
 
-            # verify XML tree before processing
-
-            if tools.is_pstr(filename) or \
-                                    not self.is_tree(self.__xml_tree):
-
-                # try to load once
-
-                self.xml_load(filename)
-
-            # end if
-
-            # cast root element
-
-            _root = self.__xml_tree.getroot()
-
-            if self._cast_root_element(_root):
-
-                # start XML widget building
-
-                _build_ok = self._build_element(_root, self.tk_owner)
-
-                # flush all deferred actions in queue
-
-                self._queue.flush_all()
-
-                # return building results
-
-                return _build_ok
-
-            else:
-
-                return False
-
-            # end if
+            return self._build_xml_tree(filename)
 
         except:
 
@@ -1674,8 +2768,12 @@ class RADXMLBase (RW.RADWidgetBase):
             else:
 
                 # XML parse file path
+                # along with compiled layouts cache
+
+                self.__xml_tree = XC.get_xml_cache().parse(
 
-                self.__xml_tree = ET.parse(self.get_xml_path(arg))
+                    self.get_xml_path(arg)
+                )
 
             # end if
 
@@ -1725,4 +2823,204 @@ class RADXMLBase (RW.RADWidgetBase):
     # end def
 
 
+
+    def xml_stream_build (self, filename = None, silent_mode = False,
+    paint_every = 0):
+        r"""
+            streaming counterpart of xml_build() for very large XML
+            documents;
+
+            parses XML source incrementally and builds each top-level
+            element as soon as its closing tag has been parsed, then
+            clears its processed subtree to keep memory flat;
+
+            root element is built once, with its attributes only, as
+            soon as its opening tag has been parsed; each top-level
+            element is then built into tk_owner, just as root element
+            builder would do (see _loop_on_children());
+
+            only root elements listed in self.STREAM_ROOTS may be
+            streamed, as other root builders create their own
+            container for children (e.g. <tkmenu>); raises TypeError
+            otherwise;
+
+            only top-level elements remain reachable through
+            get_element_by_id() once built (e.g. <module> elements);
+
+            @paint_every param (int) updates tk_owner's display every
+            N built top-level elements (0 means never);
+
+            returns True on overall success, False, otherwise;
+        """
+
+        # try to build widgets
+
+        try:
+
+            # XML source inits
+
+            if self.is_xml(filename):
+
+                _source = io.StringIO(filename)
+
+            else:
+
+                _source = self.get_xml_path(filename)
+
+            # end if
+
+            # inits
+
+            _root = None
+
+            _shell = None
+
+            _accept = None
+
+            _depth = 0
+
+            _count = 0
+
+            _build_ok = True
+
+            # incremental parsing
+
+            for (_event, _element) in \
+                            ET.iterparse(_source, events=("start", "end")):
+
+                if _event == "start":
+
+                    _depth += 1
+
+                    # root element?
+
+                    if _depth == 1:
+
+                        _root = _element
+
+                        self._cast_root_element(_root)
+
+                        _tag = self.normalize_tag(_root)
+
+                        # root builder must not create a container
+
+                        if _tag not in self.STREAM_ROOTS:
+
+                            raise TypeError(
+
+                                _(
+                                    "XML root element <{tag}> "
+
+                                    "*CANNOT* be streamed."
+
+                                ).format(tag = _tag)
+                            )
+
+                        # end if
+
+                        _accept = self.STREAM_ROOTS.get(_tag)
+
+                        # partial XML tree is the internal tree
+
+                        self.__xml_tree = ET.ElementTree(_root)
+
+                        # root attributes only - built once
+
+                        _shell = _root.makeelement(_root.tag, _root.attrib)
+
+                        _build_ok = self._build_element(
+
+                            _shell, self.tk_owner
+
+                        ) and _build_ok
+
+                    # end if
+
+                else:
+
+                    _depth -= 1
+
+                    # top-level element is complete?
+
+                    if _depth == 1:
+
+                        # build this single child into tk_owner
+
+                        _shell.append(_element)
+
+                        _build_ok = self._loop_on_children(
+
+                            _shell, self.tk_owner, accept = _accept
+
+                        ) and _build_ok
+
+                        _shell.remove(_element)
+
+                        # clear processed subtree
+
+                        del _element[:]
+
+                        # XML index is obsolete
+
+                        self.clear_xml_index()
+
+                        # first paint as soon as possible
+
+                        _count += 1
+
+                        if paint_every and not _count % paint_every \
+                                    and hasattr(self.tk_owner, "update"):
+
+                            self.tk_owner.update_idletasks()
+
+                        # end if
+
+                    # end if
+
+                # end if
+
+            # end for
+
+            # flush all deferred actions in queue
+
+            self._flush_deferred()
+
+            # return building results
+
+            return _build_ok
+
+        except:
+
+            if not silent_mode:
+
+                MB.showerror(
+
+                    _("Caught exception"),
+
+                    _(
+                        "An exception has occurred "
+
+                        "during XML widget building:"
+
+                        "\n\n{msg}\n"
+
+                        "Please, check your XML code before "
+
+                        "contacting tkRAD software maintainers for "
+
+                        "bug fixes.\nThank you."
+
+                    ).format(msg = traceback.format_exc(limit = 0))
+                )
+
+            # end if
+
+            raise
+
+        # end try
+
+    # end def
+
+
+
 # end class RADXMLBase
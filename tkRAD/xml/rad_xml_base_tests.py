@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+# rad_xml_base.py module testings
+# usage (from tkGAME root dir, needs a display):
+# python3 -m tkRAD.xml.rad_xml_base_tests
+import os.path as OP
+import tkinter as TK
+from . import rad_xml_base as XB
+from . import rad_xml_frame as XF
+from .rad_xml_codegen import _widget_signature
+
+
+# -------------------------- MODULE FUNCTION DEFS ----------------------
+
+
+# widget classes and object registry of a build
+def get_build_signature (widget):
+    _objects = widget.get_objects()
+    return (
+        _widget_signature(widget),
+        sorted(
+            (_id, type(_object).__name__)
+            for _id, _object in _objects.items()
+        ),
+    )
+# end def
+
+
+# streamed and normal builds must produce the same widget tree
+def test_stream_build (filename="xml/widget/mainwindow.xml"):
+    print("\n" + "-" * 60)
+    print("\nComparing streamed and normal builds of", filename)
+    try:
+        root = TK.Tk()
+    except TK.TclError as _error:
+        print("\n[WARNING] stream build NOT verified: {}".format(_error))
+        return
+    # end try
+    root.withdraw()
+    _normal = XF.RADXMLFrame(root)
+    XB.RADXMLBase.xml_build(_normal, filename)
+    _streamed = XF.RADXMLFrame(root)
+    _streamed.xml_stream_build(filename)
+    _signatures = (
+        get_build_signature(_normal), get_build_signature(_streamed)
+    )
+    root.destroy()
+    print("\nnormal build:", _signatures[0])
+    print("streamed build:", _signatures[1])
+    if _signatures[0] != _signatures[1]:
+        print("\n[ERROR] streamed build differs!")
+        exit(1)
+    # end if
+    # succeeded
+    print("\nAll has been verified OK.")
+# end def
+
+
+
+# shared fonts and images: one object per spec/path and tkinter root
+def test_shared_resources (image="images/section/games.gif",
+                                                font="sans 10 bold"):
+    print("\n" + "-" * 60)
+    print("\nChecking shared fonts and images")
+    try:
+        root = TK.Tk()
+        other_root = TK.Tk()
+    except TK.TclError as _error:
+        print("\n[WARNING] shared resources NOT verified: {}".format(_error))
+        return
+    # end try
+    root.withdraw()
+    other_root.withdraw()
+    _path = OP.abspath(image)
+    _xml = (
+        '<tkwidget><label id="label" font="{}" image="{}"/></tkwidget>'
+        .format(font, _path)
+    )
+    _builders = (XF.RADXMLFrame(root), XF.RADXMLFrame(root))
+    for _builder in _builders:
+        _builder.xml_build(_xml)
+    # end for
+    _labels = [_builder.get_object_by_id("label") for _builder in _builders]
+    _font = _builders[0].get_font(font)
+    _image = _builders[0].set_image(_path)
+    _other = XF.RADXMLFrame(other_root)
+    # in-place changes must go to copies (read-only contract)
+    _font_copy = _font.copy()
+    _font_copy.configure(size=20)
+    _image_copy = _image.copy()
+    _image_copy.put("#123456", to=(0, 0))
+    _checks = {
+        "one font per spec": _builders[1].get_font(font) is _font,
+        "one image per path": _builders[1].set_image(_path) is _image,
+        "widgets share font": all(
+            str(_label.cget("font")) == str(_font) for _label in _labels
+        ),
+        "widgets share image": all(
+            str(_label.cget("image")) == str(_image) for _label in _labels
+        ),
+        "font spec kept": _builders[0].get_font_spec(font) == font,
+        "font copy unshared": int(_font.cget("size")) == 10,
+        "image copy unshared": _image.get(0, 0) != (0x12, 0x34, 0x56),
+        "one font per root": _other.get_font(font) is not _font,
+        "one image per root": _other.set_image(_path) is not _image,
+    }
+    # displayed images survive cache clearing
+    _builders[0].clear_value_cache()
+    _checks["displayed image kept"] = (
+        _builders[1].set_image(_path) is _image
+    )
+    other_root.destroy()
+    root.destroy()
+    for _name, _ok in sorted(_checks.items()):
+        print("{}: {}".format(_name, "OK" if _ok else "FAILED"))
+    # end for
+    if not all(_checks.values()):
+        print("\n[ERROR] shared resources mismatch!")
+        exit(1)
+    # end if
+    # succeeded
+    print("\nAll has been verified OK.")
+# end def
+
+
+
+# ----------------------------- NOW TESTING -------------------------
+
+
+# session start
+print("\n--- BEGIN TEST SESSION ---")
+
+test_stream_build()
+
+test_shared_resources()
+
+# session end
+print("\n--- END OF TEST SESSION ---")
@@ -0,0 +1,946 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+
+# lib imports
+
+import os
+
+import sys
+
+import copy
+
+import marshal
+
+import hashlib
+
+import tempfile
+
+import os.path as OP
+
+import xml.etree.ElementTree as ET
+
+from .. import __version__
+
+from ..core import path as P
+
+from ..core import tools
+
+
+
+# unique instance pointer
+
+# module private var init
+
+__xml_cache = None
+
+__include_cache = None
+
+
+
+# service getter
+
+def get_xml_cache ():
+    r"""
+        gets a unique application-wide instance of the compiled XML
+        layout cache;
+
+        always return the cache unique instance pointer;
+    """
+
+    global __xml_cache
+
+    if not isinstance(__xml_cache, RADXMLCache):
+
+        __xml_cache = RADXMLCache()
+
+    # end if
+
+    return __xml_cache
+
+# end def
+
+
+
+# service getter
+
+def get_include_cache ():
+    r"""
+        gets a unique application-wide instance of the in-memory
+        XML <include> cache;
+
+        always return the cache unique instance pointer;
+    """
+
+    global __include_cache
+
+    if not isinstance(__include_cache, RADXMLIncludeCache):
+
+        __include_cache = RADXMLIncludeCache()
+
+    # end if
+
+    return __include_cache
+
+# end def
+
+
+
+class RADXMLCache:
+    r"""
+        persistent on-disk cache of compiled XML layouts;
+
+        each XML source file is compiled once into a compact
+        marshal'd tree of (tag, attrs, text, tail, children) tuples;
+
+        cache entries are keyed by source file path, mtime, size,
+        tkRAD version and Python version, so that any change in one
+        of them silently invalidates the compiled layout;
+
+        compiled trees are normalized:
+
+        * XML tags are lowercased as in RADXMLBase.normalize_tag();
+
+        * whitespace-only text and tail contents are dropped;
+
+        XML attribute values are kept as is: tkRAD attribute parsers
+        depend either on tkinter (images, fonts, control variables)
+        or on builder's own state (ids, slot owners, module aliases)
+        and must run at build time anyway;
+    """
+
+
+
+    CONFIG = {
+
+        "dir": "~/.cache/tkRAD/xml",
+
+        "file_ext": ".xmlc",
+
+    } # end of CONFIG
+
+
+
+    # compiled layout format version
+    # /!\ increment this on any format change /!\
+
+    FORMAT = 1
+
+
+
+    def __init__ (self, cache_dir = None):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.set_cache_dir(cache_dir)
+
+        self.switch_on()
+
+        self.reset_stats()
+
+    # end def
+
+
+
+    def _compile (self, xml_element):
+        r"""
+            protected method def;
+
+            compiles @xml_element and its subelements into a
+            (tag, attrs, text, tail, children) tuple tree;
+
+            returns compiled tree;
+        """
+
+        return (
+
+            str(xml_element.tag).lower(),
+
+            dict(xml_element.attrib),
+
+            self._strip(xml_element.text),
+
+            self._strip(xml_element.tail),
+
+            tuple(self._compile(_child) for _child in xml_element),
+        )
+
+    # end def
+
+
+
+    def _expand (self, data):
+        r"""
+            protected method def;
+
+            rebuilds an ET.Element tree from compiled @data;
+
+            returns root ET.Element object;
+        """
+
+        # inits
+
+        (_tag, _attrs, _text, _tail, _children) = data
+
+        _element = ET.Element(_tag, _attrs)
+
+        _element.text = _text
+
+        _element.tail = _tail
+
+        # rebuild subelements
+
+        _element.extend([self._expand(_child) for _child in _children])
+
+        return _element
+
+    # end def
+
+
+
+    def _get_cache_path (self, path):
+        r"""
+            protected method def;
+
+            returns compiled layout file path for XML source @path;
+        """
+
+        return OP.join(
+
+            self.get_cache_dir(),
+
+            hashlib.sha1(path.encode("utf-8")).hexdigest()
+
+            + self.CONFIG.get("file_ext", ".xmlc")
+        )
+
+    # end def
+
+
+
+    def _get_key (self, path):
+        r"""
+            protected method def;
+
+            builds cache validation key for XML source @path;
+
+            raises OSError if @path does not exist;
+
+            returns key tuple;
+        """
+
+        # file stats
+
+        _stat = os.stat(path)
+
+        return (
+
+            self.FORMAT,
+
+            __version__,
+
+            tuple(sys.version_info[:2]),
+
+            path,
+
+            _stat.st_mtime_ns,
+
+            _stat.st_size,
+        )
+
+    # end def
+
+
+
+    def _read (self, path, key):
+        r"""
+            protected method def;
+
+            tries to read compiled layout for @path along @key;
+
+            returns compiled tree on success, None otherwise;
+        """
+
+        try:
+
+            with open(self._get_cache_path(path), "rb") as _file:
+
+                # /!\ marshal.load() is much slower on file objects
+
+                (_key, _data) = marshal.loads(_file.read())
+
+            # end with
+
+        except (OSError, EOFError, ValueError, TypeError):
+
+            return None
+
+        # end try
+
+        # up to date?
+
+        if _key == key:
+
+            return _data
+
+        # end if
+
+        # outdated
+
+        return None
+
+    # end def
+
+
+
+    def _strip (self, text):
+        r"""
+            protected method def;
+
+            returns None for whitespace-only @text, @text otherwise;
+        """
+
+        if text and text.strip():
+
+            return text
+
+        # end if
+
+        return None
+
+    # end def
+
+
+
+    def _write (self, path, key, data):
+        r"""
+            protected method def;
+
+            atomically writes compiled layout @data for @path;
+
+            any I/O trouble is silently ignored: cache is optional;
+
+            returns True on success, False otherwise;
+        """
+
+        _tmp = None
+
+        try:
+
+            # ensure directories do exist
+
+            os.makedirs(self.get_cache_dir(), exist_ok = True)
+
+            # write into a temp file first
+
+            (_fd, _tmp) = tempfile.mkstemp(dir = self.get_cache_dir())
+
+            with os.fdopen(_fd, "wb") as _file:
+
+                _file.write(marshal.dumps((key, data)))
+
+            # end with
+
+            # then replace compiled layout at once
+
+            os.replace(_tmp, self._get_cache_path(path))
+
+            # succeeded
+
+            return True
+
+        except OSError:
+
+            # clean up
+
+            if _tmp and OP.exists(_tmp):
+
+                os.remove(_tmp)
+
+            # end if
+
+        # end try
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def clear (self):
+        r"""
+            removes all compiled layouts from cache directory;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _ext = self.CONFIG.get("file_ext", ".xmlc")
+
+        _dir = self.get_cache_dir()
+
+        # browse cache directory
+
+        if OP.isdir(_dir):
+
+            for _name in os.listdir(_dir):
+
+                if _name.endswith(_ext):
+
+                    os.remove(OP.join(_dir, _name))
+
+                # end if
+
+            # end for
+
+        # end if
+
+    # end def
+
+
+
+    def get_cache_dir (self):
+        r"""
+            cache directory getter;
+        """
+
+        return self.__cache_dir
+
+    # end def
+
+
+
+    def get_stats (self):
+        r"""
+            returns a dict() of cache 'hits', 'misses' and 'writes'
+            counters;
+
+            does not affect internal counters (shallow copy);
+        """
+
+        return self.__stats.copy()
+
+    # end def
+
+
+
+    def is_enabled (self):
+        r"""
+            returns True if cache support is ON, False otherwise;
+        """
+
+        return self.__enabled
+
+    # end def
+
+
+
+    def parse (self, path):
+        r"""
+            drop-in replacement for ET.parse(@path);
+
+            loads compiled layout if up to date, parses and compiles
+            XML source file otherwise;
+
+            raises ET.ParseError on XML source errors;
+
+            returns ET.ElementTree object;
+        """
+
+        # param inits
+
+        path = P.normalize(path)
+
+        # cache support is OFF?
+
+        if not self.__enabled:
+
+            return ET.parse(path)
+
+        # end if
+
+        # validation key
+
+        _key = self._get_key(path)
+
+        # try compiled layout
+
+        _data = self._read(path, _key)
+
+        # cache hit?
+
+        if _data:
+
+            self.__stats["hits"] += 1
+
+        # cache miss
+
+        else:
+
+            self.__stats["misses"] += 1
+
+            # parse and compile XML source
+
+            _data = self._compile(ET.parse(path).getroot())
+
+            # keep it for next time
+
+            if self._write(path, _key, _data):
+
+                self.__stats["writes"] += 1
+
+            # end if
+
+        # end if
+
+        return ET.ElementTree(self._expand(_data))
+
+    # end def
+
+
+
+    def reset_stats (self):
+        r"""
+            resets internal counters;
+
+            no return value (void);
+        """
+
+        self.__stats = dict(hits = 0, misses = 0, writes = 0)
+
+    # end def
+
+
+
+    def set_cache_dir (self, value):
+        r"""
+            cache directory setter;
+
+            no return value (void);
+        """
+
+        self.__cache_dir = P.normalize(
+
+            tools.choose_str(value, self.CONFIG.get("dir"))
+        )
+
+    # end def
+
+
+
+    def switch_off (self):
+        r"""
+            switches cache support OFF;
+        """
+
+        self.__enabled = False
+
+    # end def
+
+
+
+    def switch_on (self):
+        r"""
+            switches cache support ON;
+        """
+
+        self.__enabled = True
+
+    # end def
+
+
+# end class RADXMLCache
+
+
+
+class RADXMLIncludeCache:
+    r"""
+        process-wide in-memory cache of XML <include> sources;
+
+        each included XML file is parsed only once as long as its
+        mtime does not change, whatever the number of <include>
+        elements and of builders referring to it;
+
+        parsed trees are kept pristine: builders do alter XML
+        elements while building (e.g. automatic 'id' attributes),
+        so each call to get_subtree() gets its own deep copy of the
+        shared parsed tree, which is much cheaper than a new parse;
+    """
+
+
+
+    def __init__ (self):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+        # i.e. {path: (mtime_ns, root_element)}
+
+        self.__entries = dict()
+
+        self.reset_stats()
+
+    # end def
+
+
+
+    def clear (self):
+        r"""
+            forgets all parsed XML trees;
+
+            no return value (void);
+        """
+
+        self.__entries.clear()
+
+    # end def
+
+
+
+    def get_stats (self):
+        r"""
+            returns a dict() of cache 'hits', 'parses' and
+            'invalidations' counters along with current number of
+            cached 'entries';
+
+            does not affect internal counters (shallow copy);
+        """
+
+        _stats = self.__stats.copy()
+
+        _stats["entries"] = len(self.__entries)
+
+        return _stats
+
+    # end def
+
+
+
+    def get_subtree (self, path):
+        r"""
+            retrieves parsed XML tree for included file @path;
+
+            parses @path only if not already cached or if file has
+            been modified since last parsing;
+
+            raises OSError if @path does not exist;
+
+            raises ET.ParseError on XML source errors;
+
+            returns a private copy of XML root element;
+        """
+
+        # inits
+
+        path = P.normalize(path)
+
+        _mtime = os.stat(path).st_mtime_ns
+
+        _entry = self.__entries.get(path)
+
+        # cache hit?
+
+        if _entry and _entry[0] == _mtime:
+
+            self.__stats["hits"] += 1
+
+        # cache miss
+
+        else:
+
+            # outdated?
+
+            if _entry:
+
+                self.__stats["invalidations"] += 1
+
+            # end if
+
+            self.__stats["parses"] += 1
+
+            # parse along with compiled layouts cache
+
+            _entry = (_mtime, get_xml_cache().parse(path).getroot())
+
+            self.__entries[path] = _entry
+
+        # end if
+
+        # builders may alter elements: keep shared tree pristine
+
+        return copy.deepcopy(_entry[1])
+
+    # end def
+
+
+
+    def reset_stats (self):
+        r"""
+            resets internal counters;
+
+            no return value (void);
+        """
+
+        self.__stats = dict(hits = 0, parses = 0, invalidations = 0)
+
+    # end def
+
+
+# end class RADXMLIncludeCache
+
+
+
+# cold vs warm benchmark
+
+def benchmark (*paths, number = 100):
+    r"""
+        compares cold (parse + compile) vs warm (compiled layout)
+        loading times of XML source @paths;
+
+        defaults to Gabe's own XML files if @paths are omitted;
+
+        usage (from tkGAME root dir):
+
+            python3 -m tkRAD.xml.rad_xml_cache [file.xml ...]
+    """
+
+    # lib imports
+
+    from timeit import timeit
+
+    # param inits
+
+    paths = paths or (
+
+        "xml/widget/mainwindow.xml",
+
+        "xml/menu/topmenu.xml",
+
+        "xml/data/tkgame_sections.xml",
+    )
+
+    # private cache inits
+
+    _cache = RADXMLCache(tempfile.mkdtemp())
+
+    def _cold ():
+
+        _cache.clear()
+
+        for _path in paths:
+
+            _cache.parse(_path)
+
+        # end for
+
+    # end def
+
+    def _warm ():
+
+        for _path in paths:
+
+            _cache.parse(_path)
+
+        # end for
+
+    # end def
+
+    def _plain ():
+
+        for _path in paths:
+
+            ET.parse(_path)
+
+        # end for
+
+    # end def
+
+    # chronometers
+
+    _plain_time = timeit(_plain, number = number) / number
+
+    _cold_time = timeit(_cold, number = number) / number
+
+    _warm_time = timeit(_warm, number = number) / number
+
+    _cache.clear()
+
+    print("\nXML layouts:", *paths, sep = "\n    ")
+
+    print("\nno cache:   {:.1f} µs".format(_plain_time * 1e6))
+
+    print("cold start: {:.1f} µs".format(_cold_time * 1e6))
+
+    print("warm start: {:.1f} µs".format(_warm_time * 1e6))
+
+    print("speedup:    x{:.2f}\n".format(_plain_time / _warm_time))
+
+# end def
+
+
+
+# cold vs warm application startup benchmark
+
+def benchmark_startup (script = "gabe.py", number = 5):
+    r"""
+        compares cold (empty cache) vs warm (compiled layouts)
+        startup times of a whole tkRAD application @script, from
+        process launch to its first idle main loop cycle;
+
+        each run is a new python process, so that no in-memory
+        state survives from one run to another; needs a display;
+
+        usage (from tkGAME root dir):
+
+            python3 -m tkRAD.xml.rad_xml_cache --startup [script.py]
+    """
+
+    # lib imports
+
+    import subprocess
+
+    # child process: quit on first idle cycle and print elapsed time
+
+    _child = (
+
+        "import sys, time, runpy, tkinter as TK\n"
+
+        "_t0 = time.perf_counter()\n"
+
+        "from tkRAD.xml import rad_xml_cache as XC\n"
+
+        "XC.get_xml_cache().set_cache_dir(sys.argv[1])\n"
+
+        "if not sys.argv[1]: XC.get_xml_cache().switch_off()\n"
+
+        "_mainloop = TK.Misc.mainloop\n"
+
+        "def _started (root):\n"
+
+        "    print('startup:', time.perf_counter() - _t0, file=sys.stderr)\n"
+
+        "    root.quit()\n"
+
+        "def mainloop (self, n=0):\n"
+
+        "    self.after_idle(_started, self)\n"
+
+        "    _mainloop(self, n)\n"
+
+        "TK.Misc.mainloop = mainloop\n"
+
+        "sys.argv[1:] = []\n"
+
+        "runpy.run_path({!r}, run_name='__main__')\n"
+
+    ).format(script)
+
+    def _run (cache_dir):
+
+        _result = subprocess.run(
+
+            (sys.executable, "-c", _child, cache_dir),
+
+            stdout = subprocess.DEVNULL, stderr = subprocess.PIPE,
+
+            universal_newlines = True, check = True,
+        )
+
+        for _line in _result.stderr.splitlines():
+
+            if _line.startswith("startup:"):
+
+                return float(_line.split()[-1])
+
+            # end if
+
+        # end for
+
+        raise RuntimeError(
+
+            "application startup failed:\n{}".format(_result.stderr)
+        )
+
+    # end def
+
+    # chronometers
+
+    _cache_dir = tempfile.mkdtemp()
+
+    _plain_time = _cold_time = _warm_time = 0.0
+
+    for _i in range(number):
+
+        _plain_time += _run("") / number
+
+        RADXMLCache(_cache_dir).clear()
+
+        _cold_time += _run(_cache_dir) / number
+
+        _warm_time += _run(_cache_dir) / number
+
+    # end for
+
+    RADXMLCache(_cache_dir).clear()
+
+    print("\napplication:", script)
+
+    print("\nno cache:   {:.1f} ms".format(_plain_time * 1e3))
+
+    print("cold start: {:.1f} ms".format(_cold_time * 1e3))
+
+    print("warm start: {:.1f} ms".format(_warm_time * 1e3))
+
+    print("speedup:    x{:.2f}\n".format(_plain_time / _warm_time))
+
+# end def
+
+
+
+# benchmark launching (not imported)?
+
+if __name__ == "__main__":
+
+    if "--startup" in sys.argv:
+
+        sys.argv.remove("--startup")
+
+        benchmark_startup(*sys.argv[1:2])
+
+    else:
+
+        benchmark(*sys.argv[1:])
+
+    # end if
+
+# end if
@@ -0,0 +1,1238 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import re
+
+import sys
+
+import os.path as OP
+
+import tkinter as TK
+
+from tkinter import ttk
+
+from .. import __version__
+
+from ..core import tools
+
+from . import rad_xml_widget as XW
+
+
+
+class _Code:
+    r"""
+        python expression to be written as is in generated code;
+    """
+
+    def __init__ (self, expr):
+        r"""
+            class constructor;
+        """
+
+        self.expr = str(expr)
+
+    # end def
+
+
+
+    def __repr__ (self):
+        r"""
+            expression is its own python representation;
+        """
+
+        return self.expr
+
+    # end def
+
+# end class _Code
+
+
+
+class RADXMLCodeGenerator (XW.RADXMLWidget):
+    r"""
+        ahead-of-time (AOT) XML to python code generator;
+
+        walks an XML widget file exactly as RADXMLWidget does but
+        instead of creating tkinter widgets, writes down the
+        equivalent flat python code into a build(builder, tk_parent)
+        function;
+
+        XML attributes are parsed at generation time, except those
+        needing a living tkinter context (images, control variables,
+        commands, translations, widget refs) which are written down
+        as runtime expressions;
+
+        only a subset of XML elements is supported (see SUPPORTED);
+        any other element raises TypeError so that no module gets
+        generated and RADXMLWidget keeps on interpreting XML source;
+    """
+
+
+
+    # supported XML elements
+
+    SUPPORTED = (
+
+        "button", "canvas", "checkbutton", "entry", "event", "frame",
+        "label", "labelframe", "menubutton", "message", "module",
+        "panedwindow", "radiobutton", "scale", "spinbox", "text",
+        "tkwidget", "toplevel", "ttkbutton", "ttkcheckbutton",
+        "ttkcombobox", "ttkentry", "ttkframe", "ttklabel",
+        "ttklabelframe", "ttkmenubutton", "ttknotebook",
+        "ttkpanedwindow", "ttkprogressbar", "ttkradiobutton",
+        "ttkscale", "ttkseparator", "ttksizegrip", "ttktab",
+        "ttktreeview", "widget",
+    )
+
+
+
+    # plain python types allowed in generated code
+
+    LITERALS = (str, int, float, bool, type(None), _Code)
+
+
+
+    def __init__ (self, **kw):
+        r"""
+            class constructor;
+        """
+
+        # generator member inits
+
+        self.__imports = list()
+
+        self.__names = {"TK", "ttk"}
+
+        self.__lines = list()
+
+        self.__setup = list()
+
+        self.__count = 1
+
+        self.__widget = None
+
+        # super class inits
+
+        XW.RADXMLWidget.__init__(self, tk_owner = None, **kw)
+
+    # end def
+
+
+
+    def _before_building_element (self, **kw):
+        r"""
+            virtual method to be implemented in subclass;
+        """
+
+        # super class inits
+
+        super()._before_building_element(**kw)
+
+        # no current widget by now
+
+        self.__widget = None
+
+    # end def
+
+
+
+    def _build_element (self, xml_element, tk_parent):
+        r"""
+            rejects any XML element code generation does not support;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.normalize_tag(xml_element) not in self.SUPPORTED:
+
+            raise TypeError(
+
+                _(
+                    "XML element <{tag}> is *NOT* supported by "
+
+                    "ahead-of-time code generation."
+
+                ).format(tag = xml_element.tag)
+            )
+
+        # end if
+
+        return super()._build_element(xml_element, tk_parent)
+
+    # end def
+
+
+
+    def _build_element_checkbutton (self, xml_tag, xml_element, tk_parent):
+        r"""
+            Tkinter native widget code generation;
+
+            returns True on build success, False otherwise;
+        """
+
+        _ok = self._build_tk_native(xml_tag, xml_element, tk_parent)
+
+        if xml_element.get("checked"):
+
+            self._emit("{}.select()", self.WIDGET)
+
+        else:
+
+            self._emit("{}.deselect()", self.WIDGET)
+
+        # end if
+
+        return _ok
+
+    # end def
+
+
+
+    def _build_element_event (self, xml_tag, xml_element, tk_parent):
+        r"""
+            writes down events.connect(signal, slot) code;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.cast_element(xml_element):
+
+            # attribute inits
+
+            _attributes = self._init_attributes(
+
+                xml_tag, xml_element, tk_parent
+            )
+
+            self._flush_setup()
+
+            self._emit(
+
+                "builder.events.connect({}, {})",
+
+                self._literal(_attributes.get("signal")),
+
+                self._literal(_attributes.get("slot")),
+            )
+
+            # succeeded
+
+            return True
+
+        # end if
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def _build_element_module (self, xml_tag, xml_element, tk_parent):
+        r"""
+            imports python libs at generation time and writes down
+            the same import statement in generated module;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.cast_element(xml_element):
+
+            # attribute inits
+
+            _attributes = self._init_attributes(
+
+                xml_tag, xml_element, tk_parent
+            )
+
+            _from = tools.choose_str(_attributes.get("from"))
+
+            _import = tools.choose_str(_attributes.get("import"))
+
+            _as = tools.choose_str(_attributes.get("as"))
+
+            _statement = "{}{}{}".format(
+
+                tools.str_complete("from {} ", _from),
+
+                tools.str_complete("import {}", _import),
+
+                tools.str_complete(" as {}", _as),
+            )
+
+            # names bound by import statement
+
+            if _as:
+
+                self.__names.add(_as)
+
+            elif _from:
+
+                self.__names.update(
+
+                    _name.strip() for _name in _import.split(",")
+                )
+
+            else:
+
+                self.__names.add(_import.split(".")[0].strip())
+
+            # end if
+
+            # same global scope as RADXMLWidget
+
+            exec(_statement, vars(XW))
+
+            if _statement not in self.__imports:
+
+                self.__imports.append(_statement)
+
+            # end if
+
+            # succeeded
+
+            return True
+
+        # end if
+
+        # failed
+
+        return False
+
+    # end def
+
+
+
+    def _build_element_radiobutton (self, xml_tag, xml_element, tk_parent):
+        r"""
+            Tkinter native widget code generation;
+
+            returns True on build success, False otherwise;
+        """
+
+        _ok = self._build_tk_native(xml_tag, xml_element, tk_parent)
+
+        if xml_element.get("selected"):
+
+            self._emit("{}.select()", self.WIDGET)
+
+        else:
+
+            self._emit("{}.deselect()", self.WIDGET)
+
+        # end if
+
+        return _ok
+
+    # end def
+
+
+
+    def _build_element_ttkcheckbutton (self, xml_tag, xml_element, tk_parent):
+        r"""
+            Tkinter ttk widget code generation;
+
+            returns True on build success, False otherwise;
+        """
+
+        _ok = self._build_tk_native(xml_tag, xml_element, tk_parent)
+
+        if xml_element.get("checked"):
+
+            self._emit("{}.invoke()", self.WIDGET)
+
+        # end if
+
+        return _ok
+
+    # end def
+
+
+
+    def _build_element_ttkradiobutton (self, xml_tag, xml_element, tk_parent):
+        r"""
+            Tkinter ttk widget code generation;
+
+            returns True on build success, False otherwise;
+        """
+
+        _ok = self._build_tk_native(xml_tag, xml_element, tk_parent)
+
+        if xml_element.get("selected"):
+
+            self._emit("{}.invoke()", self.WIDGET)
+
+        # end if
+
+        return _ok
+
+    # end def
+
+
+
+    def _build_element_widget (self, xml_tag, xml_element, tk_parent,
+    **kw):
+        r"""
+            writes down the same sequence of calls as
+            RADXMLWidget._build_element_widget() does at runtime;
+
+            returns True on build success, False otherwise;
+        """
+
+        # param controls
+
+        if self.is_tk_parent(tk_parent):
+
+            # new widget variable
+
+            _widget = self._new_var()
+
+            self.__widget = _widget
+
+            # widget attribute inits
+
+            kw.update(addon_attrs = self.ATTRS.get("widget"))
+
+            _attributes = self._init_deferred_attributes(
+
+                xml_tag, xml_element, tk_parent, **kw
+            )
+
+            # ensure neutrality
+
+            _attributes = _attributes.flatten()
+
+            # widget class inits
+
+            _cname = "{module}{class}".format(**_attributes)
+
+            if _cname.split(".")[0] not in self.__names \
+                                        and "*" not in self.__names:
+
+                raise TypeError(
+
+                    _(
+                        "class '{classname}' must be imported by a "
+
+                        "<module> element for ahead-of-time code "
+
+                        "generation."
+
+                    ).format(classname = _cname)
+                )
+
+            # end if
+
+            _class = eval(_cname, vars(XW))
+
+            _args = _attributes.get("args", "")
+
+            # tk widget parent autocompletion
+
+            if issubclass(_class, (TK.Widget, TK.Tk)) \
+                                and not _args.startswith("tk_parent"):
+
+                _args = "tk_parent, " + _args
+
+            # end if
+
+            # create tkinter widget
+
+            self._emit("")
+
+            self._emit("# <{}> {}", xml_tag, _widget)
+
+            self._emit("tk_parent = {}", tk_parent)
+
+            self._emit("{} = {}({})", _widget, _cname, _args)
+
+            self._flush_setup()
+
+            self._emit("_attrs = {}", self._literal(_attributes))
+
+            # keep a copy aboard
+
+            self._register_object_by_id(_widget, _attributes.get("id"))
+
+            # keep a copy for specific post-implementations
+
+            self.WIDGET = _widget
+
+            # set widget as class member
+
+            self._set_class_member(_attributes.get("name"), _widget)
+
+            # configure widget
+
+            self._emit(
+
+                "builder._set_widget_config({}, {})",
+
+                _widget, self._literal_config(self.TK_CONFIG, _attributes),
+            )
+
+            # set layout
+
+            self._emit(
+
+                "builder.TK_CHILD_CONFIG = {}",
+
+                self._literal_config(self.TK_CHILD_CONFIG, _attributes),
+            )
+
+            self._emit(
+
+                "builder._set_layout({}, _attrs, {})", _widget, tk_parent
+            )
+
+            # loop on XML element children - build tk child widgets
+
+            _build_ok = self._loop_on_children(
+
+                xml_element, _widget,
+
+                accept = tools.choose(
+
+                    self.DTD.get(xml_tag),
+
+                    self.DTD.get("widget"),
+                )
+            )
+
+            # widget init() procedure
+
+            if _attributes.get("init"):
+
+                self._emit(
+
+                    "{}(widget={}, parent={}, xml_attributes={}, "
+                    "addon_attrs=builder.ATTRS.get('widget'))",
+
+                    "_attrs['init']", _widget, tk_parent, "_attrs",
+                )
+
+            # end if
+
+            # succeeded
+
+            return _build_ok
+
+        # unsupported
+
+        else:
+
+            raise TypeError(
+
+                _(
+                    "Tkinter '{classname}' object is *NOT* "
+
+                    "insertable into {obj_type} object."
+
+                ).format(
+
+                    classname =
+
+                        xml_element.get("class", self.WIDGET_CLASS),
+
+                    obj_type = repr(tk_parent)
+                )
+            )
+
+            return False
+
+        # end if
+
+    # end def
+
+
+
+    def _emit (self, line, *args):
+        r"""
+            appends a new line of code to build() function body;
+
+            no return value (void);
+        """
+
+        self.__lines.append(
+
+            ("    " + line.format(*args)).rstrip()
+        )
+
+    # end def
+
+
+
+    def _flush_setup (self):
+        r"""
+            writes down pending setup lines i.e. runtime values
+            needed by XML attributes of current element;
+
+            no return value (void);
+        """
+
+        self.__lines.extend("    " + _line for _line in self.__setup)
+
+        self.__setup.clear()
+
+    # end def
+
+
+
+    def _literal (self, value):
+        r"""
+            returns python code representation of @value;
+
+            raises TypeError if @value cannot be written down as
+            python code;
+        """
+
+        if isinstance(value, dict):
+
+            return "{{{}}}".format(
+
+                ", ".join(
+
+                    "{}: {}".format(repr(_k), self._literal(_v))
+
+                    for (_k, _v) in value.items()
+                )
+            )
+
+        elif isinstance(value, (list, tuple)):
+
+            _items = ", ".join(self._literal(_v) for _v in value)
+
+            if isinstance(value, list):
+
+                return "[{}]".format(_items)
+
+            # end if
+
+            return "({}{})".format(_items, "," if len(value) == 1 else "")
+
+        elif isinstance(value, self.LITERALS):
+
+            return repr(value)
+
+        # end if
+
+        raise TypeError(
+
+            _(
+                "value {value} cannot be written down in "
+
+                "ahead-of-time generated code."
+
+            ).format(value = repr(value))
+        )
+
+    # end def
+
+
+
+    def _literal_config (self, config, attributes):
+        r"""
+            returns python code representation of @config dict;
+
+            runtime expressions already written down in _attrs dict
+            are referenced instead of being evaluated twice;
+        """
+
+        return "{{{}}}".format(
+
+            ", ".join(
+
+                "{}: {}".format(
+
+                    repr(_k),
+
+                    "_attrs[{}]".format(repr(_k))
+
+                    if isinstance(_v, _Code) and attributes.get(_k) is _v
+
+                    else self._literal(_v)
+                )
+
+                for (_k, _v) in config.items()
+            )
+        )
+
+    # end def
+
+
+
+    def _new_var (self, radix = "_w"):
+        r"""
+            returns a new unique variable name for generated code;
+        """
+
+        _var = _Code("{}{}".format(radix, self.__count))
+
+        self.__count += 1
+
+        return _var
+
+    # end def
+
+
+
+    def _register_object_by_id (self, built_object, attr_id):
+        r"""
+            writes down object registering code;
+
+            objects with an explicit 'id' are also registered at
+            generation time so that widget refs can be resolved;
+
+            no return value (void);
+        """
+
+        if tools.is_pstr(tools.normalize_id(attr_id)):
+
+            super()._register_object_by_id(built_object, attr_id)
+
+        # end if
+
+        self._emit(
+
+            "builder._register_object_by_id({}, {})",
+
+            built_object, repr(attr_id),
+        )
+
+    # end def
+
+
+
+    def _set_class_member (self, name, widget):
+        r"""
+            writes down class member setting code;
+
+            no return value (void);
+        """
+
+        if tools.is_pstr(name):
+
+            self._emit(
+
+                "builder._set_class_member({}, {})", repr(name), widget
+            )
+
+        # end if
+
+    # end def
+
+
+
+    def _tkRAD_bitmap_support (self, attribute, **kw):
+        r"""
+            bitmap paths are resolved at runtime;
+
+            no return value (void);
+        """
+
+        if self._is_new(attribute):
+
+            attribute.value = _Code(
+
+                "builder.get_bitmap_path({})".format(repr(attribute.value))
+            )
+
+            self._tk_config(attribute)
+
+        # end if
+
+    # end def
+
+
+
+    def _tkRAD_command_support (self, attribute, **kw):
+        r"""
+            commands are resolved at runtime, once widget exists;
+
+            no return value (void);
+        """
+
+        if self._is_new(attribute):
+
+            _kw = ["tk_parent={}".format(kw.get("tk_parent"))]
+
+            if self.__widget is not None:
+
+                _kw.insert(0, "widget={}".format(self.__widget))
+
+            # end if
+
+            _kw.extend(
+
+                "{}={}".format(_k, repr(kw.get(_k)))
+
+                for _k in ("xml_tag", "xml_attr")
+            )
+
+            attribute.value = _Code(
+
+                "builder._get_command({}, {})"
+
+                .format(repr(attribute.value), ", ".join(_kw))
+            )
+
+            self._tk_config(attribute, **kw)
+
+        # end if
+
+    # end def
+
+
+
+    def _tkRAD_cvar_support (self, attribute, **kw):
+        r"""
+            control variables are created at runtime;
+
+            no return value (void);
+        """
+
+        if self._is_new(attribute):
+
+            attribute.value = _Code(
+
+                "builder.set_stringvar({})".format(repr(attribute.value))
+            )
+
+            self._tk_config(attribute, **kw)
+
+        # end if
+
+    # end def
+
+
+
+    def _tkRAD_font_support (self, attribute, **kw):
+        r"""
+            named fonts are created at runtime;
+
+            no return value (void);
+        """
+
+        if self._is_new(attribute):
+
+            attribute.value = _Code(
+
+                "builder.get_font({})".format(repr(attribute.value))
+            )
+
+            self._tk_config(attribute, **kw)
+
+        # end if
+
+    # end def
+
+
+
+    def _tkRAD_image_support (self, attribute, **kw):
+        r"""
+            images are loaded at runtime;
+
+            no return value (void);
+        """
+
+        if self._is_new(attribute):
+
+            attribute.value = _Code(
+
+                "builder.set_image({})".format(repr(attribute.value))
+            )
+
+            self._tk_config(attribute)
+
+        # end if
+
+    # end def
+
+
+
+    def _tkRAD_label_support (self, attribute, attrs, **kw):
+        r"""
+            labels are translated at runtime;
+
+            no return value (void);
+        """
+
+        if self._is_new(attribute):
+
+            _label = _Code("_({})".format(repr(attribute.value)))
+
+            # got XML attr 'underline'?
+
+            if "underline" in attrs:
+
+                _var = self._new_var("_l")
+
+                self.__setup.append(
+
+                    "{0}, {0}_pos = builder._get_underlined_label({1})"
+
+                    .format(_var, _label)
+                )
+
+                _attr_underline = attrs.get_item("underline")
+
+                _attr_underline.value = _Code("{}_pos".format(_var))
+
+                self._tk_config(_attr_underline, **kw)
+
+                _label = _var
+
+            # end if
+
+            attribute.value = _label
+
+            self._tk_config(attribute, **kw)
+
+        # end if
+
+    # end def
+
+
+
+    def _tkRAD_widget_support (self, attribute, **kw):
+        r"""
+            widget refs are variables of generated code;
+
+            no return value (void);
+        """
+
+        if self._is_new(attribute) \
+                    and attribute.value.strip("@").lower() == "top" \
+                    and attribute.value.startswith("@"):
+
+            attribute.value = _Code("builder.tk_owner.winfo_toplevel()")
+
+            self._tk_config(attribute, **kw)
+
+        else:
+
+            super()._tkRAD_widget_support(attribute, **kw)
+
+        # end if
+
+    # end def
+
+
+
+    def generate (self, filename = None):
+        r"""
+            generates python source code along XML @filename (see
+            RADXMLBase.get_xml_path() for more detail);
+
+            raises TypeError if XML contents cannot be generated
+            ahead of time;
+
+            returns python source code as str;
+        """
+
+        # XML source inits
+
+        _path = self.get_xml_path(filename)
+
+        self.xml_load(_path)
+
+        _root = self.get_xml_tree().getroot()
+
+        self._cast_root_element(_root)
+
+        # generate build() body
+
+        self._build_element(_root, _Code("_w0"))
+
+        # deferred actions should have been resolved by now
+
+        self._queue.flush_all()
+
+        # module source code
+
+        _source = [
+
+            "# -*- coding: utf-8 -*-",
+
+            "# ahead-of-time generated by tkRAD.xml.rad_xml_codegen",
+
+            "# from: {}".format(_path),
+
+            "# do *NOT* edit: regenerate instead",
+
+            "",
+
+            "import tkinter as TK",
+
+            "from tkinter import ttk",
+        ]
+
+        _source.extend(self.__imports)
+
+        _source.extend((
+
+            "",
+
+            "TKRAD_VERSION = {}".format(repr(__version__)),
+
+            "DOCTYPE = {}".format(repr(self.DOCTYPE)),
+
+            "",
+
+            "def build (builder, tk_parent):",
+
+            "    _w0 = tk_parent",
+        ))
+
+        _source.extend(self.__lines)
+
+        _source.extend(("", "    return True", ""))
+
+        return "\n".join(_source)
+
+    # end def
+
+
+
+    def is_tk_parent (self, widget):
+        r"""
+            generated widget variables are acceptable parents;
+
+            returns True on success, False otherwise;
+        """
+
+        return isinstance(widget, _Code) or super().is_tk_parent(widget)
+
+    # end def
+
+# end class RADXMLCodeGenerator
+
+
+
+def write_module (filename, **kw):
+    r"""
+        generates AOT python module along XML @filename and writes
+        it down next to XML file, as RADXMLWidget expects it in
+        AOT mode (see RADXMLWidget.AOT_MODULES);
+
+        raises TypeError if XML contents cannot be generated;
+
+        returns written python module path;
+    """
+
+    _generator = RADXMLCodeGenerator(**kw)
+
+    _source = _generator.generate(filename)
+
+    _path = (
+
+        OP.splitext(_generator.get_xml_path(filename))[0]
+
+        + XW.RADXMLWidget.AOT_MODULE_SUFFIX
+    )
+
+    # ensure generated code compiles
+
+    compile(_source, _path, "exec")
+
+    with open(_path, "w", encoding = "utf-8") as _file:
+
+        _file.write(_source)
+
+    # end with
+
+    return _path
+
+# end def
+
+
+
+def _widget_signature (widget):
+    r"""
+        returns a comparable signature of @widget and its children;
+    """
+
+    # runtime names differ from one build to another
+
+    _ref = re.compile(r"^(?:PY_VAR\d+|pyimage\d+|\d+\S+)$")
+
+    _config = list()
+
+    for _key in sorted(widget.keys()):
+
+        _value = str(widget.cget(_key))
+
+        if _ref.match(_value):
+
+            _value = "<ref>"
+
+        # end if
+
+        _config.append((_key, _value))
+
+    # end for
+
+    return (
+
+        widget.winfo_class(),
+
+        widget.winfo_manager(),
+
+        tuple(_config),
+
+        tuple(map(_widget_signature, widget.winfo_children())),
+    )
+
+# end def
+
+
+
+def check_equivalence (filename, **kw):
+    r"""
+        builds XML @filename twice into hidden frames, once by
+        interpreting XML and once by running generated code;
+
+        compares both widget trees (classes, layout managers,
+        options) and both object registries;
+
+        returns list of differences (empty list if equivalent);
+    """
+
+    from . import rad_xml_frame as XF
+
+    _root = TK.Tk()
+
+    _root.withdraw()
+
+    try:
+
+        # interpreted build
+
+        _interpreted = XF.RADXMLFrame(_root, **kw)
+
+        XW.RB.RX.RADXMLBase._build_xml_tree(_interpreted, filename)
+
+        # generated build
+
+        _source = RADXMLCodeGenerator(**kw).generate(filename)
+
+        _module = dict()
+
+        exec(compile(_source, "<aot>", "exec"), _module)
+
+        _generated = XF.RADXMLFrame(_root, **kw)
+
+        _module["build"](_generated, _generated.tk_owner)
+
+        _generated._flush_deferred()
+
+        # compare results
+
+        _diffs = list()
+
+        _objects = (_interpreted.get_objects(), _generated.get_objects())
+
+        for _id in sorted(set(_objects[0]) ^ set(_objects[1])):
+
+            _diffs.append("object id '{}' is not in both builds".format(_id))
+
+        # end for
+
+        for _id in sorted(set(_objects[0]) & set(_objects[1])):
+
+            _types = tuple(type(_o[_id]).__name__ for _o in _objects)
+
+            if _types[0] != _types[1]:
+
+                _diffs.append(
+
+                    "object id '{}': {} != {}".format(_id, *_types)
+                )
+
+            # end if
+
+        # end for
+
+        if _widget_signature(_interpreted) != _widget_signature(_generated):
+
+            _diffs.append("widget trees differ")
+
+        # end if
+
+        return _diffs
+
+    finally:
+
+        _root.destroy()
+
+    # end try
+
+# end def
+
+
+
+if __name__ == "__main__":
+
+    # usage: python3 -m tkRAD.xml.rad_xml_codegen [--check] file.xml...
+
+    _check = "--check" in sys.argv
+
+    for _filename in sys.argv[1:]:
+
+        if _filename == "--check":
+
+            continue
+
+        # end if
+
+        try:
+
+            print("generated:", write_module(_filename))
+
+            if _check:
+
+                print("differences:", check_equivalence(_filename) or None)
+
+            # end if
+
+        except TypeError as _error:
+
+            print("skipped:", _filename, "-", _error)
+
+        # end try
+
+    # end for
+
+# end if
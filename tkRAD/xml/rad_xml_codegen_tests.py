@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+# rad_xml_codegen.py module testings
+# usage (from tkGAME root dir, equivalence needs a display and must
+# pass before switching RADXMLWidget.AOT_MODULES ON):
+# python3 -m tkRAD.xml.rad_xml_codegen_tests
+import glob
+import tkinter as TK
+from . import rad_xml_codegen as CG
+
+
+# -------------------------- MODULE FUNCTION DEFS ----------------------
+
+
+# shipped XML widget layouts
+def get_layouts (pattern="xml/widget/*.xml"):
+    return sorted(glob.glob(pattern))
+# end def
+
+
+# shipped layouts must generate compilable python code
+def test_generate_layouts (pattern="xml/widget/*.xml"):
+    print("\n" + "-" * 60)
+    print("\nGenerating python code for {} layouts".format(pattern))
+    _generated = 0
+    for _filename in get_layouts(pattern):
+        try:
+            _source = CG.RADXMLCodeGenerator().generate(_filename)
+        except TypeError as _error:
+            print("\nskipped {}: {}".format(_filename, _error))
+            continue
+        # end try
+        _module = dict()
+        exec(compile(_source, _filename, "exec"), _module)
+        print("\ngenerated {}: {} lines".format(
+            _filename, len(_source.splitlines())
+        ))
+        if _module.get("DOCTYPE") != "tkwidget" \
+                                    or not callable(_module.get("build")):
+            print("\n[ERROR] unexpected generated module contents!")
+            exit(1)
+        # end if
+        _generated += 1
+    # end for
+    if not _generated:
+        print("\n[ERROR] no layout has been generated!")
+        exit(1)
+    # end if
+    # succeeded
+    print("\nAll has been verified OK.")
+# end def
+
+
+# generated code must build the same widgets as XML interpretation
+def test_equivalence (pattern="xml/widget/*.xml"):
+    print("\n" + "-" * 60)
+    print("\nComparing generated and interpreted builds")
+    try:
+        TK.Tk().destroy()
+    except TK.TclError as _error:
+        print("\n[WARNING] equivalence NOT verified: {}".format(_error))
+        return
+    # end try
+    for _filename in get_layouts(pattern):
+        try:
+            _diffs = CG.check_equivalence(_filename)
+        except TypeError as _error:
+            print("\nskipped {}: {}".format(_filename, _error))
+            continue
+        # end try
+        print("\n{}: {}".format(_filename, _diffs or "equivalent"))
+        if _diffs:
+            print("\n[ERROR] generated build differs!")
+            exit(1)
+        # end if
+    # end for
+    # succeeded
+    print("\nAll has been verified OK.")
+# end def
+
+
+
+# ----------------------------- NOW TESTING -------------------------
+
+
+# session start
+print("\n--- BEGIN TEST SESSION ---")
+
+test_generate_layouts()
+
+test_equivalence()
+
+# session end
+print("\n--- END OF TEST SESSION ---")
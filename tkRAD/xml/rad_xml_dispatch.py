@@ -0,0 +1,516 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# ====================   /!\ STANDALONE MODULE /!\   ===================
+
+# this module only needs the python standard library (python2 and
+# python3 compliant) as tkRAD.easy.builder STANDALONE modules ship
+# along with it;
+
+
+
+# lib imports
+
+import re
+
+import sys
+
+import weakref
+
+# optional build profiler (not shipped along STANDALONE modules)
+
+try:
+
+    from . import rad_xml_profiler as XP
+
+except (ImportError, ValueError, SystemError):
+
+    XP = None
+
+# end try
+
+
+
+class RADXMLDispatcher:
+    r"""
+        table-driven dispatcher shared by all XML builders of the
+        project (RADXMLBase, tkRAD.easy.builder and XMLGameset);
+
+        resolves element builders and attribute parsers of an
+        @owner builder object along naming rules (e.g.
+        "_build_element_{xml_tag}" or "_parse_attr_{attr}");
+
+        member names are computed only once per owner class and
+        bound members only once per dispatcher, so that no string
+        formatting, regexp filtering nor getattr() occurs on each
+        XML element or XML attribute;
+
+        naming rules may use any of {xml_element}, {xml_tag} or
+        {tag} for XML tag names and any of {xml_attribute},
+        {xml_attr} or {attr} for XML attribute names;
+
+        handlers set by set_element_builder() and
+        set_attribute_parser() take precedence over owner's
+        members, so that tags and attributes may be supported
+        without subclassing;
+
+        resolved members get wrapped by tkRAD build profiler, if
+        available and switched ON;
+    """
+
+
+
+    # per-class tables of resolved member names
+    # i.e. {class: {(pattern, tag, attr): member_name}}
+    # classes may come and go (weak keys)
+
+    _names = weakref.WeakKeyDictionary()
+
+    # max number of entries in each resolution table
+    # XML tag and attribute names come from XML sources: tables get
+    # reset once full, so that they cannot grow without limit
+
+    MAX_ENTRIES = 4096
+
+
+
+    def __init__ (self, owner):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.owner = owner
+
+        # bound members and pluggable handlers
+        # i.e. {(pattern, tag, attr): callable or None}
+
+        self.__members = dict()
+
+        self.__handlers = dict()
+
+    # end def
+
+
+
+    def clear (self):
+        r"""
+            drops all resolved members, so that they will be
+            resolved again on next use;
+
+            pluggable handlers are kept untouched;
+
+            no return value (void);
+        """
+
+        self.__members.clear()
+
+    # end def
+
+
+
+    def get_attribute_parser (self, xml_attribute, xml_tag = None):
+        r"""
+            retrieves attribute parser for @xml_attribute name along
+            owner's ATTRIBUTE_PARSER naming rule;
+
+            returns parser on success, None if not implemented (see
+            get_member());
+        """
+
+        return self.get_member(
+
+            self.owner.ATTRIBUTE_PARSER, xml_tag, xml_attribute
+        )
+
+    # end def
+
+
+
+    def get_element_builder (self, xml_tag):
+        r"""
+            retrieves element builder for @xml_tag name along
+            owner's ELEMENT_BUILDER naming rule;
+
+            returns builder on success, None if not implemented (see
+            get_member());
+        """
+
+        return self.get_member(self.owner.ELEMENT_BUILDER, xml_tag)
+
+    # end def
+
+
+
+    def get_member (self, pattern, xml_tag, xml_attribute = None):
+        r"""
+            retrieves element builder or attribute parser along
+            @pattern naming rule for @xml_tag and optional
+            @xml_attribute names;
+
+            pluggable handlers take precedence over owner's members;
+
+            an existing owner's member which is not callable is
+            returned as is: callers must check callable() and may
+            skip it silently, as it is implemented, though not as a
+            method;
+
+            returns member on success, None if not implemented;
+        """
+
+        # inits
+
+        _key = (pattern, xml_tag, xml_attribute)
+
+        # already resolved?
+
+        try:
+
+            return self.__members[_key]
+
+        except KeyError:
+
+            # pluggable handler (tag-specific first)
+
+            _member = self.__handlers.get(_key)
+
+            if _member is None:
+
+                _member = self.__handlers.get(
+
+                    (pattern, None, xml_attribute)
+                )
+
+            # end if
+
+            # owner's member (None if not implemented)
+
+            if _member is None:
+
+                _name = self.get_name(pattern, xml_tag, xml_attribute)
+
+                _member = getattr(self.owner, _name, None)
+
+                # member set to None (e.g. disabled in subclass) is
+                # implemented all the same: not callable, not None
+
+                if _member is None and hasattr(self.owner, _name):
+
+                    _member = False
+
+                # end if
+
+            # end if
+
+            # opt-in build profiling
+
+            if callable(_member) and XP \
+                                and XP.get_xml_profiler().is_enabled():
+
+                _member = XP.get_xml_profiler().wrap(_member)
+
+            # end if
+
+            # keep it for further calls
+
+            if len(self.__members) >= self.MAX_ENTRIES:
+
+                self.__members.clear()
+
+            # end if
+
+            self.__members[_key] = _member
+
+            return _member
+
+        # end try
+
+    # end def
+
+
+
+    def get_name (self, pattern, xml_tag, xml_attribute = None):
+        r"""
+            builds element builder or attribute parser member name
+            along @pattern naming rule for @xml_tag and optional
+            @xml_attribute names;
+
+            member names are resolved only once per owner class;
+
+            returns member name as a plain string of chars;
+        """
+
+        # inits
+
+        _key = (pattern, xml_tag, xml_attribute)
+
+        # member names table for owner's class
+
+        _names = self._names.setdefault(self.owner.__class__, dict())
+
+        # first use for this class?
+
+        if _key not in _names:
+
+            if len(_names) >= self.MAX_ENTRIES:
+
+                _names.clear()
+
+            # end if
+
+            _names[_key] = re.sub(
+
+                r"\W+",
+
+                r"",
+
+                str(pattern).format(
+
+                    xml_element = xml_tag,
+
+                    xml_tag = xml_tag,
+
+                    tag = xml_tag,
+
+                    xml_attribute = xml_attribute,
+
+                    xml_attr = xml_attribute,
+
+                    attr = xml_attribute,
+                )
+            )
+
+        # end if
+
+        return _names[_key]
+
+    # end def
+
+
+
+    def set_attribute_parser (self, xml_attribute, handler,
+    xml_tag = None):
+        r"""
+            plugs @handler callable as parser of @xml_attribute
+            for all XML tags or only for @xml_tag, if set;
+
+            @handler gets called as owner's parsers would be, but
+            without implicit 'self' owner argument;
+
+            @handler may be None to unplug a previous one;
+
+            no return value (void);
+        """
+
+        self.set_handler(
+
+            self.owner.ATTRIBUTE_PARSER, handler, xml_tag, xml_attribute
+        )
+
+    # end def
+
+
+
+    def set_element_builder (self, xml_tag, handler):
+        r"""
+            plugs @handler callable as builder of @xml_tag elements;
+
+            @handler gets called as owner's builders would be, but
+            without implicit 'self' owner argument;
+
+            @handler may be None to unplug a previous one;
+
+            no return value (void);
+        """
+
+        self.set_handler(self.owner.ELEMENT_BUILDER, handler, xml_tag)
+
+    # end def
+
+
+
+    def set_handler (self, pattern, handler, xml_tag = None,
+    xml_attribute = None):
+        r"""
+            plugs @handler callable for @pattern naming rule,
+            @xml_tag and @xml_attribute names (None means any);
+
+            no return value (void);
+        """
+
+        # inits
+
+        _key = (pattern, xml_tag, xml_attribute)
+
+        if handler is None:
+
+            self.__handlers.pop(_key, None)
+
+        elif callable(handler):
+
+            self.__handlers[_key] = handler
+
+        else:
+
+            raise TypeError(
+
+                "XML handler must be callable, not {}"
+
+                .format(repr(handler))
+            )
+
+        # end if
+
+        # resolve again on next use
+
+        self.clear()
+
+    # end def
+
+
+# end class RADXMLDispatcher
+
+
+
+def benchmark (number = 200000):
+    r"""
+        inline vs table-driven dispatch benchmark;
+
+        resolves @number times one element builder and one attribute
+        parser along the naming rules of each XML builder of the
+        project, with their former inline getattr() lookups then
+        with RADXMLDispatcher;
+
+        usage (from tkGAME root dir, no display needed):
+
+            python3 -m tkRAD.xml.rad_xml_dispatch [number]
+    """
+
+    # lib imports
+
+    from timeit import timeit
+
+    # consumers naming rules: (name, builder, parser, normalize)
+
+    _consumers = (
+
+        ("RADXMLBase", "_build_element_{xml_element}",
+
+            "_parse_attr_{xml_attribute}", True),
+
+        ("easy.Builder", "_build_element_{xml_tag}",
+
+            "_parse_attr_{attr}", False),
+
+        ("XMLGameset", "_build_element_{xml_tag}",
+
+            "_parse_attribute_{xml_attr}", False),
+    )
+
+    print("\nlookups:    {} x (1 builder + 1 parser)".format(number))
+
+    for _name, _builder, _parser, _normalize in _consumers:
+
+        class _Owner:
+
+            ELEMENT_BUILDER = _builder
+
+            ATTRIBUTE_PARSER = _parser
+
+            def _build_element_frame (self): pass
+
+            def _parse_attr_text (self): pass
+
+            _parse_attribute_text = _parse_attr_text
+
+        # end class
+
+        _owner = _Owner()
+
+        _dispatcher = RADXMLDispatcher(_owner)
+
+        def _inline ():
+
+            _b = _builder.format(
+
+                xml_element = "frame", xml_tag = "frame"
+            )
+
+            _p = _parser.format(
+
+                xml_attribute = "text", xml_attr = "text", attr = "text"
+            )
+
+            if _normalize:
+
+                _b = re.sub(r"\W+", r"", _b)
+
+                _p = re.sub(r"\W+", r"", _p)
+
+            # end if
+
+            return getattr(_owner, _b, None), getattr(_owner, _p, None)
+
+        # end def
+
+        def _table ():
+
+            return (
+
+                _dispatcher.get_element_builder("frame"),
+
+                _dispatcher.get_attribute_parser("text", "frame"),
+            )
+
+        # end def
+
+        _t_inline = timeit(_inline, number = number)
+
+        _t_table = timeit(_table, number = number)
+
+        print(
+
+            "{:<12} inline: {:.3f} s  table: {:.3f} s  speedup: x{:.1f}"
+
+            .format(_name, _t_inline, _t_table, _t_inline / _t_table)
+        )
+
+    # end for
+
+    print()
+
+# end def
+
+
+
+# benchmark launching (not imported)?
+
+if __name__ == "__main__":
+
+    benchmark(*map(int, sys.argv[1:]))
+
+# end if
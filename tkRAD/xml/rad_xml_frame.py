@@ -26,6 +26,8 @@
 
 # lib imports
 
+import sys
+
 from tkinter import ttk
 
 from ..core import tools
@@ -86,3 +88,99 @@ class RADXMLFrame (XW.RADXMLWidget, ttk.Frame):
 
 
 # end class RADXMLFrame
+
+
+
+def benchmark (rows = 500, number = 3):
+    r"""
+        batched vs immediate layouts benchmark;
+
+        builds a generated form of @rows rows (frame + label + entry
+        + button, grid and pack layouts mixed) @number times with
+        RADXMLWidget.BATCH_LAYOUTS switched ON then OFF, until
+        geometry is settled down (update_idletasks);
+
+        usage (from tkGAME root dir, needs a display):
+
+            python3 -m tkRAD.xml.rad_xml_frame [rows]
+    """
+
+    # lib imports
+
+    import tkinter as TK
+
+    from time import perf_counter
+
+    # generated form
+
+    _row = """
+        <frame layout="pack" resizable="width">
+            <label text="Field {n}" layout="grid"
+                layout_options="row=0, column=0, padx=2"/>
+            <entry layout="grid" resizable="width"
+                layout_options="row=0, column=1"/>
+            <button text="..." layout="grid"
+                layout_options="row=0, column=2"/>
+        </frame>
+    """
+
+    _xml = "<tkwidget>{}</tkwidget>".format(
+
+        "".join(_row.format(n = _n) for _n in range(rows))
+    )
+
+    _root = TK.Tk()
+
+    def _build (batch):
+
+        RADXMLFrame.BATCH_LAYOUTS = batch
+
+        _timings = list()
+
+        for _i in range(number):
+
+            _frame = RADXMLFrame(_root)
+
+            _frame.pack(expand = 1, fill = TK.BOTH)
+
+            _start = perf_counter()
+
+            _frame.xml_build(_xml)
+
+            _root.update_idletasks()
+
+            _timings.append(perf_counter() - _start)
+
+            _frame.destroy()
+
+        # end for
+
+        return min(_timings)
+
+    # end def
+
+    _immediate = _build(False)
+
+    _batched = _build(True)
+
+    _root.destroy()
+
+    print("\nform rows:  {}".format(rows))
+
+    print("immediate:  {:.1f} ms".format(_immediate * 1e3))
+
+    print("batched:    {:.1f} ms".format(_batched * 1e3))
+
+    print("speedup:    x{:.2f}\n".format(_immediate / _batched))
+
+# end def
+
+
+
+# benchmark launching (not imported)?
+
+if __name__ == "__main__":
+
+    benchmark(*map(int, sys.argv[1:]))
+
+# end if
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+    tkRAD - tkinter Rapid Application Development library
+
+    (c) 2013+ Raphaël SEBAN <motus@laposte.net>
+
+    This program is free software: you can redistribute it and/or
+    modify it under the terms of the GNU General Public License as
+    published by the Free Software Foundation, either version 3 of
+    the License, or (at your option) any later version.
+
+    This program is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU
+    General Public License for more details.
+
+    You should have received a copy of the GNU General Public
+    License along with this program.
+
+    If not, see: http://www.gnu.org/licenses/
+"""
+
+
+
+# lib imports
+
+import os
+
+import sys
+
+import json
+
+import atexit
+
+import functools
+
+from time import perf_counter
+
+
+
+# unique instance pointer
+
+# module private var init
+
+__xml_profiler = None
+
+
+
+# service getter
+
+def get_xml_profiler ():
+    r"""
+        gets a unique application-wide instance of the XML build
+        profiler;
+
+        always return the profiler unique instance pointer;
+    """
+
+    global __xml_profiler
+
+    if not isinstance(__xml_profiler, RADXMLProfiler):
+
+        __xml_profiler = RADXMLProfiler()
+
+    # end if
+
+    return __xml_profiler
+
+# end def
+
+
+
+class RADXMLProfiler:
+    r"""
+        opt-in build-time profiler for XML builders;
+
+        records wall time and call counts of each element builder
+        (e.g. _build_element_button) and each attribute parser
+        (e.g. _parse_attr_font, _tkRAD_font_support);
+
+        'total' time includes nested calls (e.g. a <frame> builder
+        includes its children), while 'own' time does not;
+
+        profiling is OFF by default and costs nothing at all in this
+        case: builders only wrap their members when profiler is ON at
+        the time they resolve them;
+
+        switch it ON with environment variable
+        TKRAD_PROFILE_XML=table|json, with CLI option
+        --profile-xml [table|json] of RADApplication or by calling
+        switch_on() before building;
+    """
+
+
+
+    CONFIG = {
+
+        "env_var": "TKRAD_PROFILE_XML",
+
+        "formats": ("table", "json"),
+
+    } # end of CONFIG
+
+
+
+    def __init__ (self):
+        r"""
+            class constructor;
+        """
+
+        # member inits
+
+        self.__enabled = False
+
+        self.__dump_format = None
+
+        # i.e. {name: [calls, total, own, max]}
+
+        self.__stats = dict()
+
+        # nested calls time accumulators
+
+        self.__stack = list()
+
+        # environment variable support
+
+        _format = os.environ.get(self.CONFIG["env_var"])
+
+        if _format:
+
+            self.switch_on(dump_at_exit = _format)
+
+        # end if
+
+    # end def
+
+
+
+    def _dump_at_exit (self):
+        r"""
+            protected method def;
+
+            atexit callback: dumps report to sys.stderr;
+
+            no return value (void);
+        """
+
+        if self.__dump_format and self.__stats:
+
+            self.dump(self.__dump_format, sys.stderr)
+
+        # end if
+
+    # end def
+
+
+
+    def dump (self, fmt = "table", stream = None):
+        r"""
+            writes report into @stream (default: sys.stdout) along
+            with @fmt format, either "table" or "json";
+
+            no return value (void);
+        """
+
+        # param inits
+
+        stream = stream or sys.stdout
+
+        if fmt == "json":
+
+            json.dump(self.get_report(), stream, indent = 4)
+
+            stream.write("\n")
+
+        else:
+
+            stream.write(self.get_table())
+
+        # end if
+
+    # end def
+
+
+
+    def get_report (self):
+        r"""
+            returns a list of dict() records sorted by descending
+            own time, one for each profiled member, with keys
+            'name', 'calls', 'total', 'own', 'mean' and 'max'
+            (times in seconds);
+        """
+
+        # inits
+
+        _report = list()
+
+        for _name, (_calls, _total, _own, _max) in self.__stats.items():
+
+            _report.append(
+
+                dict(
+
+                    name = _name,
+
+                    calls = _calls,
+
+                    total = _total,
+
+                    own = _own,
+
+                    mean = _total / _calls,
+
+                    max = _max,
+                )
+            )
+
+        # end for
+
+        _report.sort(key = lambda r: r["own"], reverse = True)
+
+        return _report
+
+    # end def
+
+
+
+    def get_table (self):
+        r"""
+            returns report as a plain text table sorted by
+            descending own time (times in milliseconds);
+        """
+
+        # inits
+
+        _row = "{:<40} {:>8} {:>11} {:>11} {:>10} {:>10}\n"
+
+        _table = _row.format(
+
+            "member", "calls", "own ms", "total ms", "mean ms", "max ms"
+        )
+
+        for _r in self.get_report():
+
+            _table += _row.format(
+
+                _r["name"],
+
+                _r["calls"],
+
+                "{:.3f}".format(_r["own"] * 1e3),
+
+                "{:.3f}".format(_r["total"] * 1e3),
+
+                "{:.4f}".format(_r["mean"] * 1e3),
+
+                "{:.4f}".format(_r["max"] * 1e3),
+            )
+
+        # end for
+
+        return _table
+
+    # end def
+
+
+
+    def is_enabled (self):
+        r"""
+            returns True if profiler is ON, False otherwise;
+        """
+
+        return self.__enabled
+
+    # end def
+
+
+
+    def reset (self):
+        r"""
+            resets all recorded data;
+
+            no return value (void);
+        """
+
+        # clear in place: wrapped members keep references
+
+        self.__stats.clear()
+
+        del self.__stack[:]
+
+    # end def
+
+
+
+    def switch_off (self):
+        r"""
+            switches profiler OFF;
+
+            members already wrapped by builders keep on recording;
+        """
+
+        self.__enabled = False
+
+    # end def
+
+
+
+    def switch_on (self, dump_at_exit = None):
+        r"""
+            switches profiler ON;
+
+            if @dump_at_exit is "table" or "json" (any other non-empty
+            value means "table"), report gets written to sys.stderr
+            at program exit;
+
+            no return value (void);
+        """
+
+        self.__enabled = True
+
+        if dump_at_exit:
+
+            if dump_at_exit not in self.CONFIG["formats"]:
+
+                dump_at_exit = "table"
+
+            # end if
+
+            # register only once
+
+            if not self.__dump_format:
+
+                atexit.register(self._dump_at_exit)
+
+            # end if
+
+            self.__dump_format = dump_at_exit
+
+        # end if
+
+    # end def
+
+
+
+    def wrap (self, member, name = None):
+        r"""
+            wraps callable @member into a timing recorder;
+
+            @name defaults to @member.__name__;
+
+            returns wrapper callable;
+        """
+
+        # inits
+
+        name = name or getattr(member, "__name__", repr(member))
+
+        _stats = self.__stats
+
+        _stack = self.__stack
+
+        @functools.wraps(member)
+        def _profiled (*args, **kw):
+
+            # nested calls time accumulator
+
+            _stack.append(0.0)
+
+            _start = perf_counter()
+
+            try:
+
+                return member(*args, **kw)
+
+            finally:
+
+                _elapsed = perf_counter() - _start
+
+                _own = _elapsed - _stack.pop()
+
+                # let caller know about nested time
+
+                if _stack:
+
+                    _stack[-1] += _elapsed
+
+                # end if
+
+                _record = _stats.get(name)
+
+                if _record is None:
+
+                    _stats[name] = [1, _elapsed, _own, _elapsed]
+
+                else:
+
+                    _record[0] += 1
+
+                    _record[1] += _elapsed
+
+                    _record[2] += _own
+
+                    if _elapsed > _record[3]:
+
+                        _record[3] = _elapsed
+
+                    # end if
+
+                # end if
+
+            # end try
+
+        # end def
+
+        return _profiled
+
+    # end def
+
+
+# end class RADXMLProfiler
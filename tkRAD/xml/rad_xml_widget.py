@@ -26,18 +26,34 @@
 
 # lib imports
 
+import os
+
 import re
 
+import copy
+
+import difflib
+
+import traceback
+
+import os.path as OP
+
+import importlib.util
+
 import tkinter as TK
 
 from tkinter import ttk
 
+from .. import __version__
+
 from ..core import tools
 
 from ..core import path
 
 from . import rad_xml_widget_base as RB
 
+from . import rad_xml_cache as XC
+
 
 
 class RADXMLWidget (RB.RADXMLWidgetBase):
@@ -294,6 +310,18 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
     } # end of DTD
 
 
+
+    # root elements integrating their children directly into
+    # tk_owner, along with their accepted child elements
+    # overrides RADXMLBase.STREAM_ROOTS
+
+    STREAM_ROOTS = {
+
+        "tkwidget": DTD["widget"],
+
+    } # end of STREAM_ROOTS
+
+
     # XML file path parts for xml_build() automatic mode
     # overrides RADXMLBase.XML_RC
 
@@ -307,10 +335,119 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
+    # ahead-of-time generated module file name suffix
+    # e.g. "^/xml/widget/mainwindow.xml" -->
+    # "^/xml/widget/mainwindow_xml.py"
+    # see tkRAD.xml.rad_xml_codegen for more detail
+
+    AOT_MODULE_SUFFIX = "_xml.py"
+
+    # AOT mode: xml_build() runs up-to-date generated modules instead
+    # of interpreting XML; OFF until generated builds have been
+    # checked against interpreted ones on a display
+    # see tkRAD.xml.rad_xml_codegen.check_equivalence()
+
+    AOT_MODULES = False
+
+    # pack(), grid() and place() calls are collected during
+    # xml_build() and applied at the end, one pass per container
+    # see _flush_layouts()
+    # OFF until measured: python3 -m tkRAD.xml.rad_xml_frame
+
+    BATCH_LAYOUTS = False
+
+    # XML watch mode default polling interval (in milliseconds)
+    # see xml_watch()
+
+    WATCH_INTERVAL = 500
+
+
+
+    # class-wide tables of AOT modules and compatible classes
+    # do *NOT* uppercase: RADWidgetBase would copy them
+
+    _aot_modules = dict()
+
+    _aot_classes = dict()
+
+
+
+    def __init__ (self, tk_owner = None, **kw):
+        r"""
+            class constructor;
+        """
+
+        # <include> support inits
+        # see _build_element_include()
+
+        self.__include_loader = None
+
+        self.__including = set()
+
+        # batched layouts i.e. {container: [(widget, layout, opts)]}
+        # None when not batching (see xml_build())
+
+        self.__layouts = None
+
+        # XML watch mode inits (None when not watching)
+        # i.e. {path, mtime, interval, after_id, tree} and
+        # {xml_element: (tk_parent, [built widgets])}
+        # see xml_watch()
+
+        self.__watch = None
+
+        self.__built = None
+
+        # super class inits
+
+        RB.RADXMLWidgetBase.__init__(self, tk_owner, **kw)
+
+    # end def
+
+
+
     # ------------------  XML elements building  -----------------------
 
 
 
+    def _build_element (self, xml_element, tk_parent):
+        r"""
+            keeps track of tkinter widgets built along each XML
+            element while in XML watch mode (see xml_watch()),
+            delegates to RADXMLBase._build_element() in any case;
+
+            returns True on element building success, False otherwise;
+        """
+
+        # not watching?
+
+        if self.__built is None:
+
+            return super()._build_element(xml_element, tk_parent)
+
+        # end if
+
+        # inits
+
+        _children = getattr(tk_parent, "children", dict())
+
+        _count = len(_children)
+
+        _build_ok = super()._build_element(xml_element, tk_parent)
+
+        # newly created tkinter children (insertion order)
+
+        self.__built[xml_element] = (
+
+            tk_parent, list(_children.values())[_count:]
+        )
+
+        return _build_ok
+
+    # end def
+
+
+
     def _build_element_button (self, xml_tag, xml_element, tk_parent):
         r"""
             Tkinter native widget building;
@@ -493,44 +630,55 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
                 xml_tag, xml_element, tk_parent
             )
 
-            # set inclusion widget
+            # retrieve included file path
 
-            _widget = RADXMLWidget(
+            _path = self._get_include_path(**_attributes)
 
-                tk_owner = tk_parent,
+            # recursive inclusion? (cheap check)
 
-                slot_owner = self.slot_owner,
+            if _path in self.__including:
 
-                **_attributes
-            )
+                raise RuntimeError(
 
-            # ensure there won't be any unexpected inclusion /!\
+                    _(
+                        "Recursive XML <include> of file '{path}'."
 
-            _widget.XML_RC.clear()
+                    ).format(path = _path)
+                )
 
-            # $ 2014-02-09 RS $
-            # CAUTION:
-            # removed self-inclusion security;
-            # let Python handle this trap!
+            # end if
 
             # get XML tree
+            # parsed once for all along with include cache
 
-            _widget.xml_load(_attributes.get("src"))
+            _xml_root = XC.get_include_cache().get_subtree(_path)
 
-            # include new XML tree to current one
+            # keep XML tree index up-to-date
 
-            xml_element = _widget.get_xml_tree().getroot()
+            self._splice_subtree(xml_element, _xml_root)
+
+            xml_element = _xml_root
 
             # free useless memory right now /!\
 
-            del _attributes, _widget
+            del _attributes, _xml_root
 
             # build inclusion
 
-            return self._loop_on_children(
+            self.__including.add(_path)
 
-                xml_element, tk_parent, accept=self.DTD.get("widget")
-            )
+            try:
+
+                return self._loop_on_children(
+
+                    xml_element, tk_parent, accept=self.DTD.get("widget")
+                )
+
+            finally:
+
+                self.__including.discard(_path)
+
+            # end try
 
         # end if
 
@@ -2050,6 +2198,52 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
+    def _build_xml_tree (self, filename = None):
+        r"""
+            protected method def;
+
+            runs ahead-of-time generated python module if AOT mode
+            is ON and one is up-to-date with XML @filename, falls
+            back to XML interpretation otherwise;
+
+            overrides RADXMLBase._build_xml_tree(): both get the
+            same xml_build() error handling;
+
+            returns True on overall success, False, otherwise;
+        """
+
+        # AOT generated module inits
+        # XML watch mode needs XML interpretation
+
+        _module = None
+
+        if self.AOT_MODULES and self.__built is None:
+
+            _module = self._get_aot_module(filename)
+
+        # end if
+
+        if _module is None:
+
+            return super()._build_xml_tree(filename)
+
+        # end if
+
+        # build widgets - generated module runs its own <module>
+        # imports in its own namespace
+
+        _build_ok = _module.build(self, self.tk_owner)
+
+        # flush all deferred actions in queue
+
+        self._flush_deferred()
+
+        return _build_ok
+
+    # end def
+
+
+
     def _ensure_string_value (self, attribute, **kw):
         r"""
             will set attr value at least an empty string of chars;
@@ -2078,6 +2272,248 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
+    def _flush_deferred (self):
+        r"""
+            protected method def;
+
+            applies batched layouts before any other deferred action
+            (e.g. 'init' callbacks), so that these get widgets
+            already laid out;
+
+            overrides RADXMLBase._flush_deferred();
+
+            no return value (void);
+        """
+
+        self._flush_layouts()
+
+        super()._flush_deferred()
+
+    # end def
+
+
+
+    def _flush_layouts (self):
+        r"""
+            protected method def;
+
+            applies batched pack(), grid() and place() calls, one
+            pass per container, innermost containers first;
+
+            geometry propagation of each container is suspended
+            while its children get laid out, so that Tk propagates
+            geometry once per container instead of once per widget;
+
+            no return value (void);
+        """
+
+        # nothing to do?
+
+        if not self.__layouts:
+
+            return
+
+        # end if
+
+        # inits
+
+        _layouts = self.__layouts
+
+        self.__layouts = dict()
+
+        # containers are registered after their own parents
+
+        for _master, _items in reversed(tuple(_layouts.items())):
+
+            # propagation managers used in this container
+
+            _managers = set(_item[1] for _item in _items) \
+                                                & {"pack", "grid"}
+
+            # suspend geometry propagation
+
+            _propagate = dict()
+
+            for _manager in _managers:
+
+                _switch = getattr(_master, _manager + "_propagate")
+
+                _propagate[_switch] = _switch()
+
+                _switch(False)
+
+            # end for
+
+            try:
+
+                # lay children out
+
+                for _widget, _layout, _options in _items:
+
+                    getattr(_widget, _layout)(**_options)
+
+                # end for
+
+            finally:
+
+                # restore geometry propagation
+
+                for _switch, _flag in _propagate.items():
+
+                    _switch(_flag)
+
+                # end for
+
+            # end try
+
+        # end for
+
+    # end def
+
+
+
+    def _get_aot_module (self, filename = None):
+        r"""
+            tries to retrieve an up-to-date ahead-of-time generated
+            python module along XML @filename;
+
+            returns module object on success, None otherwise;
+        """
+
+        # XML source string or already loaded XML tree?
+
+        if self.is_xml(filename) or not self._is_aot_compatible() or (
+
+            self.is_tree(self.get_xml_tree()) and
+
+            not tools.is_pstr(filename)):
+
+            return None
+
+        # end if
+
+        # auto-numbered ids are computed at generation time
+        # for a brand new builder
+
+        if self.get_objects():
+
+            return None
+
+        # end if
+
+        # XML file and generated module paths
+
+        try:
+
+            _xml_path = self.get_xml_path(filename)
+
+        except OSError:
+
+            return None
+
+        # end try
+
+        _path = OP.splitext(_xml_path)[0] + self.AOT_MODULE_SUFFIX
+
+        # generated module must be newer than XML source
+
+        try:
+
+            _mtime = OP.getmtime(_path)
+
+            if _mtime < OP.getmtime(_xml_path):
+
+                return None
+
+            # end if
+
+        except OSError:
+
+            return None
+
+        # end try
+
+        # already loaded?
+
+        _key = (_path, _mtime)
+
+        _module = self._aot_modules.get(_key)
+
+        if _module is None:
+
+            _spec = importlib.util.spec_from_file_location(
+
+                "tkRAD_aot_{}".format(tools.normalize_id(_path)), _path
+            )
+
+            _module = importlib.util.module_from_spec(_spec)
+
+            _spec.loader.exec_module(_module)
+
+            self._aot_modules[_key] = _module
+
+        # end if
+
+        # generated by this very release of tkRAD?
+
+        if getattr(_module, "TKRAD_VERSION", None) == __version__ and \
+                    getattr(_module, "DOCTYPE", None) == self.DOCTYPE:
+
+            return _module
+
+        # end if
+
+        return None
+
+    # end def
+
+
+
+    def _get_include_path (self, src = None, **kw):
+        r"""
+            resolves XML <include> element's file path along @src,
+            @kw["xml_dir"], @kw["xml_filename"] and @kw["xml_file_ext"]
+            attributes;
+
+            a single XML_RC-free RADXMLWidget path resolver is kept
+            for all inclusions, so that no throwaway builder object
+            gets created on each <include>;
+
+            raises OSError if unable to build a correct path;
+
+            returns normalized path;
+        """
+
+        # path resolver inits
+
+        _loader = self.__include_loader
+
+        if _loader is None:
+
+            _loader = RADXMLWidget(slot_owner = self.slot_owner)
+
+            # ensure there won't be any unexpected inclusion /!\
+
+            _loader.XML_RC.clear()
+
+            self.__include_loader = _loader
+
+        # end if
+
+        # reset path parts
+
+        _loader.set_xml_dir(kw.get("xml_dir"))
+
+        _loader.set_xml_filename(kw.get("xml_filename"))
+
+        _loader.set_xml_file_ext(kw.get("xml_file_ext"))
+
+        return path.normalize(_loader.get_xml_path(src))
+
+    # end def
+
+
+
     def _init_attributes (self, xml_tag, xml_element, tk_parent, **kw):
         r"""
             parses @xml_element param XML attributes along @xml_tag
@@ -2203,11 +2639,80 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
 
 
-    def _layout_toplevel (self, widget, attrs, tk_parent):
+    def _is_aot_compatible (self):
         r"""
-            sets Toplevel main window inits and layouts;
+            determines if current class builds XML exactly as
+            RADXMLWidget does i.e. it does not redefine any XML
+            element builder, attribute parser or XML definitions;
 
-            no return value (void);
+            ahead-of-time generated modules are only used for such
+            classes, e.g. a subclass only switching AOT_MODULES ON;
+
+            returns True on success, False otherwise;
+        """
+
+        _class = self.__class__
+
+        _ok = self._aot_classes.get(_class)
+
+        if _ok is None:
+
+            _ok = all(
+
+                getattr(_class, _name, None) is getattr(RADXMLWidget, _name)
+
+                for _name in dir(RADXMLWidget)
+
+                if not _name.startswith("__") and _name != "AOT_MODULES"
+            )
+
+            self._aot_classes[_class] = _ok
+
+        # end if
+
+        return _ok
+
+    # end def
+
+
+
+    def _lay_out (self, widget, layout, options):
+        r"""
+            protected method def;
+
+            calls @widget's @layout method (pack, grid or place) with
+            @options keyword arguments or postpones it until the end
+            of xml_build() if layouts are being batched;
+
+            no return value (void);
+        """
+
+        # not batching?
+
+        if self.__layouts is None:
+
+            getattr(widget, layout)(**options)
+
+        # postpone until _flush_layouts()
+
+        else:
+
+            self.__layouts.setdefault(widget.master, list()).append(
+
+                (widget, layout, options)
+            )
+
+        # end if
+
+    # end def
+
+
+
+    def _layout_toplevel (self, widget, attrs, tk_parent):
+        r"""
+            sets Toplevel main window inits and layouts;
+
+            no return value (void);
         """
 
         # window state inits
@@ -5254,9 +5759,12 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
             self._set_resizable(widget, attrs, tk_parent)
 
-            # lay widget out
+            # lay widget out (or postpone)
 
-            exec("widget.{layout}(**{layout_options})".format(**attrs))
+            self._lay_out(
+
+                widget, attrs["layout"], attrs.get("layout_options") or {}
+            )
 
         # end if
 
@@ -5440,6 +5948,10 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
 
             widget.configure(**_attrs)
 
+            # keep track of control vars and images in use
+
+            self._track_resources(widget, _attrs)
+
             # succeeded
 
             return True
@@ -5453,4 +5965,739 @@ class RADXMLWidget (RB.RADXMLWidgetBase):
     # end def
 
 
+
+    def _xml_patch (self, old, new, stats):
+        r"""
+            protected method def;
+
+            XML watch mode: patches widgets built along @old
+            (pristine, built) XML element pair so that they match
+            @new (pristine, to build) XML element pair, provided
+            both share the same tag and id;
+
+            reconfigures widget in place when only tkinter options
+            have changed, recurses on children otherwise;
+
+            returns True on success, False if @new element must be
+            rebuilt as a whole;
+        """
+
+        # inits
+
+        _old_p, _old_b = old
+
+        _new_p, _new_b = new
+
+        _record = self.__built.get(_old_b)
+
+        # children are tkinter children of a single widget?
+
+        _tk_parent = None
+
+        if _record is not None and len(_record[1]) == 1:
+
+            _tk_parent = _record[1][0]
+
+        # unpatchable children?
+
+        elif not self._xml_same_subtree(_old_p, _new_p) \
+                    and (len(_old_p) or len(_new_p)):
+
+            return False
+
+        # end if
+
+        # XML element itself has changed?
+
+        if not self._xml_same_element(_old_p, _new_p):
+
+            if not self._xml_reconfigure(old, new):
+
+                return False
+
+            # end if
+
+            stats["reconfigured"] += 1
+
+        # end if
+
+        # keep track of built widgets
+
+        if _tk_parent is None:
+
+            self._xml_transfer(_old_b, _new_b)
+
+        else:
+
+            self.__built[_new_b] = self.__built.pop(_old_b)
+
+            self._xml_patch_children(old, new, _tk_parent, stats)
+
+        # end if
+
+        # succeeded
+
+        return True
+
+    # end def
+
+
+
+    def _xml_patch_children (self, old, new, tk_parent, stats):
+        r"""
+            protected method def;
+
+            XML watch mode: matches children of @old and @new
+            (pristine, built) XML element pairs along their tags and
+            ids, patches matching ones in place, tears down removed
+            ones and builds added or changed ones into @tk_parent;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _old_kids = list(zip(old[0], old[1]))
+
+        _new_kids = list(zip(new[0], new[1]))
+
+        _fresh = set()
+
+        def _key (pair):
+
+            return (pair[0].tag, pair[0].get("id"))
+
+        # end def
+
+        _matcher = difflib.SequenceMatcher(
+
+            None,
+
+            list(map(_key, _old_kids)),
+
+            list(map(_key, _new_kids)),
+
+            autojunk = False,
+        )
+
+        for _op, _i1, _i2, _j1, _j2 in _matcher.get_opcodes():
+
+            # same tag and id, patch in place if possible
+
+            if _op == "equal":
+
+                _pairs = zip(_old_kids[_i1:_i2], _new_kids[_j1:_j2])
+
+                _old_list = list()
+
+                _new_list = list()
+
+                for _old, _new in _pairs:
+
+                    if not self._xml_patch(_old, _new, stats):
+
+                        _old_list.append(_old)
+
+                        _new_list.append(_new)
+
+                    # end if
+
+                # end for
+
+            # added, removed or replaced
+
+            else:
+
+                _old_list = _old_kids[_i1:_i2]
+
+                _new_list = _new_kids[_j1:_j2]
+
+            # end if
+
+            for _old in _old_list:
+
+                self._xml_unbuild(_old[1])
+
+            # end for
+
+            for _new in _new_list:
+
+                self._build_element(_new[1], tk_parent)
+
+                _fresh.add(_new[1])
+
+                stats["rebuilt"] += 1
+
+            # end for
+
+        # end for
+
+        # newly built widgets should keep XML order
+
+        if _fresh:
+
+            self._xml_restack([_new[1] for _new in _new_kids], _fresh)
+
+        # end if
+
+    # end def
+
+
+
+    def _xml_reconfigure (self, old, new):
+        r"""
+            protected method def;
+
+            XML watch mode: reconfigures widget built along @old
+            (pristine, built) XML element pair in place, provided
+            @new XML element pair only adds or changes attributes
+            which are tkinter options of this widget;
+
+            returns True on success, False otherwise;
+        """
+
+        # inits
+
+        _old_p = old[0]
+
+        _new_p, _new_b = new
+
+        _record = self.__built.get(old[1])
+
+        # single widget built along XML element?
+
+        if _record is None or len(_record[1]) != 1:
+
+            return False
+
+        # end if
+
+        _tk_parent, (_widget, ) = _record
+
+        # removed attributes or changed text cannot be reset
+
+        _text = (_old_p.text or "").strip()
+
+        if set(_old_p.attrib) - set(_new_p.attrib) \
+                                or _text != (_new_p.text or "").strip():
+
+            return False
+
+        # end if
+
+        # changed attributes must all be tkinter options
+
+        _changed = dict(
+
+            (_key, _value) for _key, _value in _new_p.attrib.items()
+
+            if _old_p.get(_key) != _value
+        )
+
+        _options = _widget.keys()
+
+        for _key in _changed:
+
+            if _key.lower().lstrip("_") not in _options:
+
+                return False
+
+            # end if
+
+        # end for
+
+        # parse changed attributes only
+
+        self._before_building_element()
+
+        self._parse_xml_attributes(
+
+            _new_b, _tk_parent, xml_attrs = _changed
+        )
+
+        self._queue.flush("widget", widget = _widget)
+
+        return self._set_widget_config(_widget, self.TK_CONFIG)
+
+    # end def
+
+
+
+    def _xml_restack (self, xml_elements, fresh):
+        r"""
+            protected method def;
+
+            XML watch mode: packs widgets built along @fresh XML
+            elements just before packed widgets of next sibling in
+            @xml_elements list, so that pack() order still matches
+            XML order (grid() and place() do not depend on order);
+
+            no return value (void);
+        """
+
+        # inits
+
+        _next = None
+
+        for _element in reversed(xml_elements):
+
+            _widgets = [
+
+                _widget
+
+                for _widget in self.__built.get(_element, (None, ()))[1]
+
+                if _widget.winfo_manager() == "pack"
+            ]
+
+            if _element in fresh and _next is not None:
+
+                for _widget in _widgets:
+
+                    _widget.pack_configure(before = _next)
+
+                # end for
+
+            # end if
+
+            if _widgets:
+
+                _next = _widgets[0]
+
+            # end if
+
+        # end for
+
+    # end def
+
+
+
+    def _xml_same_element (self, xml_element1, xml_element2):
+        r"""
+            protected method def;
+
+            determines if XML elements have the same tag, attributes
+            and text, whatever their children may be;
+
+            returns True on success, False otherwise;
+        """
+
+        return (
+
+            xml_element1.tag == xml_element2.tag
+
+            and xml_element1.attrib == xml_element2.attrib
+
+            and (xml_element1.text or "").strip()
+
+                == (xml_element2.text or "").strip()
+        )
+
+    # end def
+
+
+
+    def _xml_same_subtree (self, xml_element1, xml_element2):
+        r"""
+            protected method def;
+
+            determines if XML elements are the same, children
+            included;
+
+            returns True on success, False otherwise;
+        """
+
+        return (
+
+            self._xml_same_element(xml_element1, xml_element2)
+
+            and len(xml_element1) == len(xml_element2)
+
+            and all(
+
+                self._xml_same_subtree(_child1, _child2)
+
+                for _child1, _child2 in zip(xml_element1, xml_element2)
+            )
+        )
+
+    # end def
+
+
+
+    def _xml_transfer (self, old_element, new_element):
+        r"""
+            protected method def;
+
+            XML watch mode: hands widgets built along @old_element
+            subtree over to @new_element subtree, provided both
+            subtrees have the same structure;
+
+            no return value (void);
+        """
+
+        for _old, _new in zip(old_element.iter(), new_element.iter()):
+
+            _record = self.__built.pop(_old, None)
+
+            if _record is not None:
+
+                self.__built[_new] = _record
+
+            # end if
+
+        # end for
+
+    # end def
+
+
+
+    def _xml_unbuild (self, xml_element):
+        r"""
+            protected method def;
+
+            XML watch mode: tears down all widgets built along
+            @xml_element subtree (see destroy_subtree());
+
+            no return value (void);
+        """
+
+        for _element in xml_element.iter():
+
+            _record = self.__built.pop(_element, None)
+
+            if _record is not None:
+
+                for _widget in _record[1]:
+
+                    # may have been destroyed along with its parent
+
+                    if _widget.winfo_exists():
+
+                        self.destroy_subtree(_widget)
+
+                    # end if
+
+                # end for
+
+            # end if
+
+        # end for
+
+    # end def
+
+
+
+    def _xml_watch_poll (self):
+        r"""
+            protected method def;
+
+            XML watch mode: checks watched XML file modification
+            time and patches built widgets if file has changed;
+
+            reschedules itself along with polling interval;
+
+            no return value (void);
+        """
+
+        # inits
+
+        _watch = self.__watch
+
+        # watch mode is OFF?
+
+        if _watch is None:
+
+            return
+
+        # end if
+
+        try:
+
+            _mtime = os.stat(_watch["path"]).st_mtime_ns
+
+        except OSError:
+
+            # file may be temporarily missing while being saved
+
+            _mtime = _watch["mtime"]
+
+        # end try
+
+        # file has changed?
+
+        if _mtime != _watch["mtime"]:
+
+            _watch["mtime"] = _mtime
+
+            # keep on watching, whatever happens
+
+            try:
+
+                self.xml_reload()
+
+            except Exception:
+
+                print(
+
+                    _(
+                        "[WARNING] RADXMLWidget::xml_reload: "
+
+                        "could not patch widgets:\n{msg}"
+
+                    ).format(msg = traceback.format_exc(limit = 0))
+                )
+
+            # end try
+
+        # end if
+
+        # next polling
+
+        _watch["after_id"] = self.tk_owner.after(
+
+            _watch["interval"], self._xml_watch_poll
+        )
+
+    # end def
+
+
+
+    def xml_build (self, filename = None, silent_mode = False):
+        r"""
+            public entry point of XML widget building;
+
+            runs ahead-of-time generated python module if AOT mode
+            is ON and one is up-to-date with XML @filename, falls
+            back to XML interpretation otherwise (see
+            RADXMLBase.xml_build() and AOT_MODULES);
+
+            returns True on overall success, False, otherwise;
+        """
+
+        # already batching layouts? (nested call)
+
+        if self.__layouts is not None or not self.BATCH_LAYOUTS:
+
+            return super().xml_build(filename, silent_mode)
+
+        # end if
+
+        # collect layouts while building
+
+        self.__layouts = dict()
+
+        try:
+
+            # layouts get applied in one pass per container
+            # see _flush_deferred()
+
+            return super().xml_build(filename, silent_mode)
+
+        finally:
+
+            self.__layouts = None
+
+        # end try
+
+    # end def
+
+
+
+    def xml_reload (self):
+        r"""
+            XML watch mode: patches built widgets along current
+            contents of watched XML file (see xml_watch());
+
+            new XML tree is diffed against previous one along XML
+            tags and ids: widgets only get reconfigured in place
+            when only tkinter options have changed, changed
+            subtrees get torn down and rebuilt, unchanged ones are
+            kept untouched;
+
+            returns dict() of 'reconfigured' and 'rebuilt' XML
+            elements counts, None if not watching;
+        """
+
+        # inits
+
+        _watch = self.__watch
+
+        # watch mode is OFF?
+
+        if _watch is None:
+
+            return None
+
+        # end if
+
+        # new XML tree (raises errors before patching anything)
+
+        _new_b = XC.get_xml_cache().parse(_watch["path"]).getroot()
+
+        self._cast_root_element(_new_b)
+
+        _new_p = copy.deepcopy(_new_b)
+
+        # current XML tree
+
+        _old_p = _watch["tree"]
+
+        _old_b = self.get_xml_tree().getroot()
+
+        _tk_parent = self.__built.get(_old_b, (self.tk_owner, ))[0]
+
+        _stats = dict(reconfigured = 0, rebuilt = 0)
+
+        # new tree becomes current one
+
+        self.set_xml_tree(element = _new_b)
+
+        # root element unchanged?
+
+        if self._xml_same_element(_old_p, _new_p):
+
+            self.__built[_new_b] = self.__built.pop(_old_b, (_tk_parent, []))
+
+            self._xml_patch_children(
+
+                (_old_p, _old_b), (_new_p, _new_b), _tk_parent, _stats
+            )
+
+        # rebuild all
+
+        else:
+
+            self._xml_unbuild(_old_b)
+
+            self._build_element(_new_b, _tk_parent)
+
+            _stats["rebuilt"] += 1
+
+        # end if
+
+        # flush all deferred actions in queue
+
+        self._flush_deferred()
+
+        _watch["tree"] = _new_p
+
+        return _stats
+
+    # end def
+
+
+
+    def xml_unwatch (self):
+        r"""
+            switches XML watch mode OFF (see xml_watch());
+
+            built widgets remain untouched;
+
+            no return value (void);
+        """
+
+        # watching?
+
+        if self.__watch is not None:
+
+            try:
+
+                self.tk_owner.after_cancel(self.__watch["after_id"])
+
+            except TK.TclError:
+
+                pass
+
+            # end try
+
+        # end if
+
+        self.__watch = None
+
+        self.__built = None
+
+    # end def
+
+
+
+    def xml_watch (self, filename = None, interval = None,
+    silent_mode = False):
+        r"""
+            builds widgets along XML @filename in watch mode, i.e.
+            XML file gets polled for modifications every @interval
+            milliseconds (default: self.WATCH_INTERVAL) and built
+            widgets get patched along file changes (see
+            xml_reload());
+
+            @filename param can either be a filename radix to be
+            automagically rebuilt or a complete file path (path),
+            but *NOT* an XML source string of chars;
+
+            this is a development tool for tuning layouts: XML
+            elements get interpreted (no AOT generated module) and
+            included XML files are not watched;
+
+            call xml_unwatch() to switch watch mode OFF;
+
+            returns True on overall success, False, otherwise;
+        """
+
+        # param controls
+
+        if self.is_xml(filename):
+
+            raise TypeError(
+
+                _("XML watch mode only supports XML files.")
+            )
+
+        # end if
+
+        # reset watch mode
+
+        self.xml_unwatch()
+
+        _path = self.get_xml_path(filename)
+
+        self.__built = dict()
+
+        self.__watch = dict(
+
+            path = _path,
+
+            mtime = os.stat(_path).st_mtime_ns,
+
+            interval = tools.choose_num(
+
+                lambda n: n > 0, interval, self.WATCH_INTERVAL
+            ),
+
+            after_id = None,
+
+            tree = None,
+        )
+
+        # keep a pristine copy of XML tree (building alters it)
+
+        self.xml_load(_path)
+
+        self.__watch["tree"] = copy.deepcopy(self.get_xml_tree().getroot())
+
+        # build widgets
+
+        _build_ok = self.xml_build(silent_mode = silent_mode)
+
+        # start polling
+
+        self.__watch["after_id"] = self.tk_owner.after(
+
+            self.__watch["interval"], self._xml_watch_poll
+        )
+
+        return _build_ok
+
+    # end def
+
+
 # end class RADXMLWidget
@@ -26,10 +26,18 @@
 
 # lib imports
 
+import builtins
+
+import functools
+
 import re
 
+import weakref
+
 import tkinter as TK
 
+from tkinter import font as TKF
+
 from ..core import tools
 
 from . import rad_xml_base as RX
@@ -75,6 +83,56 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
+    # plain dotted names e.g. "quit" or "module.function"
+    # see _lookup_global_command()
+
+    DOTTED_NAME = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*\Z")
+
+
+
+    # command strings stripped of erroneous parenthesis
+    # i.e. {command: stripped_command} shared by all classes
+    # see _resolve_command()
+
+    _command_names = dict()
+
+
+
+    # process-wide tables of parsed attribute values
+    # i.e. {raw_font: spec} and {(raw_value, default, values): value}
+    # see clear_value_cache()
+
+    _font_specs = dict()
+
+    _fixed_values = dict()
+
+    # per tkinter interpreter table of shared named fonts
+    # i.e. {tk_root: {spec: font}}
+    # shared fonts are READ-ONLY (see get_font())
+    # see _get_root_table()
+
+    _fonts = weakref.WeakKeyDictionary()
+
+
+
+    def __init__ (self, tk_owner = None, **kw):
+        r"""
+            class constructor;
+        """
+
+        # resolved command callbacks
+        # i.e. {(owner, command): callable}
+
+        self.__commands = dict()
+
+        # super class inits
+
+        RX.RADXMLBase.__init__(self, tk_owner, **kw)
+
+    # end def
+
+
+
     # ------------------  XML elements building  -----------------------
 
 
@@ -110,6 +168,8 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
             selects values along fixed list of values;
 
+            values are selected only once per raw attribute value;
+
             no return value (void);
         """
 
@@ -119,13 +179,27 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
             # inits
 
-            _value = attribute.value.lower()
+            _key = (attribute.value, default, values)
 
-            if _value not in values:
+            try:
 
-                _value = default
+                _value = self._fixed_values[_key]
 
-            # end if
+            except KeyError:
+
+                _value = attribute.value.lower()
+
+                if _value not in values:
+
+                    _value = default
+
+                # end if
+
+                # keep it for further calls
+
+                self._fixed_values[_key] = _value
+
+            # end try
 
             # parsed attribute inits
 
@@ -143,6 +217,292 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
 
 
+    def _get_command (self, command, **kw):
+        r"""
+            parses @command string for many supports;
+
+            supports event names (starting with '@');
+
+            supports method names (starting with '^' or '.');
+
+            supports global function names;
+
+            @kw keywords are passed along to command callback;
+
+            returns command callback (callable) on success;
+        """
+
+        # shared callable for this command target
+
+        _cmd = self._resolve_command(command)
+
+        # no extra keywords: no need for a wrapper
+
+        if not kw:
+
+            return _cmd
+
+        # end if
+
+        # bind keywords once and for all
+
+        return functools.partial(_cmd, **kw)
+
+    # end def
+
+
+
+    def _lookup_global_command (self, name):
+        r"""
+            resolves a global command @name such as "quit" or
+            "module.function" by explicit dotted-name lookup into
+            this module's globals, then into builtins;
+
+            falls back to eval() for anything else than a plain
+            dotted name (e.g. lambda expressions);
+
+            raises NameError or AttributeError just like eval() would;
+
+            returns resolved object;
+        """
+
+        # not a plain dotted name?
+
+        if not self.DOTTED_NAME.match(name):
+
+            # pray for value being a global method!
+
+            return eval(name)
+
+        # end if
+
+        # inits
+
+        _names = name.split(".")
+
+        _first = _names[0]
+
+        _globals = globals()
+
+        if _first in _globals:
+
+            _object = _globals[_first]
+
+        elif hasattr(builtins, _first):
+
+            _object = getattr(builtins, _first)
+
+        else:
+
+            raise NameError(
+
+                "name {!r} is not defined".format(_first)
+            )
+
+        # end if
+
+        # dotted path walk-through
+
+        for _name in _names[1:]:
+
+            _object = getattr(_object, _name)
+
+        # end for
+
+        return _object
+
+    # end def
+
+
+
+    def _resolve_command (self, command):
+        r"""
+            resolves @command string into a callable target;
+
+            resolution occurs only once per (owner, command) pair,
+            so that widgets sharing the same command string also share
+            the same callable object;
+
+            raises AttributeError if owner has no such method;
+
+            returns callable target;
+        """
+
+        # strip erroneous parenthesis
+        # and args in command string
+        # e.g. "slot_move(3)" --> "slot_move"
+        # (once per command string for all classes)
+
+        try:
+
+            _cmd = self._command_names[command]
+
+        except KeyError:
+
+            _cmd = self._command_names.setdefault(
+
+                command, re.sub(r"\(.*\)", r"", command)
+            )
+
+        # end try
+
+        # command owner inits
+
+        _prefix = _cmd[:1]
+
+        if _prefix == "@":
+
+            _owner = self.events
+
+        elif _prefix == "^" and hasattr(self, "app"):
+
+            _owner = self.app
+
+        elif _prefix == "." and hasattr(self, "slot_owner"):
+
+            _owner = self.slot_owner
+
+        else:
+
+            _prefix, _owner = "", None
+
+        # end if
+
+        _key = (_owner, _cmd)
+
+        # already resolved for this owner?
+
+        try:
+
+            return self.__commands[_key]
+
+        except KeyError:
+
+            pass
+
+        # end try
+
+        # events mechanism support
+
+        if _prefix == "@":
+
+            # e.g. "@EventName" --> raise_event("EventName")
+
+            _callback = functools.partial(_owner.raise_event, _cmd[1:])
+
+        # global methods support
+
+        elif not _prefix:
+
+            _callback = self._lookup_global_command(_cmd)
+
+        # self.app methods support
+
+        elif _prefix == "^":
+
+            # reset value
+
+            _cmd = _cmd.lstrip("^.@")
+
+            if hasattr(_owner, _cmd):
+
+                # e.g. "^quit" --> self.app.quit
+
+                _callback = getattr(_owner, _cmd)
+
+            else:
+
+                raise AttributeError(
+                    _(
+                        "In widget '{widget}': "
+                        "cannot link command '{cmd}' to "
+                        "'{app}' (self.app) "
+                        "- bad XML attribute "
+                        "or incorrect self.app"
+
+                    ).format(
+
+                        widget=repr(self),
+
+                        cmd=_cmd,
+
+                        app=repr(_owner),
+                    )
+                )
+
+            # end if
+
+        # self.slot_owner methods support
+
+        else:
+
+            # reset value
+
+            _cmd = _cmd.lstrip(".^@")
+
+            if hasattr(_owner, _cmd):
+
+                # e.g. ".quit" --> self.slot_owner.quit
+
+                _callback = getattr(_owner, _cmd)
+
+            else:
+
+                raise AttributeError(
+                    _(
+                        "In widget '{widget}': "
+                        "cannot link command '{cmd}' to "
+                        "'{owner}' (self.slot_owner) "
+                        "- bad XML attribute "
+                        "or incorrect owner"
+
+                    ).format(
+
+                        widget=repr(self),
+
+                        cmd=_cmd,
+
+                        owner=repr(_owner),
+                    )
+                )
+
+            # end if
+
+        # end if
+
+        # keep it for further calls
+
+        self.__commands[_key] = _callback
+
+        return _callback
+
+    # end def
+
+
+
+    def _get_underlined_label (self, label):
+        r"""
+            menu label underline support (e.g. "_File");
+
+            returns (label, underline) pair where underline is the
+            position of the first '_' char in @label (or -1 if none)
+            and label has this '_' char removed;
+        """
+
+        _pos = label.find("_")
+
+        if _pos >= 0:
+
+            return (label[:_pos] + label[_pos+1:], _pos)
+
+        # end if
+
+        return (label, -1)
+
+    # end def
+
+
+
     def _is_new (self, attribute):
         r"""
             protected method def;
@@ -885,137 +1245,9 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
         if self._is_new(attribute):
 
-            # strip erroneous parenthesis
-            # and args in command string
-            # e.g. "slot_move(3)" --> "slot_move"
-
-            _cmd = re.sub(r"\(.*\)", r"", attribute.value)
-
-            # events maechanism support
-
-            if _cmd.startswith("@"):
-
-                # e.g. "@EventName" --> raise_event("EventName")
-
-                _cmd = (
-
-                    lambda *args, _e=_cmd[1:], _s=self.events, kw=kw:
-
-                        _s.raise_event(_e, *args, **kw)
-                )
-
-            # self.app methods support
-
-            elif _cmd.startswith("^") and hasattr(self, "app"):
-
-                # reset value
-
-                _cmd = _cmd.lstrip("^.@")
-
-                if hasattr(self.app, _cmd):
-
-                    # e.g. "^quit" --> self.app.quit
-
-                    _cmd = (
-
-                        lambda  *args,
-                                _cb=getattr(self.app, _cmd),
-                                kw=kw:
-
-                            _cb(*args, **kw)
-                    )
-
-                else:
-
-                    raise AttributeError(
-                        _(
-                            "In widget '{widget}': "
-                            "cannot link command '{cmd}' to "
-                            "'{app}' (self.app) "
-                            "- bad XML attribute "
-                            "or incorrect self.app"
-
-                        ).format(
-
-                            widget=repr(self),
-
-                            cmd=_cmd,
-
-                            app=repr(self.app),
-                        )
-                    )
-
-                    # cancel command
-
-                    _cmd = None
-
-                # end if
-
-            # self.slot_owner methods support
-
-            elif _cmd.startswith(".") and hasattr(self, "slot_owner"):
-
-                # reset value
-
-                _cmd = _cmd.lstrip(".^@")
-
-                if hasattr(self.slot_owner, _cmd):
-
-                    # e.g. ".quit" --> self.slot_owner.quit
-
-                    _cmd = (
-
-                        lambda  *args,
-                                _cb=getattr(self.slot_owner, _cmd),
-                                kw=kw:
-
-                            _cb(*args, **kw)
-                    )
-
-                else:
-
-                    raise AttributeError(
-                        _(
-                            "In widget '{widget}': "
-                            "cannot link command '{cmd}' to "
-                            "'{owner}' (self.slot_owner) "
-                            "- bad XML attribute "
-                            "or incorrect owner"
-
-                        ).format(
-
-                            widget=repr(self),
-
-                            cmd=_cmd,
-
-                            owner=repr(self.slot_owner),
-                        )
-                    )
-
-                    # cancel command
-
-                    _cmd = None
-
-                # end if
-
-            # global methods support
-
-            else:
-
-                # pray for value being a global method!
-
-                _cmd = (
-
-                    lambda *args, _cb=eval(_cmd), kw=kw:
-
-                        _cb(*args, **kw)
-                )
-
-            # end if
-
             # parsed attribute inits
 
-            attribute.value = _cmd
+            attribute.value = self._get_command(attribute.value, **kw)
 
             self._tk_config(attribute, **kw)
 
@@ -1085,6 +1317,10 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
             @italic is either 'italic' string or '' (optional value);
 
+            widgets get a shared named font (see get_font()):
+            widget.cget("font") returns the font's name e.g. "font1",
+            not the XML font spec;
+
             no return value (void);
         """
 
@@ -1092,34 +1328,10 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
         if self._is_new(attribute):
 
-            # inits
-
-            _font = attribute.value
-
-            # catches 'quoted long names'
-
-            _sch = re.compile(r"'(.*?)'")
-
-            _family = _sch.search(_font)
-
-            # resets font family name to tkinter-compliant font name
-
-            # e.g. "'Times New Roman'" ---> "timesnewroman"
-
-            if _family:
-
-                _font = _sch.sub(
-
-                    tools.normalize_id(_family.group(1)).lower(),
-
-                    _font
-                )
-
-            # end if
-
             # parsed attribute inits
+            # shared named font
 
-            attribute.value = _font
+            attribute.value = self.get_font(attribute.value)
 
             self._tk_config(attribute, **kw)
 
@@ -1209,21 +1421,8 @@ class RADXMLWidgetBase (RX.RADXMLBase):
 
                 # menu label underline support (e.g. "_File")
 
-                _attr_underline.value = -1
-
-                _pos = _label.find("_")
-
-                if _pos >= 0:
-
-                    # set attribute value
-
-                    _attr_underline.value = _pos
-
-                    # update label
-
-                    _label = _label[:_pos] + _label[_pos+1:]
-
-                # end if
+                _label, _attr_underline.value = \
+                                        self._get_underlined_label(_label)
 
                 # parsed attribute inits
 
@@ -1406,4 +1605,181 @@ class RADXMLWidgetBase (RX.RADXMLBase):
     # end def
 
 
+
+    def clear_command_cache (self):
+        r"""
+            forgets all resolved command callbacks e.g. after
+            self.app or self.slot_owner methods have been redefined;
+
+            no return value (void);
+        """
+
+        self.__commands.clear()
+
+    # end def
+
+
+
+    def clear_value_cache (self):
+        r"""
+            forgets all application-wide parsed attribute values
+            (font specs, shared fonts, fixed values, resolved paths,
+            shared images) e.g. on theme switching;
+
+            no return value (void);
+        """
+
+        self._font_specs.clear()
+
+        self._get_root_table(self._fonts).clear()
+
+        self._fixed_values.clear()
+
+        # super class clearing
+
+        RX.RADXMLBase.clear_value_cache(self)
+
+    # end def
+
+
+
+    def get_font (self, font):
+        r"""
+            retrieves a tkinter.font.Font named font object along
+            @font XML attribute value (see _tkRAD_font_support());
+
+            named fonts are shared application-wide: a same font
+            specification gets parsed and created only once per
+            tkinter interpreter;
+
+            shared named fonts are READ-ONLY: font.configure() would
+            change every widget of every builder using that same
+            spec; to change a single widget's font, configure it
+            with a font.copy() or with a new tkinter.font.Font;
+
+            existing named fonts (e.g. "TkDefaultFont") are kept
+            as is;
+
+            returns named font or @font as is if not a font spec;
+        """
+
+        # param controls
+
+        if not tools.is_pstr(font):
+
+            return font
+
+        # end if
+
+        # normalized font spec
+
+        _spec = self.get_font_spec(font)
+
+        # inits
+
+        _root = self._get_tk_root()
+
+        _fonts = self._get_root_table(self._fonts)
+
+        # already created?
+
+        try:
+
+            return _fonts[_spec]
+
+        except KeyError:
+
+            pass
+
+        # end try
+
+        # no tkinter root yet: plain font spec
+
+        if _root is None:
+
+            return _spec
+
+        # end if
+
+        # existing named font?
+
+        if _spec in _root.tk.splitlist(_root.tk.call("font", "names")):
+
+            _font = _spec
+
+        # new named font
+
+        else:
+
+            _font = TKF.Font(root = _root, font = _spec)
+
+        # end if
+
+        # keep it for further calls
+
+        _fonts[_spec] = _font
+
+        return _font
+
+    # end def
+
+
+
+    def get_font_spec (self, font):
+        r"""
+            resets @font XML attribute value to a tkinter-compliant
+            font spec (see _tkRAD_font_support());
+
+            specs are computed only once per raw @font value;
+
+            returns font spec;
+        """
+
+        # already computed?
+
+        try:
+
+            return self._font_specs[font]
+
+        except KeyError:
+
+            pass
+
+        # end try
+
+        # inits
+
+        _font = font
+
+        # catches 'quoted long names'
+
+        _sch = re.compile(r"'(.*?)'")
+
+        _family = _sch.search(_font)
+
+        # resets font family name to tkinter-compliant font name
+
+        # e.g. "'Times New Roman'" ---> "timesnewroman"
+
+        if _family:
+
+            _font = _sch.sub(
+
+                tools.normalize_id(_family.group(1)).lower(),
+
+                _font
+            )
+
+        # end if
+
+        # keep it for further calls
+
+        self._font_specs[font] = _font
+
+        return _font
+
+    # end def
+
+
 # end class RADXMLWidgetBase
+